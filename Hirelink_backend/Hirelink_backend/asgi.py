@@ -14,3 +14,8 @@ from django.core.asgi import get_asgi_application
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'Hirelink_backend.settings')
 
 application = get_asgi_application()
+
+# Serving processes only: migrate, check and other commands never load this module
+from ai_resume.registry import warmup_on_startup  # noqa: E402
+
+warmup_on_startup()
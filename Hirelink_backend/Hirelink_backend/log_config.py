@@ -0,0 +1,78 @@
+"""
+Structured, sampled logging for HireLink (wired up by LOGGING in settings.py)
+
+- StructuredFormatter writes one JSON object per record, including the
+  fields passed with extra={...}
+- SamplingFilter keeps only a fraction of the low-level records of chosen
+  loggers; warnings and errors always pass
+
+Call sites use %-style arguments (logger.debug("... %s", value)), so a record
+below the logger's level is dropped before its message is ever formatted.
+Guard anything costly to compute with logger.isEnabledFor(...).
+"""
+import itertools
+import json
+import logging
+import threading
+from datetime import datetime, timezone
+
+# Attributes every LogRecord has; anything else came from extra={...}
+_RECORD_ATTRIBUTES = frozenset(vars(logging.LogRecord('', 0, '', 0, '', None, None))) | {'message', 'asctime'}
+
+
+class StructuredFormatter(logging.Formatter):
+    """One JSON line per record: time, level, logger, message, extra fields, exception"""
+
+    def format(self, record):
+        entry = {
+            'time': datetime.fromtimestamp(record.created, timezone.utc).isoformat(timespec='milliseconds'),
+            'level': record.levelname,
+            'logger': record.name,
+            'message': record.getMessage(),
+        }
+        for key, value in vars(record).items():
+            if key not in _RECORD_ATTRIBUTES and not key.startswith('_'):
+                entry[key] = value
+        if record.exc_info:
+            entry['exception'] = self.formatException(record.exc_info)
+        return json.dumps(entry, default=str, ensure_ascii=False)
+
+
+class SamplingFilter(logging.Filter):
+    """
+    Keep one record out of every 1/rate for loggers listed in rates (prefix match,
+    longest wins, like logger names). Records above max_level always pass.
+    """
+
+    def __init__(self, rates=None, max_level='INFO'):
+        super().__init__()
+        self.rates = dict(rates or {})
+        self.max_level = logging.getLevelName(max_level) if isinstance(max_level, str) else max_level
+        self._intervals = {}
+        self._counters = {}
+        self._lock = threading.Lock()
+
+    def _interval(self, name):
+        interval = self._intervals.get(name)
+        if interval is None:
+            rate = 1.0
+            for prefix in sorted(self.rates, key=len, reverse=True):
+                if name == prefix or name.startswith(prefix + '.'):
+                    rate = self.rates[prefix]
+                    break
+            interval = 0 if rate <= 0 else max(1, round(1 / rate))
+            with self._lock:
+                self._intervals[name] = interval
+                self._counters.setdefault(name, itertools.count())
+        return interval
+
+    def filter(self, record):
+        if record.levelno > self.max_level:
+            return True
+        interval = self._interval(record.name)
+        if interval == 1:
+            return True
+        if interval == 0:
+            return False
+        # Deterministic: every interval-th record, thread-safe without a lock
+        return next(self._counters[record.name]) % interval == 0
@@ -166,3 +166,95 @@ REST_FRAMEWORK = {
 }
 
 FRONTEND_URL = "http://localhost:3000"
+
+# ============ AI MATCHER SERVICE ============
+# Unix socket path or "127.0.0.1:8765" served by `manage.py run_matcher_service`.
+# Leave empty to keep the matcher in each web worker.
+AI_MATCHER_SERVICE_ADDRESS = os.getenv('AI_MATCHER_SERVICE_ADDRESS', '')
+AI_MATCHER_SERVICE_TIMEOUT = 2.0  # seconds
+AI_MATCHER_SERVICE_POOL_SIZE = 4
+
+# Split the matcher index into shards searched in parallel (1 = single index).
+# AI_MATCHER_SHARD_BY: 'hash' (job id), 'job_type' or 'location'
+AI_MATCHER_SHARDS = 1
+AI_MATCHER_SHARD_BY = 'hash'
+
+# Paginated recommendations: ranked jobs kept per candidate and model version
+AI_RECOMMENDATIONS_MAX_RANKED = 500
+AI_RECOMMENDATIONS_CACHE_TIMEOUT = 60 * 60  # seconds
+
+# ============ RESUME ATS ============
+# Analyses kept in memory per worker (all of them are also stored in the DB)
+ATS_CACHE_MAX_ENTRIES = 256
+# Resume sections whose analysis facts are kept per worker, so an edited resume
+# only has its changed sections re-parsed (0 = always parse the whole resume)
+ATS_SECTION_CACHE_SIZE = 2048
+# Build the resume analyzers in the background when a web process starts (wsgi.py / asgi.py);
+# management commands build them on first use
+ATS_WARMUP_ON_STARTUP = True
+# Trained quality/ATS models (rule-based scoring is used when they are missing)
+RESUME_MODELS_DIR = BASE_DIR / 'ml_models' / 'trained_models'
+RESUME_LABEL_ENCODER_PATH = BASE_DIR / 'ml_models' / 'label_encoder.pkl'
+# Resumes per vectorize/predict call
+RESUME_MODEL_BATCH_SIZE = 256
+# Queue every uploaded file for `manage.py run_ats_worker` (clients can also send async=true)
+ATS_ASYNC_FILE_UPLOADS = False
+# Longest wait accepted by GET /api/ats-analyze/tasks/<id>/?wait=N
+ATS_TASK_LONG_POLL_MAX = 30  # seconds
+# Uploaded files are parsed in pre-forked worker processes with CPU time and memory
+# limits, so a hostile PDF/DOCX cannot stall or bloat the web worker (0 = parse in-process)
+ATS_EXTRACTION_WORKERS = 2
+ATS_EXTRACTION_CPU_LIMIT = 10  # CPU seconds per file (PDFs stop early at ResumeFileProcessor.PDF_CPU_BUDGET)
+ATS_EXTRACTION_MEMORY_LIMIT_MB = 1024  # address space per worker process
+ATS_EXTRACTION_TIMEOUT = 20  # seconds per file, and the longest wait for a free worker
+ATS_EXTRACTION_MAX_JOBS = 200  # files parsed by a worker process before it is replaced
+
+# ============ JOB ALERTS ============
+# New jobs are recorded in PendingJobAlert and fanned out to matching candidates by a
+# background thread of the web process that saved them. False leaves every fan-out to
+# `manage.py send_job_alerts --pending` (run it from cron), away from the web workers.
+JOB_ALERTS_IN_PROCESS = True
+
+# ============ LOGGING ============
+# LOG_LEVEL=DEBUG traces every step of the request paths; LOG_FORMAT=plain for human-readable lines
+LOG_LEVEL = os.getenv('LOG_LEVEL', 'INFO')
+LOG_FORMAT = os.getenv('LOG_FORMAT', 'structured')
+# Fraction of DEBUG/INFO records kept per logger (warnings and errors are never sampled)
+LOG_SAMPLING_RATES = {
+    'services.resume_analyser': 0.1,
+    'users': 0.1,
+}
+
+LOGGING = {
+    'version': 1,
+    'disable_existing_loggers': False,
+    'formatters': {
+        'structured': {
+            '()': 'Hirelink_backend.log_config.StructuredFormatter',
+        },
+        'plain': {
+            'format': '%(asctime)s %(levelname)s %(name)s: %(message)s',
+        },
+    },
+    'filters': {
+        'sampling': {
+            '()': 'Hirelink_backend.log_config.SamplingFilter',
+            'rates': LOG_SAMPLING_RATES,
+        },
+    },
+    'handlers': {
+        'console': {
+            'class': 'logging.StreamHandler',
+            'formatter': LOG_FORMAT,
+            'filters': ['sampling'],
+        },
+    },
+    'root': {
+        'handlers': ['console'],
+        'level': 'WARNING',
+    },
+    'loggers': {
+        name: {'level': LOG_LEVEL}
+        for name in ['jobs', 'users', 'applications', 'recruiter', 'ai_resume', 'api', 'services']
+    },
+}
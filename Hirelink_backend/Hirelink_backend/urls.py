@@ -5,7 +5,9 @@ from django.conf import settings
 from django.conf.urls.static import static
 from django.http import HttpResponse
 
-from api.views.resume_ats_views import ResumeATSAnalyzeView
+from api.views.resume_ats_views import (
+    ResumeATSAnalyzeView, ResumeATSBatchView, ResumeATSReadyView, ResumeATSTaskView
+)
 
 
 def home(request):
@@ -28,6 +30,10 @@ urlpatterns = [
     path("api/", include("recruiter.urls")),
 
     path("api/ats-analyze/", ResumeATSAnalyzeView.as_view(), name="ats-analyze"),
+    path("api/ats-analyze/batch/", ResumeATSBatchView.as_view(), name="ats-analyze-batch"),
+    path("api/ats-analyze/ready/", ResumeATSReadyView.as_view(), name="ats-analyze-ready"),
+    path("api/ats-analyze/tasks/", ResumeATSTaskView.as_view(), name="ats-analyze-queue"),
+    path("api/ats-analyze/tasks/<uuid:task_id>/", ResumeATSTaskView.as_view(), name="ats-analyze-task"),
 ]
 
 if settings.DEBUG:
@@ -1,3 +1,27 @@
 from django.contrib import admin
+from .models import ExtractedText, ResumeAnalysisCache, ResumeAnalysisTask
 
-# Register your models here.
+
+@admin.register(ResumeAnalysisCache)
+class ResumeAnalysisCacheAdmin(admin.ModelAdmin):
+    list_display = ['key_type', 'digest', 'analyzer_version', 'hit_count', 'created_at', 'last_hit_at']
+    list_filter = ['key_type', 'analyzer_version']
+    search_fields = ['digest']
+    readonly_fields = ['result', 'file_metadata']
+
+
+@admin.register(ResumeAnalysisTask)
+class ResumeAnalysisTaskAdmin(admin.ModelAdmin):
+    list_display = ['id', 'status', 'mode', 'filename', 'user', 'attempts', 'worker', 'created_at', 'finished_at']
+    list_filter = ['status']
+    search_fields = ['id', 'filename']
+    readonly_fields = ['result', 'file_metadata', 'error']
+
+
+@admin.register(ExtractedText)
+class ExtractedTextAdmin(admin.ModelAdmin):
+    list_display = ['digest', 'extractor_version', 'char_count', 'extract_time_ms', 'created_at']
+    list_filter = ['extractor_version']
+    search_fields = ['digest']
+    exclude = ['compressed_text']
+    readonly_fields = ['file_metadata']
@@ -0,0 +1,138 @@
+# ai_resume/cache.py - Two-level cache for resume analysis results
+"""
+Re-uploading the same resume should not redo text extraction and analysis.
+Results are looked up by SHA-256 of the raw file bytes (skips extraction too)
+or of the normalized text, first in a per-process LRU, then in the
+ResumeAnalysisCache table shared by every worker. Keys include the analyzer
+version, so changing the rules makes old entries miss.
+"""
+import copy
+import hashlib
+import logging
+import threading
+from collections import OrderedDict
+
+from django.conf import settings
+from django.db import DatabaseError
+from django.db.models import F
+from django.utils import timezone
+
+from .models import ResumeAnalysisCache
+
+logger = logging.getLogger(__name__)
+
+
+def sha256_hex(data):
+    return hashlib.sha256(data).hexdigest()
+
+
+def normalize_resume_text(text):
+    """Line endings and surrounding whitespace only: anything else can change the analysis"""
+    return text.replace('\r\n', '\n').replace('\r', '\n').strip()
+
+
+class AnalysisCache:
+    """In-process LRU in front of the ResumeAnalysisCache table, with hit/miss counters"""
+
+    def __init__(self, max_entries=256):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.stats = {'memory_hits': 0, 'db_hits': 0, 'misses': 0, 'stores': 0, 'db_errors': 0}
+
+    def _count(self, name):
+        with self._lock:
+            self.stats[name] += 1
+
+    def _remember(self, key, entry):
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def get(self, key_type, digest, analyzer_version):
+        """(result, file_metadata) copies for the key, or None on a miss"""
+        key = (key_type, digest, analyzer_version)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self.stats['memory_hits'] += 1
+                return copy.deepcopy(entry)
+
+        try:
+            rows = ResumeAnalysisCache.objects.filter(
+                key_type=key_type, digest=digest, analyzer_version=analyzer_version
+            )
+            row = rows.only('result', 'file_metadata').first()
+            if row is not None:
+                rows.update(hit_count=F('hit_count') + 1, last_hit_at=timezone.now())
+        except DatabaseError as e:
+            logger.warning("Resume analysis cache lookup failed: %s", e)
+            self._count('db_errors')
+            row = None
+
+        if row is None:
+            self._count('misses')
+            return None
+
+        entry = (row.result, row.file_metadata)
+        self._remember(key, entry)
+        self._count('db_hits')
+        return copy.deepcopy(entry)
+
+    def set(self, key_type, digest, analyzer_version, result, file_metadata=None):
+        entry = copy.deepcopy((result, file_metadata))
+        self._remember((key_type, digest, analyzer_version), entry)
+        self._count('stores')
+
+        try:
+            ResumeAnalysisCache.objects.update_or_create(
+                key_type=key_type, digest=digest, analyzer_version=analyzer_version,
+                defaults={'result': entry[0], 'file_metadata': entry[1]}
+            )
+        except DatabaseError as e:
+            logger.warning("Resume analysis cache store failed: %s", e)
+            self._count('db_errors')
+
+    def clear(self):
+        """Drop the in-process entries (the table is left alone)"""
+        with self._lock:
+            self._entries.clear()
+
+    def summary(self):
+        with self._lock:
+            stats = dict(self.stats)
+            stats['memory_entries'] = len(self._entries)
+        lookups = stats['memory_hits'] + stats['db_hits'] + stats['misses']
+        stats['hit_rate'] = round((stats['memory_hits'] + stats['db_hits']) / lookups, 3) if lookups else None
+        return stats
+
+
+# Global instance
+analysis_cache = AnalysisCache(max_entries=getattr(settings, 'ATS_CACHE_MAX_ENTRIES', 256))
+
+
+def analyze_text_cached(builder, resume_text, job=None, mode='full'):
+    """
+    builder.analyze_resume, served from the cache when the same text was analyzed before
+    in the same mode. The job match is added after caching: it is cheap and the cached
+    analysis stays job-independent.
+    """
+    resume_text = normalize_resume_text(resume_text)
+    text_digest = sha256_hex(resume_text.encode('utf-8'))
+    version = builder.cache_version(mode)
+
+    cached = analysis_cache.get('text', text_digest, version)
+    if cached is not None:
+        analysis_result, _ = cached
+        analysis_result['metadata']['cached'] = True
+    else:
+        analysis_result = builder.analyze_resume(resume_text, mode=mode)
+        if analysis_result['success']:
+            analysis_cache.set('text', text_digest, version, analysis_result)
+
+    if job is not None and analysis_result['success']:
+        builder.add_job_match(analysis_result, resume_text, job)
+    return analysis_result
@@ -0,0 +1,188 @@
+# ai_resume/corpus.py - Offline scoring of resume datasets (CSV / NDJSON)
+"""
+A corpus is read row by row and cut into fixed-size chunks; each chunk is
+scored by a BatchATSAnalyzer in a worker process and saved as one .npz file
+in a checkpoint directory. Chunks already saved are skipped, so an
+interrupted run continues where it stopped. The chunks are finally joined
+into one columnar file (.parquet, or .npz when pyarrow is not installed).
+"""
+import csv
+import json
+import os
+import shutil
+import sys
+import time
+
+import numpy as np
+
+from services.batch_analyser import BatchATSAnalyzer
+from services.resume_analyser import ResumeATSBuilder, ResumeFeatures
+
+# Tried in order when no text column is given
+TEXT_COLUMNS = ['Resume', 'resume_text', 'text', 'cleaned_text']
+
+RESULT_COLUMNS = [
+    'row', 'id', 'success', 'error', 'quality_score', 'grade', 'ats_compatible', 'ats_confidence'
+] + list(ResumeFeatures.__slots__)
+
+OUTPUT_FORMATS = ['.parquet', '.npz']
+
+
+def _open_rows(path):
+    """Dict per record of a .csv or .ndjson/.jsonl file"""
+    extension = os.path.splitext(path)[1].lower()
+    with open(path, encoding='utf-8', newline='') as corpus_file:
+        if extension == '.csv':
+            csv.field_size_limit(min(sys.maxsize, 2 ** 31 - 1))  # resumes are long
+            yield from csv.DictReader(corpus_file)
+        elif extension in ['.ndjson', '.jsonl']:
+            for line in corpus_file:
+                if line.strip():
+                    yield json.loads(line)
+        else:
+            raise ValueError(f"Unsupported corpus format {extension or path!r} (use .csv, .ndjson or .jsonl)")
+
+
+def iter_corpus(path, text_column=None, id_column=None):
+    """(row, id, text) per record; the text column is detected from TEXT_COLUMNS when not given"""
+    for row, record in enumerate(_open_rows(path)):
+        if text_column is None:
+            text_column = next((column for column in TEXT_COLUMNS if column in record), None)
+            if text_column is None:
+                raise ValueError(f"No resume text column found (tried {', '.join(TEXT_COLUMNS)}); pass --text-column")
+        if text_column not in record:
+            raise ValueError(f"Row {row} has no {text_column!r} column")
+        record_id = record.get(id_column) if id_column else row
+        yield row, str(record_id if record_id is not None else ''), record[text_column] or ''
+
+
+def iter_chunks(records, chunk_size):
+    """(chunk_index, [records]) of chunk_size records each (the last may be shorter)"""
+    chunk = []
+    index = 0
+    for record in records:
+        chunk.append(record)
+        if len(chunk) == chunk_size:
+            yield index, chunk
+            chunk = []
+            index += 1
+    if chunk:
+        yield index, chunk
+
+
+# One analyzer per worker process, built by init_worker
+_analyzer = None
+
+
+def init_worker():
+    global _analyzer
+    _analyzer = BatchATSAnalyzer(ResumeATSBuilder())
+
+
+def score_chunk(chunk_index, records):
+    """(chunk_index, columns, cpu_seconds) for one chunk of (row, id, text) records"""
+    if _analyzer is None:
+        init_worker()
+    cpu_start = time.process_time()
+    results = _analyzer.analyze([text for _, _, text in records])
+
+    columns = {name: [] for name in RESULT_COLUMNS}
+    for (row, record_id, _), result in zip(records, results):
+        success = result['success']
+        features = result.get('features', {})
+        columns['row'].append(row)
+        columns['id'].append(record_id)
+        columns['success'].append(success)
+        columns['error'].append('' if success else result.get('error', ''))
+        columns['quality_score'].append(result['quality_score'] if success else np.nan)
+        columns['grade'].append(result.get('grade', ''))
+        columns['ats_compatible'].append(bool(result.get('ats_compatible', False)))
+        columns['ats_confidence'].append(result['ats_confidence'] if success else np.nan)
+        for name in ResumeFeatures.__slots__:
+            columns[name].append(features.get(name, 0))
+
+    arrays = {
+        name: np.array(values, dtype=np.int64 if name in ResumeFeatures.__slots__ or name == 'row' else None)
+        for name, values in columns.items()
+    }
+    return chunk_index, arrays, time.process_time() - cpu_start
+
+
+class CorpusCheckpoint:
+    """
+    Directory of finished chunks (chunk-000042.npz) plus a manifest of the
+    run settings; a checkpoint is only resumed with the same settings.
+    """
+
+    def __init__(self, directory, manifest):
+        self.directory = directory
+        self.manifest = manifest
+        self.manifest_path = os.path.join(directory, 'manifest.json')
+
+    def open(self, restart=False):
+        """Chunk indexes already done; ValueError if the directory belongs to another run"""
+        if restart:
+            self.clear()
+        if os.path.exists(self.manifest_path):
+            with open(self.manifest_path, encoding='utf-8') as manifest_file:
+                saved = json.load(manifest_file)
+            if saved != self.manifest:
+                changed = sorted(key for key in set(saved) | set(self.manifest) if saved.get(key) != self.manifest.get(key))
+                raise ValueError(
+                    f"Checkpoint {self.directory} was made with different settings ({', '.join(changed)}); "
+                    f"rerun with --restart to discard it"
+                )
+        else:
+            os.makedirs(self.directory, exist_ok=True)
+            with open(self.manifest_path, 'w', encoding='utf-8') as manifest_file:
+                json.dump(self.manifest, manifest_file, indent=2)
+        return {index for index, _ in self._chunk_files()}
+
+    def _chunk_files(self):
+        for name in sorted(os.listdir(self.directory)):
+            if name.startswith('chunk-') and name.endswith('.npz'):
+                yield int(name[6:-4]), os.path.join(self.directory, name)
+
+    def save(self, chunk_index, columns):
+        # Written under a temporary name first, so a killed run never leaves half a chunk
+        path = os.path.join(self.directory, f'chunk-{chunk_index:06d}.npz')
+        with open(path + '.tmp', 'wb') as chunk_file:
+            np.savez(chunk_file, **columns)
+        os.replace(path + '.tmp', path)
+
+    def load(self):
+        """Every saved chunk joined in chunk order, column by column"""
+        parts = {name: [] for name in RESULT_COLUMNS}
+        for _, path in self._chunk_files():
+            with np.load(path) as chunk:
+                for name in RESULT_COLUMNS:
+                    parts[name].append(chunk[name])
+        return {name: np.concatenate(arrays) if arrays else np.array([]) for name, arrays in parts.items()}
+
+    def clear(self):
+        shutil.rmtree(self.directory, ignore_errors=True)
+
+
+def default_output_path(corpus_path):
+    try:
+        import pyarrow  # noqa: F401
+        extension = '.parquet'
+    except ImportError:
+        extension = '.npz'
+    return f"{os.path.splitext(corpus_path)[0]}.scores{extension}"
+
+
+def write_columns(columns, path):
+    """Columnar output: Parquet (needs pyarrow) or a compressed .npz of one array per column"""
+    extension = os.path.splitext(path)[1].lower()
+    if extension == '.parquet':
+        import pandas as pd
+        try:
+            pd.DataFrame(columns).to_parquet(path, index=False)
+        except ImportError as e:
+            raise ValueError(f"Writing Parquet needs pyarrow ({e}); use an .npz output instead") from e
+    elif extension == '.npz':
+        with open(path, 'wb') as output_file:
+            np.savez_compressed(output_file, **columns)
+    else:
+        raise ValueError(f"Unsupported output format {extension!r} (use {' or '.join(OUTPUT_FORMATS)})")
@@ -0,0 +1,109 @@
+# ai_resume/extracted_text.py - Extract each resume file once
+"""
+The same resume bytes reach the analyzers many times: the profile resume,
+every application it is attached to, re-uploads, batch scoring. Extracted
+text is stored in ExtractedText, keyed by the SHA-256 of the file bytes and
+the extractor version, so each distinct file is parsed once and every later
+consumer reads the stored (compressed) text instead.
+"""
+import logging
+import zlib
+
+from django.db import DatabaseError
+
+from services.file_processor import ResumeFileProcessor
+
+from .cache import sha256_hex
+from .models import ExtractedText
+from .registry import analyzers
+
+logger = logging.getLogger(__name__)
+
+
+def sandboxed_extract(item):
+    """(text, metadata) of a (filename, content) pair, parsed in the shared extraction sandbox"""
+    return analyzers.get('extractor').extract(item)
+
+
+def _stored_rows(digests):
+    """ExtractedText rows of the current extractor by digest ({} when the table is unavailable)"""
+    try:
+        rows = ExtractedText.objects.filter(
+            digest__in=set(digests), extractor_version=ResumeFileProcessor.EXTRACTOR_VERSION
+        )
+        return {row.digest: row for row in rows}
+    except DatabaseError as e:
+        logger.warning("Extracted text lookup failed: %s", e)
+        return {}
+
+
+def _from_row(row, filename):
+    file_metadata = dict(row.file_metadata or {})
+    file_metadata.update({'filename': filename, 'extraction_cached': True})
+    return zlib.decompress(row.compressed_text).decode('utf-8'), file_metadata
+
+
+def _storable(file_metadata):
+    """Only complete extractions: where a CPU-budget cut falls depends on the machine's load"""
+    return file_metadata['success'] and (file_metadata.get('pdf') or {}).get('truncated') != 'cpu_budget'
+
+
+def _store(extractions):
+    """Save (digest, text, file_metadata) extractions; rows another worker saved first are kept"""
+    rows = [
+        ExtractedText(
+            digest=digest,
+            extractor_version=ResumeFileProcessor.EXTRACTOR_VERSION,
+            compressed_text=zlib.compress(text.encode('utf-8')),
+            char_count=len(text),
+            file_metadata=file_metadata,
+            extract_time_ms=file_metadata.get('extract_time_ms') or 0
+        )
+        for digest, text, file_metadata in extractions
+        if _storable(file_metadata)
+    ]
+    if not rows:
+        return
+    try:
+        ExtractedText.objects.bulk_create(rows, ignore_conflicts=True)
+    except DatabaseError as e:
+        logger.warning("Extracted text store failed: %s", e)
+
+
+def extract_file_text(content, filename, extract=sandboxed_extract, digest=None):
+    """(text, file_metadata) of resume bytes; extract((filename, content)) only runs for a new file"""
+    digest = digest or sha256_hex(content)
+    row = _stored_rows([digest]).get(digest)
+    if row is not None:
+        return _from_row(row, filename)
+
+    text, file_metadata = extract((filename, content))
+    _store([(digest, text, file_metadata)])
+    return text, file_metadata
+
+
+def extract_file_texts(files, extractor=None):
+    """
+    extract_file_text for (filename, content) pairs, in input order: one lookup
+    for all of them, then the new files are extracted in parallel (each distinct
+    file once) by an ExtractionSandbox, the shared one by default
+    """
+    extractor = extractor or analyzers.get('extractor')
+    digests = [sha256_hex(content) for _, content in files]
+    rows = _stored_rows(digests)
+
+    missing = {}
+    for index, digest in enumerate(digests):
+        if digest not in rows:
+            missing.setdefault(digest, index)
+    extracted = dict(zip(missing, extractor.extract_many([files[index] for index in missing.values()])))
+    _store((digest, text, file_metadata) for digest, (text, file_metadata) in extracted.items())
+
+    results = []
+    for (filename, _), digest in zip(files, digests):
+        if digest in rows:
+            results.append(_from_row(rows[digest], filename))
+        else:
+            text, file_metadata = extracted[digest]
+            results.append((text, {**file_metadata, 'filename': filename}))
+    return results
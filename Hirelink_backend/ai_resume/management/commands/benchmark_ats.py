@@ -0,0 +1,157 @@
+# ai_resume/management/commands/benchmark_ats.py
+
+from django.core.management.base import BaseCommand
+from services.job_keywords import JobKeywordMatcher
+from services.keyword_scanner import KeywordScanner
+from services.resume_analyser import ResumeATSBuilder
+from ai_resume.registry import analyzers
+import random
+from datetime import datetime
+from types import SimpleNamespace
+import re
+import time
+
+SAMPLE_RESUME = """John Smith
+Email: john.smith@email.com | Phone: (123) 456-7890 | linkedin.com/in/johnsmith
+
+PROFESSIONAL SUMMARY
+Software engineer with 6 years of experience building web platforms and data pipelines.
+
+EXPERIENCE
+Senior Developer - Acme Corp (2020 - Present)
+• Developed REST APIs in Python and Django serving 2M requests per day
+• Led the migration of 40 services to AWS with Docker and Kubernetes
+• Improved CI/CD pipelines with Jenkins and Git, cutting release time by 60%
+• Mentored 4 junior engineers and coordinated sprint planning (Agile, Scrum)
+
+Developer - Beta Labs (2017 - 2020)
+• Built React and TypeScript dashboards backed by PostgreSQL and Redis
+• Optimized SQL queries and reduced page load time by 35%
+• Implemented machine learning models with pandas and scikit-learn
+
+EDUCATION
+BSc Computer Science - State University (2017)
+
+SKILLS
+Python, Java, JavaScript, SQL, React, Node.js, Docker, Kubernetes, AWS, Linux, Git
+"""
+
+
+class Command(BaseCommand):
+    help = 'Benchmark resume keyword scanning as the keyword dictionary grows'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--sizes',
+            default='100,1000,5000,20000',
+            help='Comma-separated keyword dictionary sizes to compare'
+        )
+        parser.add_argument('--repeat', type=int, default=50, help='Scans per measurement')
+        parser.add_argument('--resume-copies', type=int, default=1, help='Repeat the sample resume to make it longer')
+        parser.add_argument('--seed', type=int, default=42)
+        parser.add_argument(
+            '--batch-sizes',
+            default='1,32,256',
+            help='Comma-separated batch sizes for the trained-model vs rule scorer comparison'
+        )
+
+    def handle(self, *args, **options):
+        rng = random.Random(options['seed'])
+        text = SAMPLE_RESUME * options['resume_copies']
+        repeat = options['repeat']
+        builder = ResumeATSBuilder()
+        base_keywords = list(dict.fromkeys(builder.tech_keywords + builder.action_verbs))
+
+        self.stdout.write(f"\n📊 Resume: {len(text):,} chars, {repeat} scans per measurement")
+        self.stdout.write(f"   {'keywords':>9} {'compile':>9} {'automaton':>11} {'substring':>11} {'regex':>11}")
+
+        for size in [int(value) for value in options['sizes'].split(',')]:
+            keywords = base_keywords + self._synthetic_keywords(rng, size - len(base_keywords))
+
+            start = time.perf_counter()
+            scanner = KeywordScanner()
+            scanner.add_many(keywords, 'skill')
+            scanner.compile()
+            compile_time = time.perf_counter() - start
+
+            automaton = self._time(lambda: scanner.scan(text), repeat)
+
+            # Previous approach: one substring test per keyword (no word boundaries)
+            text_lower = text.lower()
+            substring = self._time(lambda: sum(1 for kw in keywords if kw in text_lower), repeat)
+
+            # Word-boundary equivalent with one regex search per keyword
+            patterns = [re.compile(r'(?<!\w)' + re.escape(kw) + r'(?!\w)') for kw in keywords]
+            regex = self._time(lambda: sum(1 for pattern in patterns if pattern.search(text_lower)), repeat)
+
+            self.stdout.write(
+                f"   {len(keywords):>9,} {compile_time * 1000:>7.1f}ms "
+                f"{automaton * 1000:>9.3f}ms {substring * 1000:>9.3f}ms {regex * 1000:>9.3f}ms"
+            )
+
+        # Construction: per request (old view constructor) vs shared registry instance
+        construct = self._time(ResumeATSBuilder, repeat)
+        analyzers.get('ats_builder')
+        shared = self._time(lambda: analyzers.get('ats_builder'), repeat)
+        self.stdout.write(
+            f"\n   analyzer construction: {construct * 1000:.2f}ms new instance, "
+            f"{shared * 1000:.4f}ms from the registry"
+        )
+        for name, info in analyzers.status()['analyzers'].items():
+            self.stdout.write(f"   warmup {name}: {info['build_time_ms']}ms")
+
+        # Screening for one job: cached automaton vs compiling the job's keywords per resume
+        job = SimpleNamespace(
+            id=0, title='Benchmark job', updated_at=datetime.now(),
+            required_skills=', '.join(base_keywords[:40]), preferred_skills=', '.join(base_keywords[40:80]),
+            description=text
+        )
+        compiled = self._time(lambda: JobKeywordMatcher(job, builder.keyword_scanner).match(text), repeat)
+        cached = self._time(lambda: builder.match_job(text, job), repeat)
+        self.stdout.write(
+            f"   job match: {compiled * 1000:.3f}ms compiling per resume, "
+            f"{cached * 1000:.3f}ms with the cached automaton"
+        )
+
+        # Full analysis pipeline with the real dictionary
+        self.stdout.write("")
+        for mode in builder.ANALYSIS_MODES:
+            analysis = self._time(lambda: builder.analyze_resume(text, mode=mode), max(repeat // 10, 1))
+            self.stdout.write(self.style.SUCCESS(f"✅ analyze_resume (mode={mode}): {analysis * 1000:.2f}ms per resume"))
+
+        # Batched scoring: trained models vs rules, latency per call
+        model_engine = analyzers.get('model_engine')
+        batch_analyzer = analyzers.get('batch_analyzer')
+        if not model_engine.models_loaded:
+            self.stdout.write(self.style.WARNING(f"\n⚠️ Trained models not loaded: {model_engine.load_error}"))
+            return
+
+        self.stdout.write(f"\n📊 Batched scoring latency ({model_engine.models_dir})")
+        self.stdout.write(f"   {'batch':>6} {'model':>11} {'per resume':>11} {'rules':>11} {'per resume':>11}")
+        for batch_size in [int(value) for value in options['batch_sizes'].split(',')]:
+            texts = [text] * batch_size
+            calls = max(repeat * 4 // batch_size, 3)
+            model = self._time(lambda: model_engine.predict(texts), calls)
+            rules = self._time(lambda: batch_analyzer.analyze(texts), calls)
+            self.stdout.write(
+                f"   {batch_size:>6} {model * 1000:>9.2f}ms {model * 1000 / batch_size:>9.3f}ms "
+                f"{rules * 1000:>9.2f}ms {rules * 1000 / batch_size:>9.3f}ms"
+            )
+
+    def _synthetic_keywords(self, rng, count):
+        """Skill-like terms: single words and two-word phrases"""
+        letters = 'abcdefghijklmnopqrstuvwxyz'
+        keywords = set()
+        while len(keywords) < max(count, 0):
+            word = ''.join(rng.choice(letters) for _ in range(rng.randint(3, 10)))
+            if rng.random() < 0.3:
+                word += ' ' + ''.join(rng.choice(letters) for _ in range(rng.randint(3, 8)))
+            keywords.add(word)
+        return list(keywords)
+
+    def _time(self, func, repeat):
+        func()  # warm up
+        start = time.perf_counter()
+        for _ in range(repeat):
+            func()
+        return (time.perf_counter() - start) / repeat
@@ -0,0 +1,109 @@
+# ai_resume/management/commands/benchmark_pdf_extraction.py
+
+from django.core.management.base import BaseCommand
+from services.file_processor import ResumeFileProcessor
+from io import BytesIO
+import os
+import time
+
+PAGE_LINES = [
+    "Senior Developer - Acme Corp (2020 - Present)",
+    "Developed REST APIs in Python and Django serving 2M requests per day",
+    "Led the migration of 40 services to AWS with Docker and Kubernetes",
+    "Improved CI/CD pipelines with Jenkins and Git, cutting release time by 60%",
+    "Built React and TypeScript dashboards backed by PostgreSQL and Redis",
+]
+
+
+def make_pdf(pages, lines_per_page=45):
+    """Multi-page text PDF (Helvetica, one content stream per page) as bytes"""
+    objects = {
+        1: b"<< /Type /Catalog /Pages 2 0 R >>",
+        3: b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>",
+    }
+    kids = []
+    for page in range(pages):
+        page_id, content_id = 4 + 2 * page, 5 + 2 * page
+        lines = [f"Page {page + 1} - {PAGE_LINES[line % len(PAGE_LINES)]}" for line in range(lines_per_page)]
+        stream = ("BT /F1 10 Tf 12 TL 50 780 Td " + " ".join(f"({line}) '" for line in lines) + " ET").encode()
+        objects[content_id] = b"<< /Length %d >>\nstream\n%s\nendstream" % (len(stream), stream)
+        objects[page_id] = (
+            b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] "
+            b"/Resources << /Font << /F1 3 0 R >> >> /Contents %d 0 R >>" % content_id
+        )
+        kids.append(b"%d 0 R" % page_id)
+    objects[2] = b"<< /Type /Pages /Kids [%s] /Count %d >>" % (b" ".join(kids), pages)
+
+    pdf = BytesIO()
+    pdf.write(b"%PDF-1.4\n")
+    offsets = {}
+    for object_id in sorted(objects):
+        offsets[object_id] = pdf.tell()
+        pdf.write(b"%d 0 obj\n%s\nendobj\n" % (object_id, objects[object_id]))
+    xref = pdf.tell()
+    pdf.write(b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1))
+    for object_id in sorted(objects):
+        pdf.write(b"%010d 00000 n \n" % offsets[object_id])
+    pdf.write(b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (len(objects) + 1, xref))
+    return pdf.getvalue()
+
+
+class Command(BaseCommand):
+    help = 'Benchmark PDF text extraction: one process vs page ranges on a process pool, by page count'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--pages', default='1,2,4,8,16,32,64', help='Comma-separated page counts')
+        parser.add_argument('--processes', type=int, default=None, help='Worker processes (default: one per CPU)')
+        parser.add_argument('--repeat', type=int, default=3, help='Extractions per measurement')
+
+    def handle(self, *args, **options):
+        page_counts = [int(value) for value in options['pages'].split(',')]
+        processes = options['processes'] or os.cpu_count() or 1
+        saved = (ResumeFileProcessor.PARALLEL_PDF_MIN_PAGES, ResumeFileProcessor.PDF_WORKERS)
+
+        self.stdout.write(
+            f"\n📊 PDF extraction, {processes} worker processes ({os.cpu_count()} CPUs), "
+            f"{options['repeat']} extractions per measurement"
+        )
+        self.stdout.write(f"   {'pages':>6} {'sequential':>12} {'parallel':>12} {'speedup':>8}")
+        crossover = None
+        try:
+            ResumeFileProcessor.PDF_WORKERS = processes
+            for pages in page_counts:
+                content = make_pdf(pages)
+                extract = lambda: ResumeFileProcessor.extract_text_from_file(
+                    BytesIO(content), 'benchmark.pdf', max_pages=pages, cpu_budget=float('inf')
+                )
+
+                ResumeFileProcessor.PARALLEL_PDF_MIN_PAGES = 0
+                sequential = self._time(extract, options['repeat'])
+                ResumeFileProcessor.PARALLEL_PDF_MIN_PAGES = 2
+                parallel = self._time(extract, options['repeat']) if pages >= 2 and processes > 1 else None
+
+                if parallel is None:
+                    self.stdout.write(f"   {pages:>6} {sequential * 1000:>10.1f}ms {'-':>12} {'-':>8}")
+                    continue
+                if crossover is None and parallel < sequential:
+                    crossover = pages
+                self.stdout.write(
+                    f"   {pages:>6} {sequential * 1000:>10.1f}ms {parallel * 1000:>10.1f}ms "
+                    f"{sequential / parallel:>7.2f}x"
+                )
+        finally:
+            ResumeFileProcessor.PARALLEL_PDF_MIN_PAGES, ResumeFileProcessor.PDF_WORKERS = saved
+
+        if crossover is None:
+            self.stdout.write(self.style.WARNING(
+                f"\n⚠️ Parallel extraction was never faster here (PARALLEL_PDF_MIN_PAGES is {saved[0]})"
+            ))
+        else:
+            self.stdout.write(self.style.SUCCESS(
+                f"\n✅ Parallel extraction wins from {crossover} pages (PARALLEL_PDF_MIN_PAGES is {saved[0]})"
+            ))
+
+    def _time(self, func, repeat):
+        func()  # warm up (also starts the worker processes)
+        start = time.perf_counter()
+        for _ in range(repeat):
+            func()
+        return (time.perf_counter() - start) / repeat
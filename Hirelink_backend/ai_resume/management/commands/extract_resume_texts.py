@@ -0,0 +1,72 @@
+# ai_resume/management/commands/extract_resume_texts.py
+
+from django.core.files.storage import default_storage
+from django.core.management.base import BaseCommand
+from ai_resume.extracted_text import extract_file_texts
+from ai_resume.registry import analyzers
+from applications.models import Application
+from jobs.models import JobApplication
+from users.models import CustomUser
+import os
+import time
+
+# Every stored resume file: (model, label)
+RESUME_SOURCES = [
+    (CustomUser, 'profile resumes'),
+    (JobApplication, 'job application resumes'),
+    (Application, 'application resumes'),
+]
+
+
+class Command(BaseCommand):
+    help = 'Extract and store the text of every stored resume file not extracted yet (by content hash)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=32, help='Files read and extracted together')
+        parser.add_argument('--processes', type=int, default=None, help='Extraction processes (default: ATS_EXTRACTION_WORKERS)')
+
+    def handle(self, *args, **options):
+        stats = {'files': 0, 'cached': 0, 'failed': 0, 'missing': 0}
+        sandbox = analyzers.get('extractor')
+        if options['processes'] is not None:
+            sandbox.set_workers(options['processes'])
+        start = time.perf_counter()
+        try:
+            for model, label in RESUME_SOURCES:
+                self.stdout.write(f"🚀 Extracting {label}")
+                batch = []
+                for resume in self._resume_files(model):
+                    batch.append(resume)
+                    if len(batch) >= options['batch_size']:
+                        self._extract(batch, sandbox, stats)
+                        batch = []
+                if batch:
+                    self._extract(batch, sandbox, stats)
+        finally:
+            sandbox.close()
+
+        self.stdout.write(self.style.SUCCESS(
+            f"✅ {stats['files']} files in {time.perf_counter() - start:.2f}s: "
+            f"{stats['files'] - stats['cached'] - stats['failed']} extracted, "
+            f"{stats['cached']} already stored, {stats['failed']} failed, {stats['missing']} missing on storage"
+        ))
+
+    def _resume_files(self, model):
+        resumes = model.objects.exclude(resume='').exclude(resume__isnull=True)
+        yield from resumes.values_list('resume', flat=True).iterator()
+
+    def _extract(self, names, sandbox, stats):
+        files = []
+        for name in names:
+            try:
+                with default_storage.open(name, 'rb') as resume_file:
+                    files.append((os.path.basename(name), resume_file.read()))
+            except OSError:
+                stats['missing'] += 1
+        for (filename, _), (_, file_metadata) in zip(files, extract_file_texts(files, sandbox)):
+            stats['files'] += 1
+            if file_metadata.get('extraction_cached'):
+                stats['cached'] += 1
+            elif not file_metadata['success']:
+                stats['failed'] += 1
+                self.stdout.write(self.style.WARNING(f"⚠️ {filename}: {file_metadata.get('error')}"))
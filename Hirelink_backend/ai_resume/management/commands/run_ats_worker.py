@@ -0,0 +1,86 @@
+# ai_resume/management/commands/run_ats_worker.py
+
+from django.core.management.base import BaseCommand
+from django.db import close_old_connections, connection
+from ai_resume.registry import analyzers
+from ai_resume.tasks import claim_next_task, queue_stats, requeue_stale_tasks, run_task
+import os
+import socket
+import threading
+import time
+
+
+class Command(BaseCommand):
+    help = 'Run queued resume analyses (POST /api/ats-analyze/ with async=true)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--concurrency', type=int, default=2, help='Tasks processed at the same time')
+        parser.add_argument(
+            '--processes', type=int, default=None,
+            help='Sandboxed worker processes for PDF/DOCX text extraction (default: one per CPU, 0 = in-thread)'
+        )
+        parser.add_argument('--poll-interval', type=float, default=1.0, help='Seconds between polls of an empty queue')
+        parser.add_argument('--stale-after', type=int, default=300, help='Requeue tasks running longer than this')
+        parser.add_argument('--max-attempts', type=int, default=3)
+        parser.add_argument('--once', action='store_true', help='Exit when the queue is empty')
+
+    def handle(self, *args, **options):
+        builder = analyzers.get('ats_builder')
+        processes = os.cpu_count() if options['processes'] is None else options['processes']
+        # Extraction is CPU-bound pure Python and parses untrusted files: run it in
+        # limited worker processes, outside this process's GIL (the process-wide sandbox)
+        sandbox = analyzers.get('extractor')
+        sandbox.set_workers(processes)
+        sandbox.start()
+
+        worker_name = f"{socket.gethostname()}:{os.getpid()}"
+        stop = threading.Event()
+        processed = [0]
+        lock = threading.Lock()
+
+        def work(slot):
+            worker_id = f"{worker_name}/{slot}"
+            try:
+                while not stop.is_set():
+                    close_old_connections()
+                    task = claim_next_task(worker_id)
+                    if task is None:
+                        if options['once']:
+                            return
+                        stop.wait(options['poll_interval'])
+                        continue
+                    run_task(task, builder, sandbox.extract)
+                    with lock:
+                        processed[0] += 1
+            finally:
+                connection.close()
+
+        requeue_stale_tasks(options['stale_after'], options['max_attempts'])
+        self.stdout.write(
+            f"🚀 ATS worker {worker_name}: {options['concurrency']} slots, "
+            f"{processes or 'no'} extraction processes, {queue_stats()['queued']} tasks queued"
+        )
+
+        threads = [
+            threading.Thread(target=work, args=(slot,), name=f'ats-worker-{slot}', daemon=True)
+            for slot in range(options['concurrency'])
+        ]
+        for thread in threads:
+            thread.start()
+
+        try:
+            last_check = time.monotonic()
+            while any(thread.is_alive() for thread in threads):
+                time.sleep(0.5)
+                if time.monotonic() - last_check > options['stale_after'] / 2:
+                    requeue_stale_tasks(options['stale_after'], options['max_attempts'])
+                    last_check = time.monotonic()
+        except KeyboardInterrupt:
+            self.stdout.write("Stopping after the running tasks...")
+            stop.set()
+            for thread in threads:
+                thread.join()
+        finally:
+            sandbox.close()
+
+        self.stdout.write(self.style.SUCCESS(f"✅ ATS worker stopped after {processed[0]} tasks"))
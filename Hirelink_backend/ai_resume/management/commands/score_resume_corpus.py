@@ -0,0 +1,126 @@
+# ai_resume/management/commands/score_resume_corpus.py
+
+from django.core.management.base import BaseCommand, CommandError
+from ai_resume.corpus import (
+    CorpusCheckpoint, default_output_path, init_worker, iter_chunks, iter_corpus, score_chunk, write_columns
+)
+from services.resume_analyser import ResumeATSBuilder
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+import os
+import time
+
+
+class Command(BaseCommand):
+    help = 'Score a CSV/NDJSON resume corpus on a process pool, with checkpoints, into a columnar file'
+
+    def add_arguments(self, parser):
+        parser.add_argument('corpus', help='.csv, .ndjson or .jsonl file, e.g. datasets/raw/UpdatedResumeDataSet.csv')
+        parser.add_argument('--output', '-o', help='.parquet or .npz (default: <corpus>.scores.parquet, .npz without pyarrow)')
+        parser.add_argument('--text-column', help='Column with the resume text (default: detected)')
+        parser.add_argument('--id-column', help='Column copied to the id column (default: row number)')
+        parser.add_argument('--processes', type=int, default=None, help='Scoring processes (default: one per CPU, 0 = in-process)')
+        parser.add_argument('--chunk-size', type=int, default=200, help='Resumes per chunk (the unit of checkpointing)')
+        parser.add_argument('--checkpoint-dir', help='Finished chunks are kept here (default: <output>.checkpoint)')
+        parser.add_argument('--restart', action='store_true', help='Discard an existing checkpoint')
+        parser.add_argument('--keep-checkpoint', action='store_true', help='Keep the chunk files after writing the output')
+
+    def handle(self, *args, **options):
+        corpus = options['corpus']
+        self.verbosity = options['verbosity']
+        if not os.path.isfile(corpus):
+            raise CommandError(f"Corpus not found: {corpus}")
+        if options['chunk_size'] < 1:
+            raise CommandError("--chunk-size must be at least 1")
+        output = options['output'] or default_output_path(corpus)
+        processes = os.cpu_count() if options['processes'] is None else options['processes']
+
+        corpus_stat = os.stat(corpus)
+        checkpoint = CorpusCheckpoint(options['checkpoint_dir'] or f"{output}.checkpoint", {
+            'corpus': os.path.abspath(corpus),
+            'corpus_size': corpus_stat.st_size,
+            'corpus_mtime': int(corpus_stat.st_mtime),
+            'text_column': options['text_column'],
+            'id_column': options['id_column'],
+            'chunk_size': options['chunk_size'],
+            'analyzer_version': ResumeATSBuilder().analyzer_version,
+        })
+        try:
+            done = checkpoint.open(options['restart'])
+        except ValueError as e:
+            raise CommandError(str(e))
+
+        self.stdout.write(
+            f"🚀 Scoring {corpus} in chunks of {options['chunk_size']} on {processes or 'no'} worker processes"
+            + (f", resuming after {len(done)} finished chunks" if done else '')
+        )
+
+        chunks = (
+            (index, chunk)
+            for index, chunk in iter_chunks(
+                iter_corpus(corpus, options['text_column'], options['id_column']), options['chunk_size']
+            )
+            if index not in done
+        )
+        stats = {'chunks': 0, 'resumes': 0, 'cpu_seconds': 0.0}
+        start = time.perf_counter()
+        try:
+            if processes:
+                self._score_parallel(chunks, processes, checkpoint, stats)
+            else:
+                for index, chunk in chunks:
+                    self._finish_chunk(score_chunk(index, chunk), checkpoint, stats)
+        except ValueError as e:
+            raise CommandError(str(e))
+        except KeyboardInterrupt:
+            self.stdout.write(self.style.WARNING(
+                f"\n⚠️ Interrupted after {stats['chunks']} new chunks; run the same command again to resume"
+            ))
+            return
+        elapsed = time.perf_counter() - start
+
+        columns = checkpoint.load()
+        try:
+            write_columns(columns, output)
+        except ValueError as e:
+            raise CommandError(f"{e} (finished chunks are kept in {checkpoint.directory})")
+        if not options['keep_checkpoint']:
+            checkpoint.clear()
+
+        scored = int(columns['success'].sum()) if len(columns['success']) else 0
+        self.stdout.write(self.style.SUCCESS(
+            f"✅ {len(columns['row'])} resumes ({scored} scored) written to {output}"
+        ))
+        if stats['resumes']:
+            # Per core: resumes per CPU-second spent scoring inside the workers
+            self.stdout.write(
+                f"   this run: {stats['resumes']} resumes in {elapsed:.2f}s = "
+                f"{stats['resumes'] / elapsed:.0f} resumes/s with {processes or 'no'} worker processes, "
+                f"{stats['resumes'] / max(stats['cpu_seconds'], 1e-9):.0f} resumes/s per core"
+            )
+
+    def _score_parallel(self, chunks, processes, checkpoint, stats):
+        # A few chunks in flight per process: the corpus is never fully in memory
+        max_pending = processes * 2
+        with ProcessPoolExecutor(max_workers=processes, initializer=init_worker) as pool:
+            pending = set()
+            try:
+                for index, chunk in chunks:
+                    pending.add(pool.submit(score_chunk, index, chunk))
+                    if len(pending) >= max_pending:
+                        finished, pending = wait(pending, return_when=FIRST_COMPLETED)
+                        for future in finished:
+                            self._finish_chunk(future.result(), checkpoint, stats)
+                for future in wait(pending).done:
+                    self._finish_chunk(future.result(), checkpoint, stats)
+            except BaseException:
+                pool.shutdown(wait=True, cancel_futures=True)
+                raise
+
+    def _finish_chunk(self, scored_chunk, checkpoint, stats):
+        index, columns, cpu_seconds = scored_chunk
+        checkpoint.save(index, columns)
+        stats['chunks'] += 1
+        stats['resumes'] += len(columns['row'])
+        stats['cpu_seconds'] += cpu_seconds
+        if self.verbosity >= 2:
+            self.stdout.write(f"   chunk {index}: {len(columns['row'])} resumes, {cpu_seconds * 1000:.0f}ms CPU")
@@ -0,0 +1,32 @@
+# Generated by Django 4.2.30 on 2026-10-19 00:28
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ResumeAnalysisCache',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('key_type', models.CharField(choices=[('file', 'File bytes'), ('text', 'Normalized text')], max_length=4)),
+                ('digest', models.CharField(max_length=64)),
+                ('analyzer_version', models.CharField(max_length=32)),
+                ('result', models.JSONField()),
+                ('file_metadata', models.JSONField(blank=True, null=True)),
+                ('hit_count', models.PositiveIntegerField(default=0)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('last_hit_at', models.DateTimeField(blank=True, null=True)),
+            ],
+            options={
+                'ordering': ['-created_at'],
+                'unique_together': {('key_type', 'digest', 'analyzer_version')},
+            },
+        ),
+    ]
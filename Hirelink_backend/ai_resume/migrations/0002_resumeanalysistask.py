@@ -0,0 +1,40 @@
+# Generated by Django 4.2.30 on 2026-10-19 00:37
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+import uuid
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ('ai_resume', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ResumeAnalysisTask',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('status', models.CharField(choices=[('queued', 'Queued'), ('running', 'Running'), ('done', 'Done'), ('failed', 'Failed')], default='queued', max_length=10)),
+                ('resume_file', models.FileField(blank=True, null=True, upload_to='ats_tasks/%Y/%m/')),
+                ('filename', models.CharField(blank=True, max_length=255)),
+                ('resume_text', models.TextField(blank=True)),
+                ('result', models.JSONField(blank=True, null=True)),
+                ('file_metadata', models.JSONField(blank=True, null=True)),
+                ('error', models.TextField(blank=True)),
+                ('attempts', models.PositiveSmallIntegerField(default=0)),
+                ('worker', models.CharField(blank=True, max_length=100)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('started_at', models.DateTimeField(blank=True, null=True)),
+                ('finished_at', models.DateTimeField(blank=True, null=True)),
+                ('user', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='resume_analysis_tasks', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'ordering': ['created_at'],
+                'indexes': [models.Index(fields=['status', 'created_at'], name='ai_resume_r_status_35d169_idx')],
+            },
+        ),
+    ]
@@ -0,0 +1,20 @@
+# Generated by Django 4.2.30 on 2026-10-19 00:40
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('jobs', '0002_candidateskill'),
+        ('ai_resume', '0002_resumeanalysistask'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='resumeanalysistask',
+            name='job',
+            field=models.ForeignKey(blank=True, help_text='Job the resume is scored against (optional)', null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='resume_analysis_tasks', to='jobs.job'),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 4.2.30 on 2026-10-19 00:45
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('ai_resume', '0003_resumeanalysistask_job'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='resumeanalysistask',
+            name='mode',
+            field=models.CharField(choices=[('score', 'Score'), ('summary', 'Summary'), ('full', 'Full')], default='full', help_text='analyze_resume mode', max_length=10),
+        ),
+    ]
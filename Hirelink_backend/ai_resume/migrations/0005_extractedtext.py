@@ -0,0 +1,30 @@
+# Generated by Django 4.2.30 on 2026-10-19 00:55
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('ai_resume', '0004_resumeanalysistask_mode'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ExtractedText',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('digest', models.CharField(max_length=64)),
+                ('extractor_version', models.CharField(max_length=16)),
+                ('compressed_text', models.BinaryField()),
+                ('char_count', models.PositiveIntegerField(default=0)),
+                ('file_metadata', models.JSONField(blank=True, null=True)),
+                ('extract_time_ms', models.FloatField(default=0)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                'ordering': ['-created_at'],
+                'unique_together': {('digest', 'extractor_version')},
+            },
+        ),
+    ]
@@ -1,3 +1,116 @@
+import uuid
+
+from django.conf import settings
 from django.db import models
 
-# Create your models here.
+
+class ResumeAnalysisCache(models.Model):
+    """
+    Persisted resume analysis results, keyed by the SHA-256 of the uploaded
+    file bytes or of the normalized resume text. Entries written by another
+    analyzer version are ignored, so rule changes invalidate them.
+    """
+    KEY_TYPES = (
+        ('file', 'File bytes'),
+        ('text', 'Normalized text'),
+    )
+    
+    key_type = models.CharField(max_length=4, choices=KEY_TYPES)
+    digest = models.CharField(max_length=64)
+    analyzer_version = models.CharField(max_length=32)
+    result = models.JSONField()
+    file_metadata = models.JSONField(null=True, blank=True)
+    hit_count = models.PositiveIntegerField(default=0)
+    created_at = models.DateTimeField(auto_now_add=True)
+    last_hit_at = models.DateTimeField(null=True, blank=True)
+    
+    class Meta:
+        unique_together = ['key_type', 'digest', 'analyzer_version']
+        ordering = ['-created_at']
+    
+    def __str__(self):
+        return f"{self.key_type}:{self.digest[:12]} (v{self.analyzer_version})"
+
+
+class ExtractedText(models.Model):
+    """
+    Text extracted from a resume file, keyed by the SHA-256 of the file bytes:
+    every copy of the same file (profile, application, upload) shares one row.
+    The normalized text is stored zlib-compressed; rows written by another
+    extractor version are ignored.
+    """
+    digest = models.CharField(max_length=64)
+    extractor_version = models.CharField(max_length=16)
+    compressed_text = models.BinaryField()
+    char_count = models.PositiveIntegerField(default=0)
+    file_metadata = models.JSONField(null=True, blank=True)
+    extract_time_ms = models.FloatField(default=0)
+    created_at = models.DateTimeField(auto_now_add=True)
+    
+    class Meta:
+        unique_together = ['digest', 'extractor_version']
+        ordering = ['-created_at']
+    
+    def __str__(self):
+        return f"{self.digest[:12]} ({self.char_count} chars, extractor v{self.extractor_version})"
+
+
+class ResumeAnalysisTask(models.Model):
+    """
+    Resume analysis queued for the run_ats_worker command. The upload (or the
+    text) is stored with the task; the client polls the task until it is done.
+    """
+    STATUS_CHOICES = (
+        ('queued', 'Queued'),
+        ('running', 'Running'),
+        ('done', 'Done'),
+        ('failed', 'Failed'),
+    )
+    MODE_CHOICES = (
+        ('score', 'Score'),
+        ('summary', 'Summary'),
+        ('full', 'Full'),
+    )
+    
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL, on_delete=models.SET_NULL, null=True, blank=True,
+        related_name='resume_analysis_tasks'
+    )
+    job = models.ForeignKey(
+        'jobs.Job', on_delete=models.SET_NULL, null=True, blank=True,
+        related_name='resume_analysis_tasks', help_text="Job the resume is scored against (optional)"
+    )
+    status = models.CharField(max_length=10, choices=STATUS_CHOICES, default='queued')
+    mode = models.CharField(max_length=10, choices=MODE_CHOICES, default='full', help_text="analyze_resume mode")
+    resume_file = models.FileField(upload_to='ats_tasks/%Y/%m/', null=True, blank=True)
+    filename = models.CharField(max_length=255, blank=True)
+    resume_text = models.TextField(blank=True)
+    result = models.JSONField(null=True, blank=True)
+    file_metadata = models.JSONField(null=True, blank=True)
+    error = models.TextField(blank=True)
+    attempts = models.PositiveSmallIntegerField(default=0)
+    worker = models.CharField(max_length=100, blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    started_at = models.DateTimeField(null=True, blank=True)
+    finished_at = models.DateTimeField(null=True, blank=True)
+    
+    class Meta:
+        ordering = ['created_at']
+        indexes = [models.Index(fields=['status', 'created_at'])]
+    
+    def __str__(self):
+        return f"{self.id} ({self.status})"
+    
+    @property
+    def queue_wait(self):
+        """Seconds between enqueue and the worker picking the task up"""
+        if self.started_at:
+            return (self.started_at - self.created_at).total_seconds()
+        return None
+    
+    @property
+    def run_time(self):
+        if self.started_at and self.finished_at:
+            return (self.finished_at - self.started_at).total_seconds()
+        return None
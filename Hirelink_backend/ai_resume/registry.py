@@ -0,0 +1,163 @@
+# ai_resume/registry.py - Analyzers built once per process
+"""
+DRF creates a new view instance for every request, so analyzers must not be
+built in view constructors. They are registered here and built once per
+process: in the background when a web process starts (wsgi.py / asgi.py call
+warmup_on_startup), otherwise lazily. An analyzer requested before warmup
+finished is built on the spot.
+"""
+import logging
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+SAMPLE_RESUME = """John Smith
+Email: john.smith@email.com | Phone: (123) 456-7890 | linkedin.com/in/johnsmith
+
+PROFESSIONAL SUMMARY
+Software engineer with 6 years of experience building web platforms.
+
+EXPERIENCE
+Senior Developer - Acme Corp (2020 - Present)
+• Developed REST APIs in Python and Django serving 2M requests per day
+• Led the migration of 40 services to AWS with Docker and Kubernetes
+• Improved CI/CD pipelines with Jenkins and Git, cutting release time by 60%
+
+EDUCATION
+BSc Computer Science - State University (2017)
+
+SKILLS
+Python, Java, JavaScript, SQL, React, Node.js, Docker, Kubernetes, AWS, Linux, Git
+"""
+
+
+class AnalyzerRegistry:
+    """Named analyzer factories, built at most once, with a readiness flag"""
+
+    def __init__(self):
+        self._factories = {}
+        self._instances = {}
+        self._build_times = {}
+        self._errors = {}
+        self._lock = threading.RLock()
+        self.ready = False
+
+    def register(self, name, factory, warmup=None):
+        """factory(registry) builds the analyzer; warmup(analyzer) exercises it once"""
+        self._factories[name] = (factory, warmup)
+
+    def get(self, name):
+        instance = self._instances.get(name)
+        if instance is not None:
+            return instance
+
+        with self._lock:
+            if name not in self._instances:
+                factory, warmup = self._factories[name]
+                start = time.perf_counter()
+                try:
+                    instance = factory(self)
+                    if warmup is not None:
+                        warmup(instance)
+                except Exception as e:
+                    self._errors[name] = str(e)
+                    raise
+                self._build_times[name] = time.perf_counter() - start
+                self._errors.pop(name, None)
+                self._instances[name] = instance
+            return self._instances[name]
+
+    def warmup(self):
+        """Build every registered analyzer; ready stays False if one of them fails"""
+        failed = False
+        for name in self._factories:
+            try:
+                self.get(name)
+            except Exception as e:
+                failed = True
+                logger.error("Failed to build analyzer '%s': %s", name, e)
+        self.ready = not failed
+        if self.ready:
+            total = sum(self._build_times.values())
+            logger.info("Resume analyzers ready (%d built in %.0fms)", len(self._instances), total * 1000)
+        return self.ready
+
+    def warmup_in_background(self):
+        threading.Thread(target=self.warmup, name='analyzer-warmup', daemon=True).start()
+
+    def status(self):
+        return {
+            'ready': self.ready,
+            'analyzers': {
+                name: {
+                    'loaded': name in self._instances,
+                    'build_time_ms': round(self._build_times[name] * 1000, 1) if name in self._build_times else None,
+                    'error': self._errors.get(name)
+                }
+                for name in self._factories
+            }
+        }
+
+
+def _build_ats_builder(registry):
+    from django.conf import settings
+    from services.resume_analyser import ResumeATSBuilder
+    return ResumeATSBuilder(section_cache_size=getattr(settings, 'ATS_SECTION_CACHE_SIZE', 2048))
+
+
+def _warm_ats_builder(builder):
+    # Compiles the automaton and the regexes the analysis uses
+    document = builder.parse_resume(SAMPLE_RESUME)
+    builder.calculate_quality_score(builder.extract_features(document))
+    builder.check_ats_compatibility(document)
+    builder.get_quick_wins(document)
+
+
+def _build_batch_analyzer(registry):
+    from services.batch_analyser import BatchATSAnalyzer
+    return BatchATSAnalyzer(registry.get('ats_builder'))
+
+
+def _build_model_engine(registry):
+    from django.conf import settings
+    from services.model_inference import ResumeModelEngine
+    return ResumeModelEngine(
+        models_dir=str(getattr(settings, 'RESUME_MODELS_DIR', 'ml_models/trained_models')),
+        label_encoder_path=str(getattr(settings, 'RESUME_LABEL_ENCODER_PATH', 'ml_models/label_encoder.pkl')),
+        fallback=registry.get('batch_analyzer'),
+        batch_size=getattr(settings, 'RESUME_MODEL_BATCH_SIZE', 256)
+    )
+
+
+def _warm_model_engine(engine):
+    engine.predict([SAMPLE_RESUME])
+
+
+def _build_extractor(registry):
+    # ExtractionSandbox with the ATS_EXTRACTION_* limits; its worker processes
+    # are started by the first extraction, not by the warmup
+    from django.conf import settings
+    from services.extraction_sandbox import ExtractionSandbox
+    return ExtractionSandbox(
+        workers=getattr(settings, 'ATS_EXTRACTION_WORKERS', 2),
+        cpu_limit=getattr(settings, 'ATS_EXTRACTION_CPU_LIMIT', 10),
+        memory_limit_mb=getattr(settings, 'ATS_EXTRACTION_MEMORY_LIMIT_MB', 1024),
+        timeout=getattr(settings, 'ATS_EXTRACTION_TIMEOUT', 20),
+        max_jobs=getattr(settings, 'ATS_EXTRACTION_MAX_JOBS', 200)
+    )
+
+
+def warmup_on_startup():
+    """Warm the analyzers in the background when ATS_WARMUP_ON_STARTUP is set (WSGI/ASGI entry points)"""
+    from django.conf import settings
+    if getattr(settings, 'ATS_WARMUP_ON_STARTUP', True):
+        analyzers.warmup_in_background()
+
+
+# Global instance
+analyzers = AnalyzerRegistry()
+analyzers.register('ats_builder', _build_ats_builder, _warm_ats_builder)
+analyzers.register('batch_analyzer', _build_batch_analyzer)
+analyzers.register('model_engine', _build_model_engine, _warm_model_engine)
+analyzers.register('extractor', _build_extractor)
@@ -0,0 +1,223 @@
+# ai_resume/tasks.py - DB-backed queue for asynchronous resume analysis
+"""
+Large or pathological PDFs can keep a web worker busy for seconds. In async
+mode the upload is stored in a ResumeAnalysisTask and the request returns
+at once with the task id; `manage.py run_ats_worker` claims queued tasks,
+extracts and analyzes them, and the client polls (or long-polls) the task.
+
+The queue is the ResumeAnalysisTask table itself: a task is claimed with a
+conditional UPDATE (status='queued' -> 'running'), so several workers on any
+database never run the same task twice.
+"""
+import logging
+import time
+from datetime import timedelta
+
+from django.db.models import F
+from django.utils import timezone
+
+from services.file_processor import ResumeFileProcessor
+
+from .cache import analysis_cache, analyze_text_cached, sha256_hex
+from .extracted_text import extract_file_text, sandboxed_extract
+from .models import ResumeAnalysisTask
+
+logger = logging.getLogger(__name__)
+
+
+class ResumeInputError(Exception):
+    """The upload has no usable resume text (the client's fault, not the analyzer's)"""
+
+    def __init__(self, message, file_metadata=None):
+        super().__init__(message)
+        self.file_metadata = file_metadata
+
+
+def file_cache_version(builder, mode='full'):
+    """Version of file-hash cache entries: the analysis version plus the text extractor's"""
+    return f"{builder.cache_version(mode)}/x{ResumeFileProcessor.EXTRACTOR_VERSION}"
+
+
+def cached_file_analysis(builder, file_digest, filename, mode='full'):
+    """(analysis_result, file_metadata) if the file with this SHA-256 was analyzed before in this mode, else None"""
+    cached = analysis_cache.get('file', file_digest, file_cache_version(builder, mode))
+    if cached is None:
+        return None
+    analysis_result, file_metadata = cached
+    file_metadata['filename'] = filename
+    analysis_result['metadata']['cached'] = True
+    return analysis_result, file_metadata
+
+
+def analyze_resume_file(builder, content, filename, extract=sandboxed_extract, job=None, mode='full'):
+    """
+    (analysis_result, file_metadata) for uploaded resume bytes, through the
+    file-hash and text-hash caches and the stored extracted texts.
+    extract((filename, content)) -> (text, metadata)
+    Matching a job needs the text, so the file-hash cache is skipped then.
+    """
+    file_digest = sha256_hex(content)
+    if job is None:
+        cached = cached_file_analysis(builder, file_digest, filename, mode)
+        if cached is not None:
+            return cached
+
+    resume_text, file_metadata = extract_file_text(content, filename, extract, file_digest)
+    if not file_metadata['success']:
+        raise ResumeInputError(
+            f"Failed to extract text from file: {file_metadata.get('error', 'Unknown error')}", file_metadata
+        )
+    if len(resume_text.strip()) < 50:
+        raise ResumeInputError(
+            'Extracted text is too short (minimum 50 characters). The file might be empty or unreadable.',
+            file_metadata
+        )
+    logger.debug("Extracted %s words from %s", file_metadata['word_count'], filename)
+
+    analysis_result = analyze_text_cached(builder, resume_text, job, mode)
+    if analysis_result['success'] and job is None:
+        analysis_cache.set('file', file_digest, file_cache_version(builder, mode), analysis_result, file_metadata)
+    return analysis_result, file_metadata
+
+
+def enqueue_file(uploaded_file, user=None, job=None, mode='full'):
+    return ResumeAnalysisTask.objects.create(
+        resume_file=uploaded_file, filename=uploaded_file.name, user=user, job=job, mode=mode
+    )
+
+
+def enqueue_text(resume_text, user=None, job=None, mode='full'):
+    return ResumeAnalysisTask.objects.create(resume_text=resume_text, user=user, job=job, mode=mode)
+
+
+def claim_next_task(worker_id):
+    """Oldest queued task, now running for this worker, or None when the queue is empty"""
+    candidates = ResumeAnalysisTask.objects.filter(status='queued').order_by('created_at')
+    for task_id in candidates.values_list('id', flat=True)[:10]:
+        claimed = ResumeAnalysisTask.objects.filter(id=task_id, status='queued').update(
+            status='running', started_at=timezone.now(), worker=worker_id, attempts=F('attempts') + 1
+        )
+        if claimed:
+            return ResumeAnalysisTask.objects.select_related('job').get(id=task_id)
+    return None
+
+
+def run_task(task, builder, extract=sandboxed_extract):
+    """Analyze a claimed task and store its outcome; the stored upload is deleted afterwards"""
+    try:
+        if task.resume_file:
+            with task.resume_file.open('rb') as resume_file:
+                content = resume_file.read()
+            analysis_result, task.file_metadata = analyze_resume_file(
+                builder, content, task.filename, extract, task.job, task.mode
+            )
+        else:
+            analysis_result = analyze_text_cached(builder, task.resume_text, task.job, task.mode)
+    except ResumeInputError as e:
+        task.status, task.error, task.file_metadata = 'failed', str(e), e.file_metadata
+    except Exception as e:
+        logger.exception("Resume analysis task %s failed: %s", task.id, e)
+        task.status, task.error = 'failed', f"Analysis failed: {e}"
+    else:
+        if analysis_result['success']:
+            task.status, task.result = 'done', analysis_result
+        else:
+            task.status, task.error = 'failed', analysis_result.get('error', 'Analysis failed')
+
+    task.finished_at = timezone.now()
+    if task.resume_file:
+        task.resume_file.delete(save=False)
+    task.resume_text = ''
+    task.save(update_fields=['status', 'result', 'error', 'file_metadata', 'finished_at', 'resume_file', 'resume_text'])
+
+    logger.info("Resume analysis task finished", extra={
+        'task_id': str(task.id),
+        'status': task.status,
+        'queue_wait_s': round(task.queue_wait, 3),
+        'run_time_s': round(task.run_time, 3)
+    })
+    return task
+
+
+def requeue_stale_tasks(stale_after=300, max_attempts=3):
+    """Tasks left running by a worker that died: queued again, or failed after max_attempts"""
+    cutoff = timezone.now() - timedelta(seconds=stale_after)
+    stale = ResumeAnalysisTask.objects.filter(status='running', started_at__lt=cutoff)
+    failed = stale.filter(attempts__gte=max_attempts).update(
+        status='failed', error='Analysis did not finish (worker stopped)', finished_at=timezone.now()
+    )
+    requeued = stale.update(status='queued', started_at=None, worker='')
+    if failed or requeued:
+        logger.warning("Stale resume analysis tasks: %d requeued, %d failed", requeued, failed)
+    return requeued, failed
+
+
+def wait_for_task(task_id, timeout=0, interval=0.25):
+    """The task, once finished or after timeout seconds (long polling)"""
+    deadline = time.monotonic() + timeout
+    while True:
+        task = ResumeAnalysisTask.objects.get(id=task_id)
+        if task.status in ('done', 'failed') or time.monotonic() >= deadline:
+            return task
+        time.sleep(interval)
+
+
+def _percentile(values, fraction):
+    if not values:
+        return None
+    values = sorted(values)
+    return round(values[min(len(values) - 1, int(fraction * len(values)))], 3)
+
+
+def queue_stats(window=timedelta(hours=1)):
+    """Queue depth and latency of the tasks finished in the last window"""
+    now = timezone.now()
+    tasks = ResumeAnalysisTask.objects
+    oldest = tasks.filter(status='queued').order_by('created_at').values_list('created_at', flat=True).first()
+
+    finished = tasks.filter(finished_at__gte=now - window, started_at__isnull=False).values_list(
+        'status', 'created_at', 'started_at', 'finished_at'
+    )[:5000]
+    waits, runs, failed = [], [], 0
+    for status, created_at, started_at, finished_at in finished:
+        waits.append((started_at - created_at).total_seconds())
+        runs.append((finished_at - started_at).total_seconds())
+        failed += status == 'failed'
+
+    return {
+        'queued': tasks.filter(status='queued').count(),
+        'running': tasks.filter(status='running').count(),
+        'oldest_queued_s': round((now - oldest).total_seconds(), 1) if oldest else None,
+        'window_s': int(window.total_seconds()),
+        'finished': len(runs),
+        'failed': failed,
+        'queue_wait_s': {'p50': _percentile(waits, 0.5), 'p95': _percentile(waits, 0.95)},
+        'run_time_s': {'p50': _percentile(runs, 0.5), 'p95': _percentile(runs, 0.95)},
+    }
+
+
+def task_payload(task):
+    """API representation of a task"""
+    payload = {
+        'task_id': str(task.id),
+        'status': task.status,
+        'mode': task.mode,
+        'filename': task.filename or None,
+        'created_at': task.created_at.isoformat(),
+        'started_at': task.started_at.isoformat() if task.started_at else None,
+        'finished_at': task.finished_at.isoformat() if task.finished_at else None,
+        'queue_wait_s': task.queue_wait,
+        'run_time_s': task.run_time,
+    }
+    if task.status == 'queued':
+        payload['queue_position'] = ResumeAnalysisTask.objects.filter(
+            status='queued', created_at__lt=task.created_at
+        ).count() + 1
+    if task.status == 'done':
+        payload['result'] = task.result
+        if task.file_metadata:
+            payload['result']['file_metadata'] = task.file_metadata
+    if task.status == 'failed':
+        payload['error'] = task.error
+        payload['file_metadata'] = task.file_metadata
+    return payload
@@ -8,12 +8,26 @@ from rest_framework import status
 from rest_framework.parsers import MultiPartParser, FormParser, JSONParser
 from rest_framework.permissions import IsAuthenticated, AllowAny
 import json
+import logging
 import os
+import time
 from django.conf import settings
+from django.urls import reverse
 
 # Import our services
-from services.resume_analyser import ResumeATSBuilder
 from services.file_processor import ResumeFileProcessor
+from ai_resume.cache import analysis_cache, analyze_text_cached, sha256_hex
+from ai_resume.extracted_text import extract_file_texts
+from ai_resume.models import ResumeAnalysisTask
+from ai_resume.tasks import (
+    ResumeInputError, analyze_resume_file, cached_file_analysis, enqueue_file, enqueue_text,
+    queue_stats, task_payload, wait_for_task
+)
+from ai_resume.registry import analyzers, SAMPLE_RESUME
+
+logger = logging.getLogger(__name__)
+
+MAX_BATCH_RESUMES = 1000
 
 class ResumeATSAnalyzeView(APIView):
     """
@@ -23,11 +37,11 @@ class ResumeATSAnalyzeView(APIView):
     parser_classes = [MultiPartParser, FormParser, JSONParser]
     permission_classes = [AllowAny]  # Change to IsAuthenticated if needed
     
-    def __init__(self):
-        super().__init__()
-        # Initialize ATS Builder
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Shared ATS Builder, built once per process (see ai_resume.registry)
         try:
-            self.ats_builder = ResumeATSBuilder()
+            self.ats_builder = analyzers.get('ats_builder')
             self.service_ready = True
         except Exception as e:
             self.service_ready = False
@@ -39,6 +53,9 @@ class ResumeATSAnalyzeView(APIView):
         1. File upload (PDF, DOCX, TXT)
         2. JSON with 'text' field
         3. Form data with 'resume_text' field
+        With async=true the resume is queued for run_ats_worker and a task id is returned (202)
+        With job_id the resume is also scored against that job's skills (analysis.job_match)
+        mode=score|summary|full (default full) skips the stages the caller does not need
         """
         # Check if service is ready
         if not self.service_ready:
@@ -48,12 +65,20 @@ class ResumeATSAnalyzeView(APIView):
             }, status=status.HTTP_503_SERVICE_UNAVAILABLE)
         
         try:
+            job, error_response = self._get_job(request)
+            if error_response:
+                return error_response
+            mode, error_response = self._get_mode(request)
+            if error_response:
+                return error_response
+            
             # Case 1: File upload
             if 'resume_file' in request.FILES:
-                return self._handle_file_upload(request)
+                async_mode = self._wants_async(request, getattr(settings, 'ATS_ASYNC_FILE_UPLOADS', False))
+                return self._handle_file_upload(request, async_mode, job, mode)
             
-            # Case 2: Text input (JSON or form data)
-            return self._handle_text_input(request)
+            # Case 2: Text input (JSON or form data), synchronous unless asked otherwise
+            return self._handle_text_input(request, self._wants_async(request, False), job, mode)
                 
         except Exception as e:
             return Response({
@@ -61,12 +86,58 @@ class ResumeATSAnalyzeView(APIView):
                 'error': f'Server error: {str(e)}'
             }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
     
-    def _handle_file_upload(self, request):
+    def _get_job(self, request):
+        """(job, None) for an optional job_id, or (None, error response)"""
+        from jobs.models import Job
+        
+        job_id = request.query_params.get('job_id', request.data.get('job_id'))
+        if not job_id:
+            return None, None
+        try:
+            return Job.objects.get(id=int(job_id)), None
+        except (TypeError, ValueError):
+            return None, Response({
+                'success': False,
+                'error': 'job_id must be an integer'
+            }, status=status.HTTP_400_BAD_REQUEST)
+        except Job.DoesNotExist:
+            return None, Response({
+                'success': False,
+                'error': 'Job not found'
+            }, status=status.HTTP_404_NOT_FOUND)
+    
+    def _get_mode(self, request):
+        """(mode, None) for the optional analysis mode, or (None, error response)"""
+        mode = request.query_params.get('mode', request.data.get('mode')) or 'full'
+        if mode not in self.ats_builder.ANALYSIS_MODES:
+            return None, Response({
+                'success': False,
+                'error': f"mode must be one of: {', '.join(self.ats_builder.ANALYSIS_MODES)}"
+            }, status=status.HTTP_400_BAD_REQUEST)
+        return mode, None
+    
+    def _wants_async(self, request, default):
+        value = request.query_params.get('async', request.data.get('async'))
+        if value is None:
+            return default
+        return str(value).lower() in ['true', '1', 'yes']
+    
+    def _task_accepted(self, request, task):
+        """202 with the task id and the URL to poll"""
+        payload = task_payload(task)
+        payload['success'] = True
+        payload['status_url'] = request.build_absolute_uri(reverse('ats-analyze-task', args=[task.id]))
+        return Response(payload, status=status.HTTP_202_ACCEPTED)
+    
+    def _request_user(self, request):
+        return request.user if request.user.is_authenticated else None
+    
+    def _handle_file_upload(self, request, async_mode=False, job=None, mode='full'):
         """Handle resume file upload"""
         resume_file = request.FILES['resume_file']
         filename = resume_file.name
         
-        print(f"📁 Processing uploaded file: {filename}")
+        logger.debug("Processing uploaded resume file %s", filename)
         
         # Validate file
         is_valid, error_msg = ResumeFileProcessor.validate_file(resume_file, filename)
@@ -76,29 +147,28 @@ class ResumeATSAnalyzeView(APIView):
                 'error': error_msg
             }, status=status.HTTP_400_BAD_REQUEST)
         
-        # Extract text from file
-        resume_text, file_metadata = ResumeFileProcessor.extract_text_from_file(resume_file, filename)
+        content = resume_file.read()
+        resume_file.seek(0)
         
-        if not file_metadata['success']:
-            return Response({
-                'success': False,
-                'error': f"Failed to extract text from file: {file_metadata.get('error', 'Unknown error')}",
-                'file_metadata': file_metadata
-            }, status=status.HTTP_400_BAD_REQUEST)
+        # Async mode queues the file, unless the same bytes were analyzed before
+        cached = None
+        if async_mode:
+            if job is None:
+                cached = cached_file_analysis(self.ats_builder, sha256_hex(content), filename, mode)
+            if cached is None:
+                return self._task_accepted(request, enqueue_file(resume_file, self._request_user(request), job, mode))
         
-        # Validate extracted text
-        if len(resume_text.strip()) < 50:
+        try:
+            analysis_result, file_metadata = cached or analyze_resume_file(
+                self.ats_builder, content, filename, job=job, mode=mode
+            )
+        except ResumeInputError as e:
             return Response({
                 'success': False,
-                'error': 'Extracted text is too short (minimum 50 characters). The file might be empty or unreadable.',
-                'file_metadata': file_metadata
+                'error': str(e),
+                'file_metadata': e.file_metadata
             }, status=status.HTTP_400_BAD_REQUEST)
         
-        print(f"✅ Extracted {file_metadata['word_count']} words from {filename}")
-        
-        # Analyze the resume
-        analysis_result = self.ats_builder.analyze_resume(resume_text)
-        
         if analysis_result['success']:
             # Add file metadata to response
             analysis_result['file_metadata'] = file_metadata
@@ -111,7 +181,7 @@ class ResumeATSAnalyzeView(APIView):
                 'file_metadata': file_metadata
             }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
     
-    def _handle_text_input(self, request):
+    def _handle_text_input(self, request, async_mode=False, job=None, mode='full'):
         """Handle text input (JSON or form data)"""
         # Get resume text from request
         resume_text = self._extract_text_from_request(request)
@@ -129,8 +199,11 @@ class ResumeATSAnalyzeView(APIView):
                 'error': 'Resume text is too short (minimum 50 characters)'
             }, status=status.HTTP_400_BAD_REQUEST)
         
+        if async_mode:
+            return self._task_accepted(request, enqueue_text(resume_text, self._request_user(request), job, mode))
+        
         # Analyze resume
-        analysis_result = self.ats_builder.analyze_resume(resume_text)
+        analysis_result = self._analyze_cached(resume_text, job, mode)
         
         if analysis_result['success']:
             return Response(analysis_result, status=status.HTTP_200_OK)
@@ -140,6 +213,13 @@ class ResumeATSAnalyzeView(APIView):
                 'error': analysis_result.get('error', 'Analysis failed')
             }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
     
+    def _get_sample_resume(self):
+        return SAMPLE_RESUME
+    
+    def _analyze_cached(self, resume_text, job=None, mode='full'):
+        """analyze_resume, served from the cache when the same text was analyzed before"""
+        return analyze_text_cached(self.ats_builder, resume_text, job, mode)
+    
     def _extract_text_from_request(self, request):
         """Extract resume text from request (JSON or form data)"""
         # Check for JSON data
@@ -175,14 +255,27 @@ class ResumeATSAnalyzeView(APIView):
             'success': True,
             'message': 'Resume ATS Builder API is running',
             'endpoints': {
-                'POST /api/ats-analyze/': 'Analyze a resume (text or file upload)',
-                'GET /api/ats-analyze/?sample=true': 'Get sample analysis'
+                'POST /api/ats-analyze/': 'Analyze a resume (text or file upload); mode=score|summary|full; job_id scores it against a job; async=true queues it and returns a task id',
+                'GET /api/ats-analyze/tasks/<task_id>/?wait=10': 'Poll (or long-poll) an async analysis',
+                'GET /api/ats-analyze/tasks/': 'Async queue depth and latency',
+                'POST /api/ats-analyze/batch/': 'Score all applicants of a job_id, several resume_files or a texts list (scorer=rules|model)',
+                'GET /api/ats-analyze/?sample=true': 'Get sample analysis',
+                'GET /api/ats-analyze/ready/': 'Readiness probe (503 until analyzers are built)'
             },
             'supported_file_formats': ['PDF', 'DOCX', 'DOC', 'TXT'],
             'max_file_size': '5MB',
+            'cache': {
+                'analyzer_version': self.ats_builder.analyzer_version,
+                **analysis_cache.summary()
+            },
+            'job_matchers': self.ats_builder.job_matchers.summary(),
+            'section_cache': self.ats_builder.section_cache.summary() if self.ats_builder.section_cache else None,
+            'extraction_sandbox': analyzers.get('extractor').summary(),
+            'analyzers': analyzers.status(),
+            'queue': queue_stats(),
             'service_info': {
                 'name': 'HireLink Resume ATS Builder',
-                'version': '2.0',
+                'version': self.ats_builder.analyzer_version,
                 'features': [
                     'Resume Quality Scoring (1-5 scale)',
                     'ATS Compatibility Check',
@@ -193,5 +286,226 @@ class ResumeATSAnalyzeView(APIView):
                 ]
             }
         })
+
+
+class ResumeATSReadyView(APIView):
+    """
+    Readiness of the resume analyzers (for load balancer / orchestrator probes)
+    """
+    permission_classes = [AllowAny]
+    
+    def get(self, request):
+        analyzer_status = analyzers.status()
+        return Response(
+            analyzer_status,
+            status=status.HTTP_200_OK if analyzer_status['ready'] else status.HTTP_503_SERVICE_UNAVAILABLE
+        )
+
+
+class ResumeATSTaskView(APIView):
+    """
+    Async resume analysis tasks
+    GET tasks/: queue depth and latency
+    GET tasks/<task_id>/?wait=N: task status, waiting up to N seconds for it to finish
+    """
+    permission_classes = [AllowAny]
+    
+    def get(self, request, task_id=None):
+        if task_id is None:
+            return Response({'success': True, 'queue': queue_stats()})
+        
+        try:
+            wait = min(float(request.query_params.get('wait', 0)), getattr(settings, 'ATS_TASK_LONG_POLL_MAX', 30))
+        except ValueError:
+            return Response({
+                'success': False,
+                'error': 'wait must be a number of seconds'
+            }, status=status.HTTP_400_BAD_REQUEST)
+        
+        try:
+            task = wait_for_task(task_id, timeout=max(wait, 0))
+        except ResumeAnalysisTask.DoesNotExist:
+            return Response({
+                'success': False,
+                'error': 'Task not found'
+            }, status=status.HTTP_404_NOT_FOUND)
+        
+        payload = task_payload(task)
+        payload['success'] = task.status != 'failed'
+        return Response(payload, status=status.HTTP_200_OK)
+
+
+class ResumeATSBatchView(APIView):
+    """
+    Score many resumes in one call (recruiters/admins)
+    1. JSON/form with 'job_id': every resume attached to the job's applications,
+       also scored against the job's skills (job_match) and ranked by that match
+    2. Multipart upload of several 'resume_files'
+    3. JSON with a 'texts' list
+    'scorer': 'rules' (default) or 'model' for the trained models in ml_models/trained_models
+    """
+    parser_classes = [MultiPartParser, FormParser, JSONParser]
+    permission_classes = [IsAuthenticated]
+    
+    def post(self, request):
+        if request.user.role not in ['recruiter', 'admin']:
+            return Response({
+                'success': False,
+                'error': 'Only recruiters or admins can run batch analysis'
+            }, status=status.HTTP_403_FORBIDDEN)
+        
+        scorer = request.data.get('scorer', 'rules')
+        if scorer not in ['rules', 'model']:
+            return Response({
+                'success': False,
+                'error': "scorer must be 'rules' or 'model'"
+            }, status=status.HTTP_400_BAD_REQUEST)
+        
+        start_time = time.time()
+        self.job = None
+        
+        if request.data.get('job_id'):
+            entries, error = self._collect_job_resumes(request)
+        elif request.FILES.getlist('resume_files'):
+            entries, error = self._collect_uploaded_files(request)
+        elif request.data.get('texts'):
+            entries, error = self._collect_texts(request)
+        else:
+            entries, error = None, ('Provide a job_id, resume_files or a texts list', status.HTTP_400_BAD_REQUEST)
+        
+        if error:
+            message, error_status = error
+            return Response({'success': False, 'error': message}, status=error_status)
+        
+        if len(entries) > MAX_BATCH_RESUMES:
+            return Response({
+                'success': False,
+                'error': f'Too many resumes ({len(entries)}). Maximum is {MAX_BATCH_RESUMES} per call.'
+            }, status=status.HTTP_400_BAD_REQUEST)
+        
+        try:
+            # Stored text of files seen before, the others extracted in parallel; plain texts are used as they are
+            files = [(entry['filename'], entry.pop('content')) for entry in entries if 'content' in entry]
+            extracted = iter(extract_file_texts(files))
+            texts = []
+            for entry in entries:
+                if 'filename' in entry and 'text' not in entry:
+                    text, file_metadata = next(extracted)
+                    entry['file_metadata'] = file_metadata
+                    texts.append(text if file_metadata['success'] else '')
+                else:
+                    texts.append(entry.pop('text', ''))
+            
+            if scorer == 'model':
+                # Falls back to the rules when the model files are missing
+                model_engine = analyzers.get('model_engine')
+                scorer = model_engine.scorer
+                results = model_engine.predict(texts)
+            else:
+                results = analyzers.get('batch_analyzer').analyze(texts)
+            
+            if self.job is not None:
+                # One compiled automaton for the whole batch (rebuilt only when the job is edited)
+                job_matcher = analyzers.get('ats_builder').job_matchers.get(self.job)
+                for text, result in zip(texts, results):
+                    if result['success']:
+                        result['job_match'] = job_matcher.match(text)
+        except Exception as e:
+            return Response({
+                'success': False,
+                'error': f'Batch analysis failed: {str(e)}'
+            }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+        
+        for entry, result in zip(entries, results):
+            entry.update(result)
+            if 'error_detail' in entry:
+                entry['error'] = entry.pop('error_detail')
+        
+        # Best resumes first (best match for a job, then quality); failed ones at the end
+        def rank_key(entry):
+            match_score = (entry.get('job_match') or {}).get('match_score')
+            return (match_score if match_score is not None else -1, entry.get('quality_score', -1))
+        entries.sort(key=rank_key, reverse=True)
+        for rank, entry in enumerate(entries, 1):
+            entry['rank'] = rank if entry['success'] else None
+        
+        processing_time = time.time() - start_time
+        logger.info("Batch ATS analysis (%s): %d resumes in %.2fs", scorer, len(entries), processing_time)
+        
+        return Response({
+            'success': True,
+            'scorer': scorer,
+            'count': len(entries),
+            'analyzed': sum(1 for entry in entries if entry['success']),
+            'processing_time': f"{processing_time:.3f}s",
+            'results': entries
+        }, status=status.HTTP_200_OK)
+    
+    def _collect_job_resumes(self, request):
+        """Resumes of every Application / JobApplication of the job"""
+        from jobs.models import Job, JobApplication
+        from applications.models import Application
+        
+        try:
+            job = Job.objects.get(id=int(request.data.get('job_id')))
+        except (Job.DoesNotExist, ValueError, TypeError):
+            return None, ('Job not found', status.HTTP_404_NOT_FOUND)
+        
+        if request.user.role != 'admin' and job.posted_by_id != request.user.id:
+            return None, ('You can only analyze applicants of your own jobs', status.HTTP_403_FORBIDDEN)
+        self.job = job
+        
+        applications = [
+            ('application', application.id, application.candidate, application.resume)
+            for application in Application.objects.filter(job=job).select_related('candidate')
+        ] + [
+            # Fall back to the resume on the candidate's profile
+            ('job_application', application.id, application.applicant, application.resume or application.applicant.resume)
+            for application in JobApplication.objects.filter(job=job).select_related('applicant')
+        ]
+        
+        entries = []
+        for source, application_id, candidate, resume in applications:
+            entry = {
+                'source': source,
+                'application_id': application_id,
+                'candidate': {
+                    'id': candidate.id,
+                    'username': candidate.username,
+                    'full_name': candidate.full_name
+                }
+            }
+            if not resume:
+                entry['text'] = ''
+                entry['error_detail'] = 'No resume attached'
+            else:
+                try:
+                    with resume.open('rb') as resume_file:
+                        entry['content'] = resume_file.read()
+                    entry['filename'] = os.path.basename(resume.name)
+                except (OSError, ValueError) as e:
+                    entry['text'] = ''
+                    entry['error_detail'] = f'Resume file unavailable: {e}'
+            entries.append(entry)
+        
+        return entries, None
+    
+    def _collect_uploaded_files(self, request):
+        entries = []
+        for resume_file in request.FILES.getlist('resume_files'):
+            is_valid, error_msg = ResumeFileProcessor.validate_file(resume_file, resume_file.name)
+            if not is_valid:
+                return None, (f'{resume_file.name}: {error_msg}', status.HTTP_400_BAD_REQUEST)
+            entries.append({'filename': resume_file.name, 'content': resume_file.read()})
+        return entries, None
     
-    
\ No newline at end of file
+    def _collect_texts(self, request):
+        texts = request.data.get('texts')
+        if isinstance(texts, str):
+            try:
+                texts = json.loads(texts)
+            except ValueError:
+                texts = None
+        if not isinstance(texts, list) or not all(isinstance(text, str) for text in texts):
+            return None, ("'texts' must be a list of strings", status.HTTP_400_BAD_REQUEST)
+        return [{'index': i, 'text': text} for i, text in enumerate(texts)], None
@@ -0,0 +1,30 @@
+# Generated by Django 4.2.30 on 2026-10-19 00:12
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('jobs', '0002_candidateskill'),
+        ('applications', '0002_alter_application_job_delete_job'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='notification',
+            name='is_emailed',
+            field=models.BooleanField(default=False),
+        ),
+        migrations.AddField(
+            model_name='notification',
+            name='related_job',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, to='jobs.job'),
+        ),
+        migrations.AlterField(
+            model_name='notification',
+            name='notification_type',
+            field=models.CharField(choices=[('application_status', 'Application Status Update'), ('interview_scheduled', 'Interview Scheduled'), ('interview_reminder', 'Interview Reminder'), ('job_alert', 'New Job Matching Your Skills')], max_length=50),
+        ),
+    ]
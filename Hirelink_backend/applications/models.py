@@ -80,6 +80,7 @@ class Notification(models.Model):
         ('application_status', 'Application Status Update'),
         ('interview_scheduled', 'Interview Scheduled'),
         ('interview_reminder', 'Interview Reminder'),
+        ('job_alert', 'New Job Matching Your Skills'),
     )
     
     user = models.ForeignKey(User, on_delete=models.CASCADE)
@@ -87,7 +88,9 @@ class Notification(models.Model):
     title = models.CharField(max_length=200)
     message = models.TextField()
     related_application = models.ForeignKey(Application, on_delete=models.CASCADE, null=True, blank=True)
+    related_job = models.ForeignKey(Job, on_delete=models.CASCADE, null=True, blank=True)
     is_read = models.BooleanField(default=False)
+    is_emailed = models.BooleanField(default=False)
     created_at = models.DateTimeField(auto_now_add=True)
     
     class Meta:
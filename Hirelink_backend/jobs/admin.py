@@ -1,5 +1,5 @@
 from django.contrib import admin
-from .models import Job, JobApplication, SavedJob
+from .models import Job, JobApplication, SavedJob, CandidateSkill
 
 @admin.register(Job)
 class JobAdmin(admin.ModelAdmin):
@@ -20,4 +20,9 @@ class JobApplicationAdmin(admin.ModelAdmin):
 class SavedJobAdmin(admin.ModelAdmin):
     list_display = ['job', 'user', 'saved_at']
     list_filter = ['saved_at']
-    search_fields = ['job__title', 'user__username']
\ No newline at end of file
+    search_fields = ['job__title', 'user__username']
+
+@admin.register(CandidateSkill)
+class CandidateSkillAdmin(admin.ModelAdmin):
+    list_display = ['skill', 'user']
+    search_fields = ['skill', 'user__username']
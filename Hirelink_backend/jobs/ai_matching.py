@@ -3,15 +3,43 @@ import numpy as np
 import pandas as pd
 from sklearn.neighbors import NearestNeighbors
 from sklearn.preprocessing import LabelEncoder
+from django.conf import settings
 from django.db.models import Q
+from concurrent.futures import ThreadPoolExecutor
+import scipy.sparse as sp
+import functools
+import heapq
 import joblib
+import logging
 import os
 import json
+import threading
+import uuid
+from types import SimpleNamespace
+
+from jobs.collaborative import ImplicitALS
+
+logger = logging.getLogger(__name__)
+
+
+def _holding_updates_lock(method):
+    """Readers of the job arrays wait for job updates, which change them in place"""
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with self._updates_lock:
+            return method(self, *args, **kwargs)
+    return wrapper
+
+# Job attributes _job_vector() reads, as written to the job update log
+JOB_UPDATE_FIELDS = (
+    'id', 'title', 'required_skills', 'preferred_skills', 'location', 'job_type',
+    'experience_level', 'salary_min', 'salary_max', 'is_active'
+)
 
 class AIMatcher:
     """AI Job Matching Service for Django"""
     
-    def __init__(self):
+    def __init__(self, n_shards=1, shard_by='hash'):
         self.model = None
         self.all_skills = []
         self.location_encoder = None
@@ -19,6 +47,38 @@ class AIMatcher:
         self.n_skills = 0
         self.job_ids = None
         self.is_trained = False
+        self.model_version = None
+        
+        # Precomputed job-to-job neighbor lists (row positions into job_ids)
+        self.n_similar = 10
+        self.job_weighted_features = None
+        self.job_neighbors = None
+        self.job_neighbor_distances = None
+        self.job_active = None
+        self.job_index = {}
+        self.job_records = []
+        self.skill_positions = {}
+        self.required_skill_matrix = None
+        self.required_skill_counts = None
+        
+        # Job edits since the saved model was trained, logged next to it (job_updates.jsonl)
+        # so that every process serving the model replays the same updates in the same order
+        self.updates_path = None
+        self._updates_offset = 0
+        # Job updates applied without a log (no saved model yet), counted for job_revision
+        self._unlogged_updates = 0
+        # Replaying the log, applying updates and reading the job arrays: one thread at a time
+        self._updates_lock = threading.RLock()
+        
+        # Optional sharded index: 'hash' (job id), 'job_type' or 'location' partitions
+        self.n_shards = n_shards
+        self.shard_by = shard_by
+        self.shards = []
+        self._shard_executor = None
+        
+        # Collaborative filtering model trained on saved jobs / applications
+        self.cf_model = ImplicitALS()
+        self.cf_weight = 0.3
         
         # Feature weights from your notebook
         self.WEIGHTS = {
@@ -132,7 +192,7 @@ class AIMatcher:
     
     def train_model(self, jobs_df):
         """Train the KNN model on jobs data"""
-        print(f"Training AI model on {len(jobs_df)} jobs...")
+        logger.info("Training AI model on %d jobs", len(jobs_df))
         
         all_skills = set()
         for skills_list in jobs_df['skills']:
@@ -140,7 +200,7 @@ class AIMatcher:
         
         self.all_skills = sorted(list(all_skills))
         self.n_skills = len(self.all_skills)
-        print(f"Found {self.n_skills} unique skills")
+        logger.debug("Found %d unique skills", self.n_skills)
         
         job_skill_vectors = []
         for _, job in jobs_df.iterrows():
@@ -215,18 +275,36 @@ class AIMatcher:
         self.job_skill_vectors = job_skill_vectors
         self.job_features = job_features
         self.jobs_df = jobs_df
+        self.job_weighted_features = job_weighted_features
+        self.job_active = np.ones(len(self.job_ids), dtype=bool)
+        self.job_index = {int(job_id): i for i, job_id in enumerate(self.job_ids)}
+        self.job_records = jobs_df.to_dict('records')
+        self.skill_positions = {skill: i for i, skill in enumerate(self.all_skills)}
+        self._build_required_skill_matrix()
+        self._build_job_neighbors()
+        self.build_shards()
+        self.model_version = uuid.uuid4().hex[:12]
         self.is_trained = True
-        
-        print(f"✅ Model trained successfully!")
-        print(f"   Jobs: {len(jobs_df)}")
-        print(f"   Skills: {self.n_skills}")
-        print(f"   Neighbors: {n_neighbors}")
+        # Updates are logged against saved models only (see save_model)
+        self.updates_path = None
+        self._updates_offset = 0
+        self._unlogged_updates = 0
+        
+        logger.info("AI model trained", extra={
+            'model_version': self.model_version,
+            'jobs': len(jobs_df),
+            'skills': self.n_skills,
+            'neighbors': n_neighbors
+        })
         
         return True
     
     def save_model(self, path='ai_model'):
         """Save the trained model"""
         os.makedirs(path, exist_ok=True)
+        if self.job_revision:
+            # The saved jobs include updates the trained version did not have
+            self.model_version = uuid.uuid4().hex[:12]
         
         model_data = {
             'model': self.model,
@@ -238,11 +316,24 @@ class AIMatcher:
             'job_companies': self.job_companies,
             'n_skills': self.n_skills,
             'jobs_df': self.jobs_df.to_dict('records'),
+            'job_weighted_features': self.job_weighted_features,
+            'job_neighbors': self.job_neighbors,
+            'job_neighbor_distances': self.job_neighbor_distances,
+            'job_active': self.job_active,
+            'required_skill_matrix': self.required_skill_matrix,
+            'required_skill_counts': self.required_skill_counts,
+            'model_version': self.model_version,
             'is_trained': self.is_trained
         }
         
         joblib.dump(model_data, os.path.join(path, 'job_matcher.joblib'))
-        print(f"✅ Model saved to {path}/job_matcher.joblib")
+        # The new model already contains every job edit: start an empty update log
+        self.updates_path = os.path.join(path, 'job_updates.jsonl')
+        with open(self.updates_path, 'w', encoding='utf-8'):
+            pass
+        self._updates_offset = 0
+        self._unlogged_updates = 0
+        logger.info("AI model saved to %s/job_matcher.joblib", path)
     
     def load_model(self, path='ai_model/job_matcher.joblib'):
         """Load a pre-trained model"""
@@ -259,30 +350,54 @@ class AIMatcher:
                 self.job_companies = model_data['job_companies']
                 self.n_skills = model_data['n_skills']
                 self.jobs_df = pd.DataFrame(model_data['jobs_df'])
+                self.job_weighted_features = model_data.get('job_weighted_features')
+                if self.job_weighted_features is None:
+                    # Models saved before the features were stored: the index's own copy
+                    self.job_weighted_features = np.array(self.model._fit_X, dtype=np.float64)
+                self.job_neighbors = model_data.get('job_neighbors')
+                self.job_neighbor_distances = model_data.get('job_neighbor_distances')
+                self.job_active = model_data.get('job_active')
+                if self.job_active is None:
+                    self.job_active = np.ones(len(self.job_ids), dtype=bool)
+                self.job_index = {int(job_id): i for i, job_id in enumerate(self.job_ids)}
+                self.job_records = model_data['jobs_df']
+                self.skill_positions = {skill: i for i, skill in enumerate(self.all_skills)}
+                self.required_skill_matrix = model_data.get('required_skill_matrix')
+                self.required_skill_counts = model_data.get('required_skill_counts')
+                if self.required_skill_matrix is None:
+                    self._build_required_skill_matrix()
+                # Older files have no version: the file's mtime is the same in every worker
+                self.model_version = model_data.get('model_version') or f"{int(os.path.getmtime(path)):x}"
+                if self.job_neighbors is None:
+                    # Models saved before neighbor lists existed
+                    self._build_job_neighbors()
+                self.build_shards()
                 self.is_trained = model_data['is_trained']
                 
-                print(f"✅ Model loaded from {path}")
+                # Optional: blend in collaborative filtering if it has been trained
+                self.cf_model.load(os.path.join(os.path.dirname(path), 'job_cf.joblib'))
+                
+                # Job edits made since this model was saved
+                self.updates_path = os.path.join(os.path.dirname(path), 'job_updates.jsonl')
+                self._updates_offset = 0
+                self._unlogged_updates = 0
+                self.apply_pending_updates()
+                
+                logger.info("AI model %s loaded from %s", self.model_version, path)
                 return True
             except Exception as e:
-                print(f"❌ Error loading model: {e}")
+                logger.error("Error loading AI model from %s: %s", path, e)
                 return False
         else:
-            print(f"❌ Model file not found at {path}")
+            logger.warning("AI model file not found at %s", path)
             return False
     
-    # FIXED METHOD - CORRECT NAME AND LOGIC
-    def get_recommendations_for_candidate(self, candidate, n_recommendations=10):
-        """Get AI-recommended jobs for a candidate - SKILL-FOCUSED"""
-        if not self.is_trained:
-            print("❌ Model not trained!")
-            return []
-        
-        candidate_data = self.prepare_candidate_features(candidate)
-        
+    def _candidate_vector(self, candidate_data):
+        """Weighted feature vector of a prepared candidate"""
         candidate_skill_vector = [0] * self.n_skills
         for skill in candidate_data['skills']:
-            if skill in self.all_skills:
-                candidate_skill_vector[self.all_skills.index(skill)] = 1
+            if skill in self.skill_positions:
+                candidate_skill_vector[self.skill_positions[skill]] = 1
         
         candidate_location = candidate_data['location']
         try:
@@ -299,20 +414,16 @@ class AIMatcher:
         ]
         
         candidate_combined = np.hstack([candidate_skill_vector, candidate_other_features])
-        candidate_weighted = candidate_combined * self.feature_weights
-        
-        n_neighbors = min(n_recommendations * 2, len(self.job_ids))
-        distances, indices = self.model.kneighbors(
-            candidate_weighted.reshape(1, -1), 
-            n_neighbors=n_neighbors
-        )
-        
+        return candidate_combined * self.feature_weights
+    
+    def _build_recommendations(self, candidate_data, distances, indices, n_recommendations):
+        """Turn one row of neighbor distances/indices into ranked recommendations"""
         recommendations = []
         candidate_skills_set = set(candidate_data['skills'])
         
-        for i, (distance, job_idx) in enumerate(zip(distances[0], indices[0])):
+        for i, (distance, job_idx) in enumerate(zip(distances, indices)):
             job_id = int(self.job_ids[job_idx])
-            job_row = self.jobs_df[self.jobs_df['id'] == job_id].iloc[0]
+            job_row = self.job_records[job_idx]
             
             job_skills = job_row['required_skills']
             matching_skills = candidate_skills_set.intersection(set(job_skills))
@@ -348,12 +459,476 @@ class AIMatcher:
             if len(recommendations) >= n_recommendations:
                 break
         
+        # Blend in the collaborative filtering preference when we have factors for the pair
+        if self.cf_model.is_trained:
+            cf_scores = self.cf_model.score(candidate_data['id'], [rec['job_id'] for rec in recommendations])
+            for rec, cf_score in zip(recommendations, cf_scores):
+                rec['cf_score'] = cf_score
+                if cf_score is not None:
+                    rec['match_score'] = float(
+                        (1 - self.cf_weight) * rec['skill_match_percentage'] + self.cf_weight * cf_score * 100
+                    )
+        
         recommendations.sort(key=lambda x: x['match_score'], reverse=True)
         
         for i, rec in enumerate(recommendations):
             rec['rank'] = i + 1
         
         return recommendations
+    
+    # FIXED METHOD - CORRECT NAME AND LOGIC
+    @_holding_updates_lock
+    def get_recommendations_for_candidate(self, candidate, n_recommendations=10):
+        """Get AI-recommended jobs for a candidate - SKILL-FOCUSED"""
+        if not self.is_trained:
+            logger.warning("AI model not trained")
+            return []
+        
+        candidate_data = self.prepare_candidate_features(candidate)
+        candidate_weighted = self._candidate_vector(candidate_data)
+        
+        n_neighbors = min(n_recommendations * 2, self.model.n_samples_fit_)
+        if self.shards:
+            distances, indices = self.sharded_kneighbors(candidate_weighted, n_neighbors)
+        else:
+            distances, indices = self.model.kneighbors(
+                candidate_weighted.reshape(1, -1), 
+                n_neighbors=n_neighbors
+            )
+        
+        return self._build_recommendations(candidate_data, distances[0], indices[0], n_recommendations)
+    
+    @_holding_updates_lock
+    def get_recommendations_for_candidates(self, candidates, n_recommendations=10):
+        """
+        Batch version for exports: one kneighbors call for the whole batch.
+        Returns a list of (candidate, recommendations) in input order.
+        """
+        if not self.is_trained or not candidates:
+            return [(candidate, []) for candidate in candidates]
+        
+        candidates_data = [self.prepare_candidate_features(candidate) for candidate in candidates]
+        vectors = np.vstack([self._candidate_vector(data) for data in candidates_data])
+        
+        n_neighbors = min(n_recommendations * 2, self.model.n_samples_fit_)
+        if self.shards:
+            neighbors = [self.sharded_kneighbors(vector, n_neighbors) for vector in vectors]
+            distances = [d[0] for d, _ in neighbors]
+            indices = [i[0] for _, i in neighbors]
+        else:
+            distances, indices = self.model.kneighbors(vectors, n_neighbors=n_neighbors)
+        
+        return [
+            (candidate, self._build_recommendations(data, distances[i], indices[i], n_recommendations))
+            for i, (candidate, data) in enumerate(zip(candidates, candidates_data))
+        ]
+
+    # DEEP RANKING - whole ranked list per candidate, cached and paged by the views
+    @property
+    def job_revision(self):
+        """
+        Job updates applied to this model version: the position reached in the update
+        log, the same in every process that replayed it (a local count without a log)
+        """
+        if self.updates_path is not None:
+            return self._updates_offset
+        return self._unlogged_updates
+    
+    @property
+    def ranking_version(self):
+        """Changes whenever a retrained or reloaded model, or a job edit, may rank jobs differently"""
+        version = f"{self.model_version}+{self.job_revision}" if self.job_revision else self.model_version
+        if self.cf_model.is_trained and self.cf_model.version:
+            return f"{version}.{self.cf_model.version}"
+        return version
+    
+    def _required_skill_rows(self, skill_lists):
+        """(job x skill csr matrix, counts) of required skill lists, to score every job at once"""
+        indptr, indices, counts = [0], [], []
+        for job_skills in skill_lists:
+            positions = {self.skill_positions[skill] for skill in job_skills if skill in self.skill_positions}
+            indices.extend(sorted(positions))
+            indptr.append(len(indices))
+            counts.append(len(job_skills))
+        matrix = sp.csr_matrix(
+            (np.ones(len(indices), dtype=np.float64), indices, indptr),
+            shape=(len(counts), self.n_skills)
+        )
+        return matrix, np.array(counts, dtype=np.float64)
+    
+    def _build_required_skill_matrix(self):
+        """Required skills of every job row, from the training records"""
+        n_jobs = self.model.n_samples_fit_
+        skill_lists = [job_row['required_skills'] for job_row in self.job_records[:n_jobs]]
+        # Rows added by job updates before the model was saved have no training record
+        skill_lists += [[]] * (len(self.job_ids) - n_jobs)
+        self.required_skill_matrix, self.required_skill_counts = self._required_skill_rows(skill_lists)
+    
+    def _set_required_skills(self, row, job_skills):
+        """Required skills of one job row (appended when row is the next new row)"""
+        new_row, new_count = self._required_skill_rows([job_skills])
+        matrix = self.required_skill_matrix
+        # New arrays, each published with one assignment
+        self.required_skill_matrix = sp.vstack([matrix[:row], new_row, matrix[row + 1:]], format='csr')
+        self.required_skill_counts = np.concatenate([
+            self.required_skill_counts[:row], new_count, self.required_skill_counts[row + 1:]
+        ])
+    
+    @_holding_updates_lock
+    def rank_jobs_for_candidate(self, candidate, max_results=500):
+        """
+        Full ranking behind the paginated recommendations: every active job with
+        at least one matching required skill, nearest first, capped at max_results.
+        Same distances and scores as get_recommendations_for_candidate, returned as
+        compact arrays so the list can be cached and sliced page by page.
+        Jobs added or edited by update_job are ranked with their current features
+        and required skills.
+        """
+        if not self.is_trained:
+            return None
+        
+        candidate_data = self.prepare_candidate_features(candidate)
+        query = self._candidate_vector(candidate_data)
+        
+        features = self.job_weighted_features
+        n_jobs = len(features)
+        sq_distances = np.einsum('ij,ij->i', features, features) - 2.0 * (features @ query) + query @ query
+        
+        candidate_skills = np.zeros(self.n_skills)
+        for skill in set(candidate_data['skills']):
+            if skill in self.skill_positions:
+                candidate_skills[self.skill_positions[skill]] = 1
+        matches = self.required_skill_matrix @ candidate_skills
+        skill_match = np.divide(
+            matches, self.required_skill_counts,
+            out=np.zeros(n_jobs), where=self.required_skill_counts > 0
+        ) * 100
+        
+        rows = np.flatnonzero(self.job_active & (skill_match > 0))
+        if len(rows) > max_results:
+            rows = rows[np.argpartition(sq_distances[rows], max_results - 1)[:max_results]]
+        rows = rows[np.lexsort((rows, sq_distances[rows]))]
+        
+        job_ids = np.asarray(self.job_ids[rows], dtype=np.int64)
+        scores = skill_match[rows]
+        if self.cf_model.is_trained:
+            cf_scores = self.cf_model.score_array(candidate_data['id'], job_ids)
+            known = ~np.isnan(cf_scores)
+            scores = np.where(
+                known,
+                (1 - self.cf_weight) * scores + self.cf_weight * np.nan_to_num(cf_scores) * 100,
+                scores
+            )
+        
+        return {
+            'version': self.ranking_version,
+            'job_ids': job_ids,
+            'scores': scores.astype(np.float32),
+            'skill_match': skill_match[rows].astype(np.float32)
+        }
+
+    # SIMILAR JOBS - precomputed neighbor lists, kept up to date incrementally
+    def _build_job_neighbors(self):
+        """Precompute the k nearest jobs of every job in the fitted index"""
+        n_jobs = self.model.n_samples_fit_
+        k = min(self.n_similar, n_jobs - 1)
+        
+        self.job_neighbors = np.full((n_jobs, self.n_similar), -1, dtype=np.int32)
+        self.job_neighbor_distances = np.full((n_jobs, self.n_similar), np.inf, dtype=np.float32)
+        
+        if k > 0:
+            # Querying without X excludes each job from its own neighbor list
+            distances, indices = self.model.kneighbors(n_neighbors=k)
+            self.job_neighbors[:, :k] = indices
+            self.job_neighbor_distances[:, :k] = distances
+    
+    def _job_vector(self, job):
+        """Weighted feature vector for a single Job, using the fitted encoders"""
+        skill_vector = np.zeros(self.n_skills)
+        skills = set(self.extract_skills(job.required_skills) + self.extract_skills(job.preferred_skills))
+        for skill in skills:
+            if skill in self.skill_positions:
+                skill_vector[self.skill_positions[skill]] = 1
+        
+        try:
+            location_encoded = self.location_encoder.transform([job.location or 'Unknown'])[0]
+        except:
+            location_encoded = 0
+        
+        is_remote = 'remote' in str(job.job_type).lower() or 'remote' in job.title.lower()
+        other_features = [
+            float(self.EXPERIENCE_MAP.get(str(job.experience_level or 'mid').lower().strip(), 3)),
+            float(location_encoded),
+            float(self.clean_salary(job.salary_min, job.salary_max) / 1000.0),
+            float(int(is_remote)),
+            float(self.JOB_TYPE_MAP.get(str(job.job_type or 'full_time').lower().strip(), 1))
+        ]
+        
+        return np.hstack([skill_vector, other_features]) * self.feature_weights
+    
+    def _recompute_neighbor_rows(self, rows, chunk_size=256):
+        """Recompute the neighbor lists of the given rows against all active jobs"""
+        if len(rows) == 0:
+            return
+        
+        features = self.job_weighted_features
+        k = min(self.n_similar, len(self.job_ids))
+        sq_norms = np.einsum('ij,ij->i', features, features)
+        
+        for start in range(0, len(rows), chunk_size):
+            chunk = rows[start:start + chunk_size]
+            # ||a||^2 - 2a.b + ||b||^2: a chunk x n_jobs matrix, never chunk x n_jobs x n_features
+            sq_distances = sq_norms[chunk, None] - 2.0 * (features[chunk] @ features.T) + sq_norms[None, :]
+            distances = np.sqrt(np.maximum(sq_distances, 0.0))
+            distances[:, ~self.job_active] = np.inf
+            distances[np.arange(len(chunk)), chunk] = np.inf
+            
+            # k nearest per row, then ordered by distance (ties by row position)
+            nearest = np.sort(np.argpartition(distances, k - 1, axis=1)[:, :k], axis=1)
+            order = np.argsort(np.take_along_axis(distances, nearest, axis=1), axis=1, kind='stable')
+            nearest = np.take_along_axis(nearest, order, axis=1)
+            nearest_distances = np.take_along_axis(distances, nearest, axis=1)
+            
+            self.job_neighbors[chunk] = -1
+            self.job_neighbor_distances[chunk] = np.inf
+            self.job_neighbors[chunk, :k] = np.where(np.isfinite(nearest_distances), nearest, -1)
+            self.job_neighbor_distances[chunk, :k] = nearest_distances
+    
+    def update_job(self, job):
+        """
+        Insert or refresh one job in the neighbor lists without retraining.
+        The candidate-matching index itself is only rebuilt by train_model.
+        With a saved model the update goes through the update log, so every
+        process serving the model (and the next one to load it) applies it too.
+        """
+        if not self.is_trained or self.job_weighted_features is None:
+            return False
+        
+        entry = {'op': 'update', 'job': {field: getattr(job, field, None) for field in JOB_UPDATE_FIELDS}}
+        if self._log_update(entry):
+            self.apply_pending_updates()
+            return True
+        with self._updates_lock:
+            updated = self._apply_job_update(job)
+            self._unlogged_updates += updated
+            return updated
+    
+    def remove_job(self, job_id):
+        """Drop a deleted or deactivated job from every neighbor list (logged like update_job)"""
+        if not self.is_trained or self.job_weighted_features is None:
+            return False
+        
+        if self._log_update({'op': 'remove', 'job_id': int(job_id)}):
+            self.apply_pending_updates()
+            return True
+        with self._updates_lock:
+            removed = self._apply_job_removal(job_id)
+            self._unlogged_updates += removed
+            return removed
+    
+    def _log_update(self, entry):
+        """Append a job update to the update log; False when there is no saved model to log against"""
+        if self.updates_path is None:
+            return False
+        entry = {'model_version': self.model_version, **entry}
+        line = json.dumps(entry, separators=(',', ':'), default=float) + '\n'
+        try:
+            # One write of one line in append mode: lines of concurrent writers never interleave
+            with open(self.updates_path, 'a', encoding='utf-8') as log:
+                log.write(line)
+            return True
+        except OSError as e:
+            logger.warning("Could not log job update to %s: %s", self.updates_path, e)
+            return False
+    
+    def apply_pending_updates(self):
+        """
+        Replay the job updates logged since this process last looked, in log
+        order (its own included). Returns the number of entries applied.
+        Reading, applying and advancing the offset happen under one lock, so
+        threads sharing the matcher never apply an entry twice.
+        """
+        if self.updates_path is None or not self.is_trained:
+            return 0
+        with self._updates_lock:
+            try:
+                size = os.path.getsize(self.updates_path)
+            except OSError:
+                return 0
+            if size < self._updates_offset:
+                # Log restarted by a retrain: its entries belong to the new model version
+                self._updates_offset = 0
+            if size == self._updates_offset:
+                return 0
+            
+            with open(self.updates_path, 'rb') as log:
+                log.seek(self._updates_offset)
+                data = log.read(size - self._updates_offset)
+            # Only whole lines: the last one may still be being written
+            end = data.rfind(b'\n') + 1
+            applied = 0
+            for line in data[:end].splitlines():
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    continue
+                if entry.get('model_version') != self.model_version:
+                    continue
+                if entry['op'] == 'remove':
+                    self._apply_job_removal(entry['job_id'])
+                else:
+                    self._apply_job_update(SimpleNamespace(**entry['job']))
+                applied += 1
+            self._updates_offset += end
+            return applied
+    
+    def _apply_job_update(self, job):
+        if not job.is_active:
+            return self._apply_job_removal(job.id)
+        
+        vector = self._job_vector(job)
+        row = self.job_index.get(job.id)
+        
+        if row is None:
+            # New job: grow the arrays by one row
+            row = len(self.job_ids)
+            self.job_ids = np.append(self.job_ids, job.id)
+            self.job_weighted_features = np.vstack([self.job_weighted_features, vector])
+            self.job_active = np.append(self.job_active, True)
+            self.job_neighbors = np.vstack([
+                self.job_neighbors, np.full((1, self.n_similar), -1, dtype=np.int32)
+            ])
+            self.job_neighbor_distances = np.vstack([
+                self.job_neighbor_distances, np.full((1, self.n_similar), np.inf, dtype=np.float32)
+            ])
+            self.job_index[job.id] = row
+        else:
+            self.job_weighted_features[row] = vector
+            self.job_active[row] = True
+        self._set_required_skills(row, self.extract_skills(job.required_skills))
+        
+        # Lists that contained this job hold a stale distance: recompute them fully
+        stale_rows = np.flatnonzero((self.job_neighbors == row).any(axis=1))
+        self._recompute_neighbor_rows(np.union1d(stale_rows, [row]).astype(np.intp))
+        
+        # Every other list only needs the job inserted if it is now closer than its worst entry
+        distances = np.sqrt(((self.job_weighted_features - vector) ** 2).sum(axis=1))
+        closer = np.flatnonzero(
+            self.job_active & (distances < self.job_neighbor_distances[:, -1])
+        )
+        
+        skip = set(stale_rows.tolist()) | {row}
+        for other in closer:
+            if other in skip:
+                continue
+            position = np.searchsorted(self.job_neighbor_distances[other], distances[other], side='right')
+            self.job_neighbors[other, position + 1:] = self.job_neighbors[other, position:-1]
+            self.job_neighbor_distances[other, position + 1:] = self.job_neighbor_distances[other, position:-1]
+            self.job_neighbors[other, position] = row
+            self.job_neighbor_distances[other, position] = distances[other]
+        
+        return True
+    
+    def _apply_job_removal(self, job_id):
+        row = self.job_index.get(job_id)
+        if row is None:
+            return False
+        
+        self.job_active[row] = False
+        self.job_neighbors[row] = -1
+        self.job_neighbor_distances[row] = np.inf
+        
+        stale_rows = np.flatnonzero((self.job_neighbors == row).any(axis=1))
+        self._recompute_neighbor_rows(stale_rows)
+        return True
+    
+    @_holding_updates_lock
+    def get_similar_jobs(self, job_id, n_similar=None):
+        """Return [(job_id, distance), ...] from the precomputed neighbor list"""
+        row = self.job_index.get(job_id)
+        if not self.is_trained or row is None or self.job_neighbors is None:
+            return []
+        
+        n_similar = min(n_similar or self.n_similar, self.n_similar)
+        similar = []
+        for neighbor, distance in zip(self.job_neighbors[row, :n_similar], self.job_neighbor_distances[row, :n_similar]):
+            if neighbor < 0:
+                break
+            similar.append((int(self.job_ids[neighbor]), float(distance)))
+        return similar
+
+    # SHARDED INDEX - partitions scanned in parallel, per-shard top-k merged with a heap
+    def _shard_keys(self, rows):
+        """Shard number of each fitted row"""
+        if self.shard_by == 'hash':
+            return (np.asarray(self.job_ids[rows], dtype=np.int64) % self.n_shards).astype(np.intp)
+        
+        column = self.jobs_df[self.shard_by].astype(str).str.lower().values[rows]
+        groups = {value: i % self.n_shards for i, value in enumerate(sorted(set(column)))}
+        return np.array([groups[value] for value in column], dtype=np.intp)
+    
+    def build_shards(self, n_shards=None, shard_by=None):
+        """
+        Partition the fitted index into shards; a single shard means the plain KNN model.
+        Shards hold the same vectors as the fitted index and, like it, only change on
+        retraining: job updates never touch them, so sharding changes speed, not results.
+        """
+        if n_shards is not None:
+            self.n_shards = n_shards
+        if shard_by is not None:
+            self.shard_by = shard_by
+        
+        self.shards = []
+        if self.n_shards <= 1 or self.model is None:
+            return
+        
+        rows = np.arange(self.model.n_samples_fit_)
+        keys = self._shard_keys(rows)
+        fitted = self.model._fit_X
+        for shard in range(self.n_shards):
+            shard_rows = rows[keys == shard]
+            features = np.ascontiguousarray(fitted[shard_rows], dtype=np.float64)
+            self.shards.append({
+                'rows': shard_rows,
+                'features': features,
+                'sq_norms': np.einsum('ij,ij->i', features, features)
+            })
+        
+        if self._shard_executor is None:
+            self._shard_executor = ThreadPoolExecutor(
+                max_workers=os.cpu_count() or 1, thread_name_prefix='matcher-shard'
+            )
+    
+    def _search_shard(self, shard, query, query_sq_norm, k):
+        """Top-k of one shard as sorted (distance, row) pairs; the matmul releases the GIL"""
+        data = self.shards[shard]
+        if len(data['rows']) == 0:
+            return []
+        
+        sq_distances = data['sq_norms'] - 2.0 * (data['features'] @ query) + query_sq_norm
+        k = min(k, len(sq_distances))
+        nearest = np.argpartition(sq_distances, k - 1)[:k]
+        nearest = nearest[np.argsort(sq_distances[nearest], kind='stable')]
+        distances = np.sqrt(np.maximum(sq_distances[nearest], 0.0))
+        return list(zip(distances.tolist(), data['rows'][nearest].tolist()))
+    
+    def sharded_kneighbors(self, query, n_neighbors):
+        """Same output shape as NearestNeighbors.kneighbors for one query vector"""
+        query = np.asarray(query, dtype=np.float64)
+        query_sq_norm = float(query @ query)
+        
+        results = self._shard_executor.map(
+            lambda shard: self._search_shard(shard, query, query_sq_norm, n_neighbors),
+            range(len(self.shards))
+        )
+        merged = list(heapq.merge(*results))[:n_neighbors]
+        
+        distances = np.array([[distance for distance, _ in merged]])
+        indices = np.array([[row for _, row in merged]], dtype=np.intp)
+        return distances, indices
 
 # Global instance
-ai_matcher = AIMatcher()
\ No newline at end of file
+ai_matcher = AIMatcher(
+    n_shards=getattr(settings, 'AI_MATCHER_SHARDS', 1),
+    shard_by=getattr(settings, 'AI_MATCHER_SHARD_BY', 'hash')
+)
\ No newline at end of file
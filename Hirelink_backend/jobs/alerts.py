@@ -0,0 +1,211 @@
+# jobs/alerts.py - Job alert fan-out to candidates with matching skills
+from concurrent.futures import ThreadPoolExecutor
+from django.conf import settings
+from django.core.mail import EmailMessage, get_connection
+from django.db import connection, transaction
+
+from .models import Job, CandidateSkill, PendingJobAlert
+import logging
+
+logger = logging.getLogger(__name__)
+
+ALERT_BATCH_SIZE = 1000
+
+# One background thread of the web process that saved the job: alerts are delivered
+# in posting order, outside the request, but they still share that process's CPU and
+# DB connections. A fan-out the thread never finished (worker recycled) stays in
+# PendingJobAlert for `manage.py send_job_alerts --pending`. With
+# JOB_ALERTS_IN_PROCESS = False the web process only records PendingJobAlert and
+# that command (run from cron) does every fan-out.
+_alert_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='job-alerts')
+
+
+def normalize_skills(skills_string):
+    """Same normalization as the matcher: comma-separated, stripped, lower-case"""
+    if not skills_string:
+        return set()
+    return {skill.strip().lower()[:100] for skill in skills_string.split(',') if skill.strip()}
+
+
+def index_candidate_skills(user):
+    """
+    Bring the indexed skills of one user in line with CustomUser.skills (only
+    candidates are indexed). Most saves leave the skills alone: those only read
+    the stored index, and only added or removed skills are written.
+    """
+    wanted = normalize_skills(user.skills) if user.role == 'candidate' else set()
+    indexed = set(CandidateSkill.objects.filter(user=user).values_list('skill', flat=True))
+    if wanted == indexed:
+        return
+    with transaction.atomic():
+        CandidateSkill.objects.filter(user=user, skill__in=indexed - wanted).delete()
+        CandidateSkill.objects.bulk_create(
+            [CandidateSkill(skill=skill, user=user) for skill in wanted - indexed],
+            ignore_conflicts=True
+        )
+
+
+def rebuild_skill_index(batch_size=ALERT_BATCH_SIZE):
+    """Rebuild the whole candidate skill index from CustomUser.skills"""
+    from users.models import CustomUser
+
+    CandidateSkill.objects.all().delete()
+
+    rows = []
+    total = 0
+    candidates = CustomUser.objects.filter(role='candidate').exclude(skills='').values_list('id', 'skills')
+    for user_id, skills in candidates.iterator(chunk_size=batch_size):
+        rows.extend(CandidateSkill(skill=skill, user_id=user_id) for skill in normalize_skills(skills))
+        if len(rows) >= batch_size:
+            CandidateSkill.objects.bulk_create(rows, batch_size=batch_size)
+            total += len(rows)
+            rows = []
+
+    CandidateSkill.objects.bulk_create(rows, batch_size=batch_size)
+    return total + len(rows)
+
+
+def matching_candidate_ids(job):
+    """
+    Candidates sharing at least one skill with the job. The lookup walks the
+    skill index, so its cost grows with the number of matches, not of candidates.
+    """
+    skills = normalize_skills(job.required_skills) | normalize_skills(job.preferred_skills)
+    if not skills:
+        return CandidateSkill.objects.none().values_list('user_id', flat=True)
+
+    return (
+        CandidateSkill.objects
+        .filter(skill__in=skills)
+        .exclude(user_id=job.posted_by_id)
+        .values_list('user_id', flat=True)
+        .distinct()
+        .order_by('user_id')
+    )
+
+
+def fan_out_job_alert(job_id, batch_size=ALERT_BATCH_SIZE):
+    """Write one job_alert Notification per matching candidate, in batches"""
+    from applications.models import Notification
+
+    try:
+        job = Job.objects.get(id=job_id, is_active=True)
+    except Job.DoesNotExist:
+        PendingJobAlert.objects.filter(job_id=job_id).delete()
+        return 0
+
+    # Re-running for the same job must not notify anyone twice
+    already_notified = set(
+        Notification.objects.filter(related_job=job, notification_type='job_alert')
+        .values_list('user_id', flat=True)
+    )
+
+    title = 'New job matching your skills'
+    message = f"{job.title} at {job.company} ({job.location}) matches your skills"
+
+    created = 0
+    batch = []
+    for user_id in matching_candidate_ids(job).iterator(chunk_size=batch_size):
+        if user_id in already_notified:
+            continue
+        batch.append(Notification(
+            user_id=user_id,
+            notification_type='job_alert',
+            title=title,
+            message=message,
+            related_job=job
+        ))
+        if len(batch) >= batch_size:
+            Notification.objects.bulk_create(batch)
+            created += len(batch)
+            batch = []
+
+    if batch:
+        Notification.objects.bulk_create(batch)
+        created += len(batch)
+
+    PendingJobAlert.objects.filter(job=job).delete()
+    logger.info("Job alert for job %s: %s candidates notified", job_id, created)
+    return created
+
+
+def _run_fan_out(job_id):
+    try:
+        fan_out_job_alert(job_id)
+    except Exception as e:
+        logger.error("Job alert fan-out failed for job %s: %s", job_id, e)
+    finally:
+        # Worker threads must not keep their own DB connection open
+        connection.close()
+
+
+def queue_job_alert(job_id):
+    """Record the pending fan-out with the job, and run it once the job's transaction has committed (unless left to the command)"""
+    if not getattr(settings, 'JOB_ALERTS_ENABLED', True):
+        return
+    PendingJobAlert.objects.get_or_create(job_id=job_id)
+    if getattr(settings, 'JOB_ALERTS_IN_PROCESS', True):
+        transaction.on_commit(lambda: _alert_executor.submit(_run_fan_out, job_id))
+
+
+def fan_out_pending_alerts():
+    """Finish the fan-outs recorded in PendingJobAlert; (jobs, notifications created)"""
+    job_ids = list(PendingJobAlert.objects.order_by('created_at').values_list('job_id', flat=True))
+    return len(job_ids), sum(fan_out_job_alert(job_id) for job_id in job_ids)
+
+
+def send_alert_digests(batch_size=ALERT_BATCH_SIZE):
+    """Email every candidate one digest of their job alerts not emailed yet"""
+    from applications.models import Notification
+
+    pending = (
+        Notification.objects
+        .filter(notification_type='job_alert', is_emailed=False, user__email__gt='')
+        .select_related('user', 'related_job')
+        .order_by('user_id', '-created_at')
+    )
+
+    sent = 0
+    digests = []
+    current_user, lines, ids = None, [], []
+
+    def flush_user():
+        if current_user is not None and lines:
+            body = "New jobs matching your skills on HireLink:\n\n" + "\n".join(lines)
+            body += f"\n\nSee all offers: {getattr(settings, 'FRONTEND_URL', '')}/jobs"
+            message = EmailMessage('Your HireLink job alerts', body, settings.DEFAULT_FROM_EMAIL, [current_user.email])
+            digests.append((message, ids))
+
+    # Raises when the mail server cannot be reached: nothing is marked as emailed then
+    with get_connection(fail_silently=False) as mail_connection:
+        for notification in pending.iterator(chunk_size=batch_size):
+            if current_user is None or notification.user_id != current_user.id:
+                flush_user()
+                current_user, lines, ids = notification.user, [], []
+                if len(digests) >= batch_size:
+                    sent += _send_digests(mail_connection, digests)
+                    digests = []
+            lines.append(f"- {notification.message}")
+            ids.append(notification.id)
+
+        flush_user()
+        sent += _send_digests(mail_connection, digests)
+
+    return sent
+
+
+def _send_digests(mail_connection, digests):
+    """Send (message, notification_ids) digests; only the delivered ones are marked as emailed"""
+    from applications.models import Notification
+
+    sent, delivered = 0, []
+    for message, ids in digests:
+        try:
+            if mail_connection.send_messages([message]):
+                sent += 1
+                delivered.extend(ids)
+        except Exception as e:
+            # Left pending for the next run
+            logger.warning("Job alert digest to %s failed: %s", message.to[0], e)
+    Notification.objects.filter(id__in=delivered).update(is_emailed=True)
+    return sent
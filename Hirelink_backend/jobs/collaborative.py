@@ -0,0 +1,189 @@
+# jobs/collaborative.py
+import numpy as np
+import scipy.sparse as sp
+import joblib
+import os
+import uuid
+
+
+class ImplicitALS:
+    """
+    Matrix factorization recommender for implicit feedback (saved jobs, applications).
+    Alternating least squares as in Hu, Koren & Volinsky: every interaction is a
+    positive preference whose confidence grows with its weight. Each half-step is
+    solved approximately with conjugate gradient, which keeps training linear in
+    the number of interactions.
+    """
+
+    def __init__(self, factors=32, regularization=0.1, alpha=20.0, iterations=10, random_state=42):
+        self.factors = factors
+        self.regularization = regularization
+        self.alpha = alpha
+        self.iterations = iterations
+        self.random_state = random_state
+
+        self.user_factors = None
+        self.job_factors = None
+        self.user_index = {}
+        self.job_index = {}
+        self.version = None
+        self.is_trained = False
+
+    def build_matrix(self, user_ids, job_ids, weights):
+        """Build the sparse user x job interaction matrix, summing duplicate pairs"""
+        user_ids = np.asarray(user_ids, dtype=np.int64)
+        job_ids = np.asarray(job_ids, dtype=np.int64)
+        weights = np.asarray(weights, dtype=np.float32)
+
+        unique_users, user_rows = np.unique(user_ids, return_inverse=True)
+        unique_jobs, job_cols = np.unique(job_ids, return_inverse=True)
+
+        matrix = sp.csr_matrix(
+            (weights, (user_rows, job_cols)),
+            shape=(len(unique_users), len(unique_jobs)),
+            dtype=np.float32
+        )
+        matrix.sum_duplicates()
+
+        self.user_index = {int(user_id): i for i, user_id in enumerate(unique_users)}
+        self.job_index = {int(job_id): i for i, job_id in enumerate(unique_jobs)}
+        return matrix
+
+    def _least_squares_cg(self, confidence, current, fixed, steps=3):
+        """
+        Update every row of `current` against the fixed factor matrix with a few
+        conjugate-gradient steps (Takacs et al.), warm-started from the previous
+        iteration. All rows are advanced together: the only per-interaction work
+        is one gathered dot product and one sparse x dense product per step.
+        """
+        indptr, indices, data = confidence.indptr, confidence.indices, confidence.data
+        rows = np.repeat(np.arange(confidence.shape[0]), np.diff(indptr))
+        extra = data - 1.0  # confidence above the implicit baseline of 1
+        y = fixed[indices]
+        yty = fixed.T @ fixed + self.regularization * np.eye(self.factors, dtype=fixed.dtype)
+
+        def apply(vectors):
+            # (YtY + reg*I + Y^T (C_u - I) Y) x_u for every row u at once
+            weights = extra * np.einsum('ij,ij->i', vectors[rows], y)
+            scaled = sp.csr_matrix((weights, indices, indptr), shape=confidence.shape)
+            return vectors @ yty + scaled @ fixed
+
+        x = current.copy()
+        residual = confidence @ fixed - apply(x)  # b_u = sum_i c_ui y_i
+        direction = residual.copy()
+        rs_old = np.einsum('ij,ij->i', residual, residual)
+
+        for _ in range(steps):
+            a_direction = apply(direction)
+            denominator = np.einsum('ij,ij->i', direction, a_direction)
+            step = np.divide(rs_old, denominator, out=np.zeros_like(rs_old), where=denominator > 0)
+            x += step[:, None] * direction
+            residual -= step[:, None] * a_direction
+            rs_new = np.einsum('ij,ij->i', residual, residual)
+            beta = np.divide(rs_new, rs_old, out=np.zeros_like(rs_new), where=rs_old > 0)
+            direction = residual + beta[:, None] * direction
+            rs_old = rs_new
+
+        return x
+
+    def fit(self, user_ids, job_ids, weights):
+        """Train user and job factors from (user_id, job_id, weight) interaction triples"""
+        matrix = self.build_matrix(user_ids, job_ids, weights)
+
+        confidence = matrix.copy()
+        confidence.data = 1.0 + self.alpha * confidence.data
+        confidence_t = confidence.T.tocsr()
+
+        rng = np.random.default_rng(self.random_state)
+        users = rng.normal(0, 0.01, (matrix.shape[0], self.factors)).astype(np.float32)
+        jobs = rng.normal(0, 0.01, (matrix.shape[1], self.factors)).astype(np.float32)
+
+        for _ in range(self.iterations):
+            users = self._least_squares_cg(confidence, users, jobs)
+            jobs = self._least_squares_cg(confidence_t, jobs, users)
+
+        self.user_factors = users
+        self.job_factors = jobs
+        self.version = uuid.uuid4().hex[:12]
+        self.is_trained = True
+        return self
+
+    def score(self, user_id, job_ids):
+        """
+        Dot-product preference of one user for each job id (None when unknown).
+        Scores are clipped to [0, 1], the range implicit preferences are fit to.
+        """
+        row = self.user_index.get(user_id)
+        if not self.is_trained or row is None:
+            return [None] * len(job_ids)
+
+        scores = []
+        user_vector = self.user_factors[row]
+        for job_id in job_ids:
+            col = self.job_index.get(job_id)
+            if col is None:
+                scores.append(None)
+            else:
+                scores.append(float(np.clip(self.job_factors[col] @ user_vector, 0.0, 1.0)))
+        return scores
+
+    def score_array(self, user_id, job_ids):
+        """Vectorized score(): float32 array with NaN for unknown users or jobs"""
+        scores = np.full(len(job_ids), np.nan, dtype=np.float32)
+        row = self.user_index.get(user_id)
+        if not self.is_trained or row is None:
+            return scores
+
+        cols = np.array([self.job_index.get(int(job_id), -1) for job_id in job_ids], dtype=np.intp)
+        known = cols >= 0
+        scores[known] = np.clip(self.job_factors[cols[known]] @ self.user_factors[row], 0.0, 1.0)
+        return scores
+
+    def save(self, path='ai_model'):
+        os.makedirs(path, exist_ok=True)
+        joblib.dump({
+            'factors': self.factors,
+            'user_factors': self.user_factors,
+            'job_factors': self.job_factors,
+            'user_ids': np.array(list(self.user_index), dtype=np.int64),
+            'job_ids': np.array(list(self.job_index), dtype=np.int64),
+            'version': self.version,
+        }, os.path.join(path, 'job_cf.joblib'))
+
+    def load(self, path='ai_model/job_cf.joblib'):
+        if not os.path.exists(path):
+            return False
+
+        model_data = joblib.load(path)
+        self.factors = model_data['factors']
+        self.user_factors = model_data['user_factors']
+        self.job_factors = model_data['job_factors']
+        self.user_index = {int(user_id): i for i, user_id in enumerate(model_data['user_ids'])}
+        self.job_index = {int(job_id): i for i, job_id in enumerate(model_data['job_ids'])}
+        self.version = model_data.get('version') or f"{int(os.path.getmtime(path)):x}"
+        self.is_trained = True
+        return True
+
+
+def collect_interactions():
+    """
+    Gather implicit feedback from the database as (user_ids, job_ids, weights).
+    Applying is a stronger signal than saving a job.
+    """
+    from jobs.models import SavedJob, JobApplication
+    from applications.models import Application
+
+    sources = [
+        (SavedJob.objects.values_list('user_id', 'job_id'), 1.0),
+        (JobApplication.objects.values_list('applicant_id', 'job_id'), 3.0),
+        (Application.objects.values_list('candidate_id', 'job_id'), 3.0),
+    ]
+
+    user_ids, job_ids, weights = [], [], []
+    for queryset, weight in sources:
+        for user_id, job_id in queryset.iterator(chunk_size=10000):
+            user_ids.append(user_id)
+            job_ids.append(job_id)
+            weights.append(weight)
+
+    return user_ids, job_ids, weights
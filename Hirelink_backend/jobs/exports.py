@@ -0,0 +1,108 @@
+# jobs/exports.py - Bulk recommendation export for analytics/marketing
+import csv
+import io
+import json
+import time
+
+from users.models import CustomUser
+from jobs.ai_matching import ai_matcher
+
+EXPORT_FIELDS = [
+    'candidate_id', 'candidate_name', 'rank', 'job_id', 'job_title', 'company',
+    'match_score', 'skill_match_percentage', 'cf_score', 'distance',
+    'matching_skills', 'location', 'job_type', 'experience_level'
+]
+
+
+class ExportStats:
+    """Running counters, so callers can report throughput once the stream ends"""
+
+    def __init__(self):
+        self.candidates = 0
+        self.rows = 0
+        self.started = time.time()
+
+    @property
+    def elapsed(self):
+        return time.time() - self.started
+
+    def summary(self):
+        elapsed = max(self.elapsed, 1e-9)
+        return (
+            f"{self.candidates} candidates, {self.rows} recommendations in {elapsed:.2f}s "
+            f"({self.candidates / elapsed:.0f} candidates/s)"
+        )
+
+
+def iter_recommendation_rows(n_recommendations=10, batch_size=500, stats=None):
+    """
+    Yield one flat dict per (candidate, recommended job). Candidates are read
+    with a server-side iterator and scored batch by batch, so memory stays
+    bounded by batch_size whatever the number of candidates.
+    """
+    candidates = (
+        CustomUser.objects
+        .filter(role='candidate')
+        .exclude(skills='')
+        .order_by('id')
+        .iterator(chunk_size=batch_size)
+    )
+
+    batch = []
+    for candidate in candidates:
+        batch.append(candidate)
+        if len(batch) >= batch_size:
+            yield from _score_batch(batch, n_recommendations, stats)
+            batch = []
+    if batch:
+        yield from _score_batch(batch, n_recommendations, stats)
+
+
+def _score_batch(candidates, n_recommendations, stats):
+    for candidate, recommendations in ai_matcher.get_recommendations_for_candidates(candidates, n_recommendations):
+        if stats is not None:
+            stats.candidates += 1
+            stats.rows += len(recommendations)
+        for rec in recommendations:
+            yield {
+                'candidate_id': candidate.id,
+                'candidate_name': candidate.full_name or candidate.username,
+                'rank': rec['rank'],
+                'job_id': rec['job_id'],
+                'job_title': rec['title'],
+                'company': rec['company'],
+                'match_score': round(rec['match_score'], 4),
+                'skill_match_percentage': round(rec['skill_match_percentage'], 2),
+                'cf_score': rec.get('cf_score'),
+                'distance': round(rec['distance'], 4),
+                'matching_skills': ', '.join(rec['matching_skills']),
+                'location': rec['location'],
+                'job_type': rec['job_type'],
+                'experience_level': rec['experience_level'],
+            }
+
+
+def ndjson_lines(rows):
+    for row in rows:
+        yield json.dumps(row, ensure_ascii=False) + '\n'
+
+
+def csv_lines(rows):
+    """CSV text, header first, one small string per row"""
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=EXPORT_FIELDS)
+    writer.writeheader()
+    for row in rows:
+        writer.writerow(row)
+        yield buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate(0)
+    # header only when there were no rows
+    if buffer.tell():
+        yield buffer.getvalue()
+
+
+FORMATS = {
+    'ndjson': (ndjson_lines, 'application/x-ndjson'),
+    'csv': (csv_lines, 'text/csv'),
+}
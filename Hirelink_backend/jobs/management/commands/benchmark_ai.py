@@ -0,0 +1,120 @@
+# jobs/management/commands/benchmark_ai.py
+
+from django.core.management.base import BaseCommand
+from jobs.ai_matching import AIMatcher
+from jobs.collaborative import ImplicitALS
+from sklearn.neighbors import NearestNeighbors
+import numpy as np
+import time
+
+class Command(BaseCommand):
+    help = 'Benchmark the AI matching components on synthetic data'
+    
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--cf-interactions',
+            type=int,
+            default=1_000_000,
+            help='Number of synthetic interactions for collaborative filtering training'
+        )
+        parser.add_argument('--cf-users', type=int, default=50_000)
+        parser.add_argument('--cf-jobs', type=int, default=20_000)
+        parser.add_argument('--cf-iterations', type=int, default=10)
+        parser.add_argument(
+            '--shards',
+            default='1,2,4,8',
+            help='Comma-separated shard counts to compare (1 = single KNN index)'
+        )
+        parser.add_argument('--index-jobs', type=int, default=200_000, help='Synthetic jobs in the matcher index')
+        parser.add_argument('--index-skills', type=int, default=300, help='Skill vocabulary size')
+        parser.add_argument('--queries', type=int, default=200)
+        parser.add_argument(
+            '--only',
+            choices=['cf', 'shards'],
+            help='Run a single benchmark section'
+        )
+        parser.add_argument('--seed', type=int, default=42)
+    
+    def handle(self, *args, **options):
+        rng = np.random.default_rng(options['seed'])
+        if options['only'] in (None, 'cf'):
+            self.benchmark_cf(rng, options)
+        if options['only'] in (None, 'shards'):
+            self.benchmark_shards(rng, options)
+    
+    def benchmark_shards(self, rng, options):
+        """Query latency of the matcher index as the number of shards grows"""
+        n_jobs, n_skills = options['index_jobs'], options['index_skills']
+        self.stdout.write(f"\n📊 Matcher index: {n_jobs:,} jobs, {n_skills} skills")
+        
+        matcher = AIMatcher()
+        weights = np.array([matcher.WEIGHTS['skills']] * n_skills + [1.5, 1.0, 1.0, 0.8, 0.7])
+        skills = (rng.random((n_jobs, n_skills)) < 8 / n_skills).astype(np.float64)
+        others = np.column_stack([
+            rng.integers(1, 6, n_jobs), rng.integers(0, 50, n_jobs), rng.uniform(20, 150, n_jobs),
+            rng.integers(0, 2, n_jobs), rng.integers(1, 8, n_jobs)
+        ])
+        features = np.hstack([skills, others]) * weights
+        queries = np.hstack([
+            (rng.random((options['queries'], n_skills)) < 8 / n_skills),
+            others[rng.integers(0, n_jobs, options['queries'])]
+        ]) * weights
+        
+        matcher.job_ids = np.arange(n_jobs)
+        matcher.job_weighted_features = features
+        matcher.job_active = np.ones(n_jobs, dtype=bool)
+        
+        start = time.time()
+        matcher.model = NearestNeighbors(n_neighbors=20, metric='euclidean', algorithm='auto').fit(features)
+        self.stdout.write(f"   single index build: {time.time() - start:.2f}s")
+        
+        for n_shards in [int(value) for value in options['shards'].split(',')]:
+            start = time.time()
+            matcher.build_shards(n_shards)
+            build_time = time.time() - start
+            
+            latencies = []
+            for query in queries:
+                start = time.perf_counter()
+                if matcher.shards:
+                    matcher.sharded_kneighbors(query, 20)
+                else:
+                    matcher.model.kneighbors(query.reshape(1, -1), n_neighbors=20)
+                latencies.append((time.perf_counter() - start) * 1000)
+            
+            self.stdout.write(
+                f"   shards={n_shards:<3} build {build_time:6.2f}s   "
+                f"p50 {np.percentile(latencies, 50):7.2f}ms   p95 {np.percentile(latencies, 95):7.2f}ms"
+            )
+    
+    def benchmark_cf(self, rng, options):
+        """ALS training time on a long-tailed synthetic interaction matrix"""
+        n = options['cf_interactions']
+        self.stdout.write(f"\n📊 Collaborative filtering: {n:,} interactions")
+        
+        # Heavy-tailed activity: a few users/jobs account for most interactions
+        user_ids = (rng.pareto(1.5, n) * 1000).astype(np.int64) % options['cf_users']
+        job_ids = (rng.pareto(1.2, n) * 100).astype(np.int64) % options['cf_jobs']
+        weights = rng.choice([1.0, 3.0], n)
+        
+        model = ImplicitALS(iterations=options['cf_iterations'])
+        
+        start = time.time()
+        model.fit(user_ids, job_ids, weights)
+        elapsed = time.time() - start
+        
+        self.stdout.write(
+            f"   {len(model.user_index):,} users x {len(model.job_index):,} jobs, "
+            f"{model.factors} factors, {model.iterations} iterations"
+        )
+        self.stdout.write(self.style.SUCCESS(
+            f"   ⏱️  train: {elapsed:.2f}s total, {elapsed / model.iterations:.3f}s/iteration, "
+            f"{n / elapsed:,.0f} interactions/s"
+        ))
+        
+        user_id = next(iter(model.user_index))
+        job_batch = list(model.job_index)[:100]
+        start = time.time()
+        for _ in range(100):
+            model.score(user_id, job_batch)
+        self.stdout.write(f"   ⏱️  score 100 jobs: {(time.time() - start) * 10:.3f}ms")
@@ -0,0 +1,34 @@
+# jobs/management/commands/export_recommendations.py
+
+from django.core.management.base import BaseCommand, CommandError
+from jobs.ai_matching import ai_matcher
+from jobs.exports import ExportStats, FORMATS, iter_recommendation_rows
+import sys
+
+class Command(BaseCommand):
+    help = 'Export AI job recommendations for every candidate as NDJSON or CSV'
+    
+    def add_arguments(self, parser):
+        parser.add_argument('--format', choices=sorted(FORMATS), default='ndjson')
+        parser.add_argument('--output', '-o', default='-', help='Output file (default: stdout)')
+        parser.add_argument('--limit', type=int, default=10, help='Recommendations per candidate')
+        parser.add_argument('--batch-size', type=int, default=500, help='Candidates scored per batch')
+    
+    def handle(self, *args, **options):
+        if not ai_matcher.is_trained and not ai_matcher.load_model():
+            raise CommandError("AI model not trained yet - run train_ai_on_db --save first")
+        
+        stats = ExportStats()
+        render, _ = FORMATS[options['format']]
+        rows = iter_recommendation_rows(options['limit'], options['batch_size'], stats)
+        
+        output = sys.stdout if options['output'] == '-' else open(options['output'], 'w', encoding='utf-8', newline='')
+        try:
+            for chunk in render(rows):
+                output.write(chunk)
+        finally:
+            if output is not sys.stdout:
+                output.close()
+        
+        # Progress goes to stderr so stdout stays a clean export
+        self.stderr.write(self.style.SUCCESS(f"✅ Exported {stats.summary()}"))
@@ -0,0 +1,45 @@
+# jobs/management/commands/run_matcher_service.py
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from jobs.ai_matching import ai_matcher
+from jobs.matcher_service import create_server
+
+class Command(BaseCommand):
+    help = 'Run the AI matcher as a standalone service for web workers to share'
+    
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--address',
+            default=None,
+            help='Unix socket path or host:port (default: settings.AI_MATCHER_SERVICE_ADDRESS)'
+        )
+        parser.add_argument(
+            '--model',
+            default='ai_model/job_matcher.joblib',
+            help='Saved model to serve'
+        )
+    
+    def handle(self, *args, **options):
+        address = options['address'] or getattr(settings, 'AI_MATCHER_SERVICE_ADDRESS', None)
+        if not address:
+            raise CommandError("No address: pass --address or set AI_MATCHER_SERVICE_ADDRESS")
+        
+        if ai_matcher.load_model(options['model']):
+            self.stdout.write(self.style.SUCCESS(
+                f"✅ Model loaded: {len(ai_matcher.job_ids)} jobs, {ai_matcher.n_skills} skills"
+            ))
+        else:
+            self.stdout.write(self.style.WARNING(
+                "⚠️  No trained model yet - train one, the service reloads it after training"
+            ))
+        
+        server = create_server(address, ai_matcher, options['model'])
+        self.stdout.write(self.style.SUCCESS(f"🚀 Matcher service listening on {address}"))
+        
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            self.stdout.write("Shutting down...")
+        finally:
+            server.server_close()
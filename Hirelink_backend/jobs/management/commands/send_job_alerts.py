@@ -0,0 +1,40 @@
+# jobs/management/commands/send_job_alerts.py
+
+from django.core.management.base import BaseCommand
+from jobs.alerts import fan_out_job_alert, fan_out_pending_alerts, rebuild_skill_index, send_alert_digests
+import time
+
+class Command(BaseCommand):
+    help = 'Job alerts: rebuild the candidate skill index, fan out a job, or email digests'
+    
+    def add_arguments(self, parser):
+        parser.add_argument('--rebuild-index', action='store_true', help='Rebuild the candidate skill index')
+        parser.add_argument('--job', type=int, action='append', help='Fan out alerts for this job id (repeatable)')
+        parser.add_argument('--pending', action='store_true', help='Finish fan-outs a web worker did not complete')
+        parser.add_argument('--digest', action='store_true', help='Email pending job alerts as one digest per candidate')
+    
+    def handle(self, *args, **options):
+        if options['rebuild_index']:
+            start_time = time.time()
+            rows = rebuild_skill_index()
+            self.stdout.write(self.style.SUCCESS(
+                f"✅ Indexed {rows} candidate skills in {time.time() - start_time:.2f} seconds"
+            ))
+        
+        for job_id in options['job'] or []:
+            start_time = time.time()
+            created = fan_out_job_alert(job_id)
+            self.stdout.write(self.style.SUCCESS(
+                f"✅ Job {job_id}: {created} notifications in {time.time() - start_time:.2f} seconds"
+            ))
+        
+        if options['pending']:
+            start_time = time.time()
+            jobs, created = fan_out_pending_alerts()
+            self.stdout.write(self.style.SUCCESS(
+                f"✅ {jobs} pending jobs: {created} notifications in {time.time() - start_time:.2f} seconds"
+            ))
+        
+        if options['digest']:
+            sent = send_alert_digests()
+            self.stdout.write(self.style.SUCCESS(f"📧 Sent {sent} digest emails"))
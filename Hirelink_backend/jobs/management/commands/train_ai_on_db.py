@@ -3,6 +3,7 @@
 from django.core.management.base import BaseCommand
 from jobs.models import Job
 from jobs.ai_matching import ai_matcher
+from jobs.matcher_service import notify_model_saved
 import time
 
 class Command(BaseCommand):
@@ -46,6 +47,8 @@ class Command(BaseCommand):
             if options['save']:
                 ai_matcher.save_model()
                 self.stdout.write(self.style.SUCCESS("💾 Model saved to ai_model/job_matcher.joblib"))
+                # A running matcher service picks up the new model
+                notify_model_saved()
             
             # Test with a sample candidate if available
             from users.models import CustomUser
@@ -0,0 +1,57 @@
+# jobs/management/commands/train_cf_model.py
+
+from django.core.management.base import BaseCommand
+from jobs.collaborative import ImplicitALS, collect_interactions
+from jobs.matcher_service import notify_model_saved
+import time
+
+class Command(BaseCommand):
+    help = 'Train the collaborative filtering model on saved jobs and applications'
+    
+    def add_arguments(self, parser):
+        parser.add_argument('--factors', type=int, default=32, help='Latent factors per user/job')
+        parser.add_argument('--iterations', type=int, default=10, help='ALS iterations')
+        parser.add_argument('--regularization', type=float, default=0.1)
+        parser.add_argument('--alpha', type=float, default=20.0, help='Confidence scaling of interactions')
+        parser.add_argument(
+            '--save',
+            action='store_true',
+            help='Save the trained model to file'
+        )
+    
+    def handle(self, *args, **options):
+        self.stdout.write("🚀 Collecting implicit feedback (saved jobs, applications)...")
+        
+        start_time = time.time()
+        user_ids, job_ids, weights = collect_interactions()
+        
+        if not user_ids:
+            self.stdout.write(self.style.ERROR("❌ No interactions found in database!"))
+            return
+        
+        self.stdout.write(f"📊 Found {len(user_ids)} interactions in {time.time() - start_time:.2f} seconds")
+        
+        model = ImplicitALS(
+            factors=options['factors'],
+            regularization=options['regularization'],
+            alpha=options['alpha'],
+            iterations=options['iterations']
+        )
+        
+        train_start = time.time()
+        model.fit(user_ids, job_ids, weights)
+        train_time = time.time() - train_start
+        
+        self.stdout.write(self.style.SUCCESS(
+            f"✅ Model trained in {train_time:.2f} seconds "
+            f"({len(model.user_index)} users x {len(model.job_index)} jobs, {model.factors} factors)"
+        ))
+        
+        if options['save']:
+            model.save()
+            self.stdout.write(self.style.SUCCESS("💾 Model saved to ai_model/job_cf.joblib"))
+            # A running matcher service reloads it; in-process matchers load it on restart
+            notify_model_saved()
+            self.stdout.write("🔄 Restart web workers that run without the matcher service to use it")
+        else:
+            self.stdout.write(self.style.WARNING("⚠️  Not saved - pass --save so recommendations use it"))
@@ -0,0 +1,382 @@
+# jobs/matcher_service.py - Run the AI matcher in one separate process
+"""
+Each Django worker that imports jobs.ai_matching holds its own copy of the
+model. With settings.AI_MATCHER_SERVICE_ADDRESS set, web workers instead ask a
+single matcher process (manage.py run_matcher_service) over a local socket.
+
+Protocol: every message is a 4-byte big-endian length followed by a compact
+JSON object. Requests look like {"op": "recommend", ...}, responses like
+{"ok": true, "result": ...} or {"ok": false, "error": "..."}.
+
+Without an address (the default), or when the service cannot be reached,
+everything runs in-process exactly as before.
+"""
+import json
+import os
+import queue
+import socket
+import socketserver
+import struct
+import threading
+from types import SimpleNamespace
+
+import numpy as np
+
+from django.conf import settings
+from django.db import connection
+import logging
+
+logger = logging.getLogger(__name__)
+
+HEADER = struct.Struct('>I')
+MAX_MESSAGE_SIZE = 16 * 1024 * 1024
+
+# Candidate attributes prepare_candidate_features() reads
+CANDIDATE_FIELDS = (
+    'id', 'username', 'full_name', 'skills', 'location', 'experience_level',
+    'preferred_job_type', 'remote_preference', 'desired_salary'
+)
+
+
+class MatcherServiceError(Exception):
+    """The matcher service could not answer (unreachable, timeout or remote error)"""
+
+
+def _json_default(value):
+    # numpy scalars coming out of the model
+    if hasattr(value, 'item'):
+        return value.item()
+    raise TypeError(f"Cannot serialize {type(value).__name__}")
+
+
+def send_message(sock, payload):
+    data = json.dumps(payload, separators=(',', ':'), default=_json_default).encode('utf-8')
+    sock.sendall(HEADER.pack(len(data)) + data)
+
+
+def _recv_exactly(sock, size):
+    chunks = []
+    while size:
+        chunk = sock.recv(min(size, 65536))
+        if not chunk:
+            raise ConnectionError("Connection closed by peer")
+        chunks.append(chunk)
+        size -= len(chunk)
+    return b''.join(chunks)
+
+
+def recv_message(sock):
+    (size,) = HEADER.unpack(_recv_exactly(sock, HEADER.size))
+    if size > MAX_MESSAGE_SIZE:
+        raise ConnectionError(f"Message too large ({size} bytes)")
+    return json.loads(_recv_exactly(sock, size))
+
+
+def parse_address(address):
+    """'/path/to.sock' or 'unix:/path' -> Unix socket, 'host:port' -> TCP"""
+    if address.startswith('unix:'):
+        return socket.AF_UNIX, address[len('unix:'):]
+    if address.startswith('/'):
+        return socket.AF_UNIX, address
+    host, _, port = address.rpartition(':')
+    return socket.AF_INET, (host or '127.0.0.1', int(port))
+
+
+def serialize_candidate(candidate):
+    # Attributes the user model lacks stay absent so the matcher's getattr defaults apply
+    return {field: getattr(candidate, field) for field in CANDIDATE_FIELDS if hasattr(candidate, field)}
+
+
+def deserialize_candidate(data):
+    return SimpleNamespace(**data)
+
+
+# SERVER SIDE
+
+class MatcherRequestHandler(socketserver.BaseRequestHandler):
+    """Serve requests on one persistent client connection until it closes"""
+
+    def handle(self):
+        try:
+            while True:
+                try:
+                    request = recv_message(self.request)
+                except (ConnectionError, OSError, struct.error):
+                    return
+
+                try:
+                    response = {'ok': True, 'result': self.server.dispatch(request)}
+                except Exception as e:
+                    logger.exception("Matcher service request failed")
+                    response = {'ok': False, 'error': str(e)}
+
+                try:
+                    send_message(self.request, response)
+                except OSError:
+                    return
+        finally:
+            connection.close()
+
+
+class _MatcherServerMixin:
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def dispatch(self, request):
+        from jobs.ai_matching import AIMatcher
+        from jobs.models import Job
+
+        op = request.get('op')
+        # One reference per request: a reload swaps in a whole new matcher
+        matcher = self.matcher
+
+        if op == 'status':
+            return {
+                'is_trained': matcher.is_trained,
+                'jobs_in_model': len(matcher.job_ids) if matcher.job_ids is not None else 0,
+                'skills_in_model': matcher.n_skills,
+                'ranking_version': matcher.ranking_version,
+                'pid': os.getpid()
+            }
+
+        if op == 'reload':
+            fresh = AIMatcher(n_shards=matcher.n_shards, shard_by=matcher.shard_by)
+            if not fresh.load_model(self.model_path):
+                return {'model_loaded': False}
+            with self.model_lock:
+                # Updates logged while the new model was loading
+                fresh.apply_pending_updates()
+                self.matcher = fresh
+            return {'model_loaded': True}
+
+        if not matcher.is_trained:
+            raise RuntimeError("AI model not trained yet")
+
+        if op == 'recommend':
+            candidate = deserialize_candidate(request['candidate'])
+            return matcher.get_recommendations_for_candidate(candidate, int(request.get('n', 10)))
+
+        if op == 'rank':
+            candidate = deserialize_candidate(request['candidate'])
+            ranking = matcher.rank_jobs_for_candidate(candidate, int(request.get('n', 500)))
+            return {key: value if key == 'version' else value.tolist() for key, value in ranking.items()}
+
+        if op == 'similar':
+            return matcher.get_similar_jobs(int(request['job_id']), request.get('n'))
+
+        if op == 'update_job':
+            # Sent after commit: the row read here is the committed edit
+            job = Job.objects.filter(id=request['job_id']).first()
+            with self.model_lock:
+                if job is None:
+                    return self.matcher.remove_job(int(request['job_id']))
+                return self.matcher.update_job(job)
+
+        if op == 'remove_job':
+            with self.model_lock:
+                return self.matcher.remove_job(int(request['job_id']))
+
+        raise ValueError(f"Unknown operation: {op}")
+
+
+class UnixMatcherServer(_MatcherServerMixin, socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    pass
+
+
+class TCPMatcherServer(_MatcherServerMixin, socketserver.ThreadingMixIn, socketserver.TCPServer):
+    pass
+
+
+def create_server(address, matcher, model_path='ai_model/job_matcher.joblib'):
+    """Server for `matcher`; reloads replace it with a new matcher loaded from model_path"""
+    family, target = parse_address(address)
+    if family == socket.AF_UNIX:
+        if os.path.exists(target):
+            os.unlink(target)
+        server = UnixMatcherServer(target, MatcherRequestHandler)
+    else:
+        server = TCPMatcherServer(target, MatcherRequestHandler)
+    server.matcher = matcher
+    server.model_path = model_path
+    # Reloads (a reference swap) are serialized here; the matcher itself serializes
+    # incremental updates with the reads of the arrays they change
+    server.model_lock = threading.Lock()
+    return server
+
+
+# CLIENT SIDE
+
+class MatcherClient:
+    """Thin client with a small pool of persistent connections"""
+
+    def __init__(self, address, timeout=2.0, pool_size=4):
+        self.address = address
+        self.timeout = timeout
+        self.family, self.target = parse_address(address)
+        self._pool = queue.LifoQueue(maxsize=pool_size)
+
+    def _connect(self):
+        sock = socket.socket(self.family, socket.SOCK_STREAM)
+        sock.settimeout(self.timeout)
+        sock.connect(self.target)
+        return sock
+
+    def _request(self, sock, payload):
+        send_message(sock, payload)
+        return recv_message(sock)
+
+    def call(self, op, **params):
+        payload = {'op': op, **params}
+        try:
+            sock = self._pool.get_nowait()
+        except queue.Empty:
+            sock = None
+
+        try:
+            if sock is not None:
+                try:
+                    response = self._request(sock, payload)
+                except ConnectionError:
+                    # Pooled connection went stale (e.g. service restarted): retry once fresh.
+                    # Not on a timeout: the service may still be running the request
+                    sock.close()
+                    sock = None
+            if sock is None:
+                sock = self._connect()
+                response = self._request(sock, payload)
+        except (OSError, ConnectionError, ValueError, struct.error) as e:
+            if sock is not None:
+                sock.close()
+            raise MatcherServiceError(f"Matcher service unavailable at {self.address}: {e}")
+
+        try:
+            self._pool.put_nowait(sock)
+        except queue.Full:
+            sock.close()
+
+        if not response.get('ok'):
+            raise MatcherServiceError(response.get('error', 'Unknown matcher service error'))
+        return response['result']
+
+
+_client = None
+_client_lock = threading.Lock()
+
+
+def get_client():
+    """The process-wide client, or None when the matcher runs in-process"""
+    global _client
+    address = getattr(settings, 'AI_MATCHER_SERVICE_ADDRESS', None)
+    if not address:
+        return None
+    with _client_lock:
+        if _client is None or _client.address != address:
+            _client = MatcherClient(
+                address,
+                timeout=getattr(settings, 'AI_MATCHER_SERVICE_TIMEOUT', 2.0),
+                pool_size=getattr(settings, 'AI_MATCHER_SERVICE_POOL_SIZE', 4)
+            )
+        return _client
+
+
+def _call_service(op, **params):
+    """Call the service if configured; returns (handled, result)"""
+    client = get_client()
+    if client is None:
+        return False, None
+    try:
+        return True, client.call(op, **params)
+    except MatcherServiceError as e:
+        logger.warning("%s - falling back to in-process matcher", e)
+        return False, None
+
+
+def _ensure_local_model():
+    """Load the saved model on first use, and replay job updates other processes logged since"""
+    from jobs.ai_matching import ai_matcher
+    if not ai_matcher.is_trained:
+        return ai_matcher.load_model()
+    ai_matcher.apply_pending_updates()
+    return True
+
+
+def matcher_ready():
+    handled, status = _call_service('status')
+    if handled and status['is_trained']:
+        return True
+    return _ensure_local_model()
+
+
+def get_recommendations(candidate, n_recommendations=10):
+    """Recommendations for a candidate from the service, or from the in-process matcher"""
+    from jobs.ai_matching import ai_matcher
+
+    handled, result = _call_service('recommend', candidate=serialize_candidate(candidate), n=n_recommendations)
+    if handled:
+        return result
+    if not _ensure_local_model():
+        return []
+    return ai_matcher.get_recommendations_for_candidate(candidate, n_recommendations)
+
+
+def ranking_version():
+    """Version of the model that would rank jobs now (None when no model is available)"""
+    from jobs.ai_matching import ai_matcher
+
+    handled, status = _call_service('status')
+    if handled and status['is_trained']:
+        return status['ranking_version']
+    if not _ensure_local_model():
+        return None
+    return ai_matcher.ranking_version
+
+
+def get_ranking(candidate, max_results=500):
+    """Full ranked job list of a candidate as numpy arrays (see AIMatcher.rank_jobs_for_candidate)"""
+    from jobs.ai_matching import ai_matcher
+
+    handled, result = _call_service('rank', candidate=serialize_candidate(candidate), n=max_results)
+    if handled:
+        return {
+            'version': result['version'],
+            'job_ids': np.array(result['job_ids'], dtype=np.int64),
+            'scores': np.array(result['scores'], dtype=np.float32),
+            'skill_match': np.array(result['skill_match'], dtype=np.float32)
+        }
+    if not _ensure_local_model():
+        return None
+    return ai_matcher.rank_jobs_for_candidate(candidate, max_results)
+
+
+def get_similar_jobs(job_id, n_similar=None):
+    from jobs.ai_matching import ai_matcher
+
+    handled, result = _call_service('similar', job_id=job_id, n=n_similar)
+    if handled:
+        return [tuple(pair) for pair in result]
+    if not _ensure_local_model():
+        return []
+    return ai_matcher.get_similar_jobs(job_id, n_similar)
+
+
+def notify_model_saved():
+    """Ask the service to pick up a freshly saved model (matcher or collaborative filtering)"""
+    _call_service('reload')
+
+
+def notify_job_changed(job):
+    """Forward a job edit to the service, or apply it to the in-process matcher"""
+    from jobs.ai_matching import ai_matcher
+
+    handled, _ = _call_service('update_job', job_id=job.id)
+    if not handled and _ensure_local_model():
+        ai_matcher.update_job(job)
+
+
+def notify_job_deleted(job_id):
+    """Forward a job deletion to the service, or apply it to the in-process matcher"""
+    from jobs.ai_matching import ai_matcher
+
+    handled, _ = _call_service('remove_job', job_id=job_id)
+    if not handled and _ensure_local_model():
+        ai_matcher.remove_job(job_id)
@@ -0,0 +1,22 @@
+# Generated by Django 4.2.30 on 2026-10-19 01:15
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('jobs', '0002_candidateskill'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='PendingJobAlert',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('job', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, related_name='pending_alert', to='jobs.job')),
+            ],
+        ),
+    ]
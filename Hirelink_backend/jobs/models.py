@@ -85,4 +85,23 @@ class SavedJob(models.Model):
         unique_together = ['job', 'user']
     
     def __str__(self):
-        return f"{self.user.username} saved {self.job.title}"
\ No newline at end of file
+        return f"{self.user.username} saved {self.job.title}"
+
+class CandidateSkill(models.Model):
+    """Inverted index of candidate skills, used to find who to alert about a new job"""
+    skill = models.CharField(max_length=100, db_index=True)
+    user = models.ForeignKey('users.CustomUser', on_delete=models.CASCADE, related_name='indexed_skills')
+    
+    class Meta:
+        unique_together = ['skill', 'user']
+    
+    def __str__(self):
+        return f"{self.user.username}: {self.skill}"
+
+class PendingJobAlert(models.Model):
+    """New job whose alert fan-out has not finished (saved with the job, deleted by the fan-out)"""
+    job = models.OneToOneField(Job, on_delete=models.CASCADE, related_name='pending_alert')
+    created_at = models.DateTimeField(auto_now_add=True)
+    
+    def __str__(self):
+        return f"Pending alert for {self.job.title}"
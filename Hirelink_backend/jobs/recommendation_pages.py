@@ -0,0 +1,115 @@
+# jobs/recommendation_pages.py - Cursor pagination over a candidate's ranked jobs
+"""
+The full ranking of a candidate is computed once per ranking version - model
+version plus job edits applied since (see AIMatcher.rank_jobs_for_candidate) and cached as three small numpy arrays:
+job ids, match scores and skill match percentages. Every page is a slice of
+those arrays, so page N costs the same as page 1.
+
+A cursor is an opaque token holding the ranking version and an offset. It keeps
+pointing into the same cached ranking; once a retrain, reload or job edit has
+changed the version and that ranking has left the cache, it expires and the
+client starts again from the first page.
+"""
+import base64
+import hashlib
+import json
+
+from django.conf import settings
+from django.core.cache import cache
+
+from jobs.ai_matching import ai_matcher
+from jobs.matcher_service import get_ranking, ranking_version, serialize_candidate
+
+
+class CursorExpired(Exception):
+    """The cursor belongs to a ranking that is no longer available"""
+
+
+def encode_cursor(version, offset):
+    token = f"{version}:{offset}".encode('utf-8')
+    return base64.urlsafe_b64encode(token).decode('ascii').rstrip('=')
+
+
+def decode_cursor(cursor):
+    """Return (version, offset); raises ValueError on a malformed cursor"""
+    try:
+        padded = cursor + '=' * (-len(cursor) % 4)
+        version, _, offset = base64.urlsafe_b64decode(padded).decode('utf-8').rpartition(':')
+        offset = int(offset)
+    except (ValueError, UnicodeDecodeError):
+        raise ValueError("Invalid cursor")
+    if not version or offset < 0:
+        raise ValueError("Invalid cursor")
+    return version, offset
+
+
+def _cache_key(candidate, version):
+    # The profile is part of the key: editing skills or preferences re-ranks at once
+    profile = json.dumps(serialize_candidate(candidate), sort_keys=True, default=str)
+    digest = hashlib.sha1(profile.encode('utf-8')).hexdigest()[:16]
+    return f"ai_ranking:{candidate.id}:{version}:{digest}"
+
+
+def get_cached_ranking(candidate, version):
+    """Ranking of the candidate for this model version, computed on the first request"""
+    key = _cache_key(candidate, version)
+    ranking = cache.get(key)
+    if ranking is not None:
+        return ranking
+
+    if version != ranking_version():
+        raise CursorExpired("The AI model changed since this cursor was issued")
+
+    ranking = get_ranking(candidate, getattr(settings, 'AI_RECOMMENDATIONS_MAX_RANKED', 500))
+    if ranking is None or ranking['version'] != version:
+        raise CursorExpired("The AI model changed since this cursor was issued")
+
+    cache.set(key, ranking, getattr(settings, 'AI_RECOMMENDATIONS_CACHE_TIMEOUT', 3600))
+    return ranking
+
+
+def get_recommendation_page(candidate, cursor=None, page_size=10):
+    """
+    One page of recommendations as plain dicts (job_id, match_score,
+    skill_match_percentage, rank) plus cursors. Like the unpaginated matcher,
+    pages walk the ranking nearest job first and each page is ordered by match
+    score. Returns None when no model is available.
+    """
+    if cursor:
+        version, offset = decode_cursor(cursor)
+    else:
+        version, offset = ranking_version(), 0
+        if version is None:
+            return None
+
+    ranking = get_cached_ranking(candidate, version)
+    total = len(ranking['job_ids'])
+    end = min(offset + page_size, total)
+
+    page = [
+        {
+            'job_id': int(job_id),
+            'match_score': float(score),
+            'skill_match_percentage': float(skill_match)
+        }
+        for job_id, score, skill_match in zip(
+            ranking['job_ids'][offset:end], ranking['scores'][offset:end], ranking['skill_match'][offset:end]
+        )
+    ]
+    page.sort(key=lambda x: x['match_score'], reverse=True)
+    for i, rec in enumerate(page):
+        rec['rank'] = offset + i + 1
+
+    return {
+        'total': total,
+        'recommendations': page,
+        'next_cursor': encode_cursor(version, end) if end < total else None,
+        'previous_cursor': encode_cursor(version, max(offset - page_size, 0)) if offset > 0 else None
+    }
+
+
+def matching_skills(candidate, job, limit=5):
+    """Skills shared by the candidate and the job's required skills, as the matcher lists them"""
+    candidate_skills = set(ai_matcher.extract_skills(candidate.skills))
+    job_skills = dict.fromkeys(ai_matcher.extract_skills(job.required_skills))
+    return [skill for skill in job_skills if skill in candidate_skills][:limit]
@@ -0,0 +1,54 @@
+# jobs/signals.py
+from django.db import transaction
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+
+from users.models import CustomUser
+from .models import Job
+from .matcher_service import notify_job_changed, notify_job_deleted
+from .alerts import index_candidate_skills, queue_job_alert
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+def _notify_job_changed(job):
+    try:
+        notify_job_changed(job)
+    except Exception as e:
+        logger.warning("Could not update similar jobs for job %s: %s", job.id, e)
+
+
+def _notify_job_deleted(job_id):
+    try:
+        notify_job_deleted(job_id)
+    except Exception as e:
+        logger.warning("Could not remove job %s from similar jobs: %s", job_id, e)
+
+
+@receiver(post_save, sender=Job)
+def refresh_job_neighbors(sender, instance, **kwargs):
+    """Keep the precomputed similar-jobs lists in sync with job edits (runs after commit)"""
+    transaction.on_commit(lambda: _notify_job_changed(instance))
+
+
+@receiver(post_save, sender=Job)
+def alert_matching_candidates(sender, instance, created, **kwargs):
+    """Tell candidates with matching skills about a new posting (runs after commit)"""
+    if created and instance.is_active:
+        queue_job_alert(instance.id)
+
+
+@receiver(post_delete, sender=Job)
+def drop_job_neighbors(sender, instance, **kwargs):
+    # The id is cleared on the instance once the delete finishes
+    job_id = instance.id
+    transaction.on_commit(lambda: _notify_job_deleted(job_id))
+
+
+@receiver(post_save, sender=CustomUser)
+def reindex_candidate_skills(sender, instance, update_fields=None, **kwargs):
+    # Saves such as last_login updates do not touch the indexed fields
+    if update_fields is not None and not {'skills', 'role'} & set(update_fields):
+        return
+    index_candidate_skills(instance)
@@ -9,6 +9,7 @@ urlpatterns = [
     path('', views.JobListView.as_view(), name='job-list'),
     path('create/', views.JobCreateView.as_view(), name='job-create'),
     path('<int:pk>/', views.JobDetailView.as_view(), name='job-detail'),
+    path('<int:pk>/similar/', views.SimilarJobsView.as_view(), name='job-similar'),
     path('<int:pk>/update/', views.JobUpdateView.as_view(), name='job-update'),
     path('<int:pk>/delete/', views.JobDeleteView.as_view(), name='job-delete'),
 
@@ -38,6 +39,7 @@ urlpatterns = [
 
     # AI Matching endpoints
     path('ai/recommendations/', views.AIRecommendationsView.as_view(), name='ai-recommendations'),
+    path('ai/recommendations/export/', views.ExportAIRecommendationsView.as_view(), name='ai-recommendations-export'),
     path('ai/train/', views.TrainAIModelView.as_view(), name='ai-train'),
     path('ai/status/', views.AIModelStatusView.as_view(), name='ai-status'),
     path('ai/test/', views.TestAIRecommendationView.as_view(), name='ai-test'),
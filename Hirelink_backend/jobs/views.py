@@ -4,6 +4,7 @@ from rest_framework import generics, permissions, status, filters
 from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework.pagination import PageNumberPagination
+from django.http import StreamingHttpResponse
 from django_filters.rest_framework import DjangoFilterBackend
 from .models import Job, JobApplication, SavedJob
 from .serializers import (
@@ -13,9 +14,18 @@ from .serializers import (
 )
 from users.models import CustomUser
 from jobs.ai_matching import ai_matcher
+from jobs.matcher_service import (
+    get_client, get_similar_jobs,
+    matcher_ready, notify_model_saved, MatcherServiceError
+)
 from users.models import CustomUser
+from jobs.recommendation_pages import CursorExpired, get_recommendation_page, matching_skills
+from jobs.exports import ExportStats, FORMATS, iter_recommendation_rows
+import logging
 import time
 
+logger = logging.getLogger(__name__)
+
 class StandardResultsSetPagination(PageNumberPagination):
     page_size = 10
     page_size_query_param = 'page_size'
@@ -331,17 +341,15 @@ class AIRecommendationsView(APIView):
                 status=status.HTTP_403_FORBIDDEN
             )
         
-        # Check if model is trained
-        if not ai_matcher.is_trained:
-            # Try to load saved model
-            if not ai_matcher.load_model():
-                return Response(
-                    {
-                        "error": "AI model not trained yet",
-                        "message": "Please ask an admin to train the AI model first"
-                    },
-                    status=status.HTTP_503_SERVICE_UNAVAILABLE
-                )
+        # Check if model is trained (in the matcher service or in this process)
+        if not matcher_ready():
+            return Response(
+                {
+                    "error": "AI model not trained yet",
+                    "message": "Please ask an admin to train the AI model first"
+                },
+                status=status.HTTP_503_SERVICE_UNAVAILABLE
+            )
         
         # Get number of recommendations (default: 10, max: 50)
         try:
@@ -349,14 +357,25 @@ class AIRecommendationsView(APIView):
         except:
             n_recommendations = 10
         
-        # Get recommendations
+        # Get one page of the cached ranking (?cursor= from a previous page's next_cursor)
         try:
             start_time = time.time()
-            recommendations = ai_matcher.get_recommendations_for_candidate(
-                request.user, 
+            page = get_recommendation_page(
+                request.user,
+                request.GET.get('cursor'),
                 n_recommendations
             )
             processing_time = time.time() - start_time
+        except CursorExpired as e:
+            return Response(
+                {"error": str(e), "detail": "Request the first page again without a cursor"},
+                status=status.HTTP_410_GONE
+            )
+        except ValueError as e:
+            return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+        
+        try:
+            recommendations = page['recommendations'] if page else []
             
             # Get full job details for each recommendation
             job_ids = [rec['job_id'] for rec in recommendations]
@@ -376,23 +395,114 @@ class AIRecommendationsView(APIView):
                         **job_serializer.data,
                         'ai_match_score': rec['match_score'],
                         'skill_match_percentage': rec['skill_match_percentage'],
-                        'matching_skills': rec['matching_skills'],
+                        'matching_skills': matching_skills(request.user, job),
                         'rank': rec['rank']
                     })
             
             return Response({
                 'count': len(response_data),
+                'total': page['total'] if page else 0,
+                'next_cursor': page['next_cursor'] if page else None,
+                'previous_cursor': page['previous_cursor'] if page else None,
                 'processing_time': f"{processing_time:.3f}s",
                 'recommendations': response_data
             })
             
         except Exception as e:
-            print(f"Error getting AI recommendations: {e}")
+            logger.exception("Error getting AI recommendations: %s", e)
             return Response(
                 {"error": "Failed to get AI recommendations", "details": str(e)},
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR
             )
 
+class SimilarJobsView(APIView):
+    """
+    Get the jobs most similar to a given job, read from the precomputed neighbor lists
+    """
+    permission_classes = [permissions.IsAuthenticated]
+    
+    def get(self, request, pk):
+        if not Job.objects.filter(pk=pk, is_active=True).exists():
+            return Response(
+                {"detail": "Job not found."},
+                status=status.HTTP_404_NOT_FOUND
+            )
+        
+        if not matcher_ready():
+            return Response(
+                {"error": "AI model not trained yet"},
+                status=status.HTTP_503_SERVICE_UNAVAILABLE
+            )
+        
+        try:
+            limit = min(int(request.GET.get('limit', ai_matcher.n_similar)), ai_matcher.n_similar)
+        except:
+            limit = ai_matcher.n_similar
+        
+        similar = get_similar_jobs(pk, limit)
+        
+        job_dict = Job.objects.filter(
+            id__in=[job_id for job_id, _ in similar], is_active=True
+        ).select_related('posted_by').in_bulk()
+        
+        response_data = []
+        for job_id, distance in similar:
+            if job_id in job_dict:
+                job_serializer = JobSerializer(job_dict[job_id], context={'request': request})
+                response_data.append({
+                    **job_serializer.data,
+                    'similarity_distance': distance,
+                    'rank': len(response_data) + 1
+                })
+        
+        return Response({
+            'job_id': pk,
+            'count': len(response_data),
+            'similar_jobs': response_data
+        })
+
+class ExportAIRecommendationsView(APIView):
+    """
+    Stream recommendations for all candidates (admin only) as NDJSON or CSV
+    """
+    permission_classes = [permissions.IsAuthenticated]
+    
+    def get(self, request):
+        if request.user.role != 'admin' and not request.user.is_staff:
+            return Response(
+                {"error": "Only admins can export AI recommendations"},
+                status=status.HTTP_403_FORBIDDEN
+            )
+        
+        export_format = request.GET.get('export_format', 'ndjson')
+        if export_format not in FORMATS:
+            return Response(
+                {"error": f"Unknown format, use one of: {', '.join(sorted(FORMATS))}"},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        
+        if not ai_matcher.is_trained and not ai_matcher.load_model():
+            return Response(
+                {"error": "AI model not trained yet"},
+                status=status.HTTP_503_SERVICE_UNAVAILABLE
+            )
+        
+        try:
+            n_recommendations = min(int(request.GET.get('limit', 10)), 50)
+        except:
+            n_recommendations = 10
+        
+        render, content_type = FORMATS[export_format]
+        stats = ExportStats()
+        
+        def stream():
+            yield from render(iter_recommendation_rows(n_recommendations, stats=stats))
+            logger.info("Recommendation export (%s): %s", export_format, stats.summary())
+        
+        response = StreamingHttpResponse(stream(), content_type=content_type)
+        response['Content-Disposition'] = f'attachment; filename="recommendations.{export_format}"'
+        return response
+
 class TrainAIModelView(APIView):
     """
     Train AI model on current database (admin/recruiter only)
@@ -422,8 +532,9 @@ class TrainAIModelView(APIView):
             success = ai_matcher.train_model(jobs_df)
             
             if success:
-                # Save model
+                # Save model and let the matcher service pick it up
                 ai_matcher.save_model()
+                notify_model_saved()
                 
                 return Response({
                     "success": True,
@@ -441,7 +552,7 @@ class TrainAIModelView(APIView):
                 )
                 
         except Exception as e:
-            print(f"Error training AI model: {e}")
+            logger.exception("Error training AI model: %s", e)
             return Response(
                 {"error": "Failed to train AI model", "details": str(e)},
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR
@@ -454,6 +565,21 @@ class AIModelStatusView(APIView):
     permission_classes = [permissions.AllowAny]  # Allow checking without auth
     
     def get(self, request):
+        # Shared matcher service: report its state instead of loading a local copy
+        client = get_client()
+        if client is not None:
+            try:
+                service_status = client.call('status')
+                return Response({
+                    'is_trained': service_status['is_trained'],
+                    'jobs_in_model': service_status['jobs_in_model'],
+                    'skills_in_model': service_status['skills_in_model'],
+                    'model_loaded': service_status['is_trained'],
+                    'service': {'address': client.address, 'available': True, 'pid': service_status['pid']}
+                })
+            except MatcherServiceError as e:
+                service_error = {'address': client.address, 'available': False, 'error': str(e)}
+        
         status = {
             'is_trained': ai_matcher.is_trained,
             'jobs_in_model': len(ai_matcher.job_ids) if ai_matcher.job_ids is not None else 0,
@@ -469,6 +595,9 @@ class AIModelStatusView(APIView):
                 status['jobs_in_model'] = len(ai_matcher.job_ids)
                 status['skills_in_model'] = ai_matcher.n_skills
         
+        if client is not None:
+            status['service'] = service_error
+        
         return Response(status)
 
 class TestAIRecommendationView(APIView):
@@ -486,7 +615,7 @@ class TestAIRecommendationView(APIView):
             )
         
         # Check if model is trained
-        if not ai_matcher.is_trained and not ai_matcher.load_model():
+        if not matcher_ready():
             return Response(
                 {"error": "AI model not trained yet"},
                 status=status.HTTP_503_SERVICE_UNAVAILABLE
@@ -514,14 +643,25 @@ class TestAIRecommendationView(APIView):
                     status=status.HTTP_404_NOT_FOUND
                 )
         
-        # Get recommendations
-        n_recommendations = min(int(request.GET.get('limit', 5)), 20)
+        # Get recommendations (paged like AIRecommendationsView, ?cursor=)
+        try:
+            n_recommendations = min(int(request.GET.get('limit', 5)), 50)
+        except:
+            n_recommendations = 5
         
         try:
-            recommendations = ai_matcher.get_recommendations_for_candidate(
-                candidate, 
-                n_recommendations
-            )
+            page = get_recommendation_page(candidate, request.GET.get('cursor'), n_recommendations)
+        except CursorExpired as e:
+            return Response({"error": str(e)}, status=status.HTTP_410_GONE)
+        except ValueError as e:
+            return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+        
+        try:
+            recommendations = page['recommendations'] if page else []
+            jobs = Job.objects.in_bulk([rec['job_id'] for rec in recommendations])
+            for rec in recommendations:
+                job = jobs.get(rec['job_id'])
+                rec['matching_skills'] = matching_skills(candidate, job) if job else []
             
             # Get candidate info
             candidate_info = {
@@ -535,8 +675,8 @@ class TestAIRecommendationView(APIView):
             # Get job details for top recommendations
             top_recommendations = []
             for rec in recommendations[:5]:  # Show top 5
-                try:
-                    job = Job.objects.get(id=rec['job_id'])
+                job = jobs.get(rec['job_id'])
+                if job is not None:
                     top_recommendations.append({
                         'job': {
                             'id': job.id,
@@ -550,18 +690,17 @@ class TestAIRecommendationView(APIView):
                         'skill_match_percentage': rec['skill_match_percentage'],
                         'matching_skills': rec['matching_skills']
                     })
-                except Job.DoesNotExist:
-                    continue
             
             return Response({
                 'candidate': candidate_info,
-                'total_recommendations': len(recommendations),
+                'total_recommendations': page['total'] if page else 0,
+                'next_cursor': page['next_cursor'] if page else None,
                 'top_recommendations': top_recommendations,
                 'all_recommendations': recommendations  # Full AI data
             })
             
         except Exception as e:
-            print(f"Error testing AI recommendations: {e}")
+            logger.exception("Error testing AI recommendations: %s", e)
             return Response(
                 {"error": "Failed to get recommendations", "details": str(e)},
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR
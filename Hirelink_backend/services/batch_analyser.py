@@ -0,0 +1,106 @@
+"""
+Batch Resume ATS scoring for HireLink
+Scores many resumes at once, e.g. every applicant of a job
+"""
+
+from typing import Dict, Any, List, Optional, Union
+
+import numpy as np
+
+from services.resume_analyser import ResumeATSBuilder, ResumeFeatures
+from services.resume_document import ResumeDocument
+
+
+class BatchATSAnalyzer:
+    """
+    Feature matrix and quality scores for a whole batch of resumes.
+    Scores are identical to ResumeATSBuilder.calculate_quality_score.
+    """
+
+    def __init__(self, builder: Optional[ResumeATSBuilder] = None):
+        self.builder = builder or ResumeATSBuilder()
+        self.columns = {name: i for i, name in enumerate(self.builder.feature_names)}
+
+    def feature_matrix(self, resumes: List[Union[str, ResumeDocument]]) -> np.ndarray:
+        """One row of feature_names values per resume (text or parsed document)"""
+        matrix = np.zeros((len(resumes), len(self.columns)), dtype=np.int64)
+        for row, resume in enumerate(resumes):
+            features = self.builder.extract_features(resume)
+            matrix[row] = [getattr(features, name) for name in self.builder.feature_names]
+        return matrix
+
+    def quality_scores(self, matrix: np.ndarray) -> List[float]:
+        """Vectorized calculate_quality_score: same rules, same order of additions"""
+        column = lambda name: matrix[:, self.columns[name]]
+        score = np.full(len(matrix), 3.0)
+
+        # 1. Length score (300-500 words is ideal)
+        words = column('word_count')
+        score += np.select(
+            [(300 <= words) & (words <= 500), (200 <= words) & (words < 300),
+             (500 < words) & (words <= 700), words < 100, words > 800],
+            [0.8, 0.4, 0.3, -1.5, -0.5], 0.0
+        )
+
+        # 2. Contact information score
+        email, phone = column('has_email') > 0, column('has_phone') > 0
+        score += np.select([email & phone, email | phone], [0.6, 0.3], -1.0)
+
+        # 3. Section completeness score
+        sections = column('section_count')
+        score += np.select([sections >= 3, sections == 2, sections == 1], [0.8, 0.3, -0.3], -1.0)
+
+        # 4. Bullet points score (5-15 is ideal)
+        bullets = column('bullet_point_count')
+        score += np.select(
+            [(5 <= bullets) & (bullets <= 15), bullets > 15, bullets < 3], [0.5, 0.2, -0.4], 0.0
+        )
+
+        # 5. Technical content score
+        tech = column('tech_keyword_count')
+        score += np.select(
+            [tech >= 10, (5 <= tech) & (tech < 10), (2 <= tech) & (tech < 5)], [0.7, 0.4, 0.1], -0.5
+        )
+
+        # 6. Action verbs score
+        verbs = column('action_verb_count')
+        score += np.select([verbs >= 8, (4 <= verbs) & (verbs < 8), verbs < 2], [0.6, 0.3, -0.3], 0.0)
+
+        score = np.maximum(1.0, np.minimum(5.0, score))
+        # Python's round, not np.round, so values match the single-resume path exactly
+        return [round(value, 2) for value in score.tolist()]
+
+    def analyze(self, resume_texts: List[str]) -> List[Dict[str, Any]]:
+        """Per-resume scores, in input order; resumes too short to analyze get an error"""
+        results: List[Dict[str, Any]] = []
+        valid_rows, valid_texts = [], []
+        for row, resume_text in enumerate(resume_texts):
+            if not resume_text or len(resume_text.strip()) < 50:
+                results.append({'success': False, 'error': 'Resume text is too short (minimum 50 characters)'})
+            else:
+                results.append(None)
+                valid_rows.append(row)
+                valid_texts.append(resume_text)
+
+        if not valid_texts:
+            return results
+
+        documents = [self.builder.parse_resume(resume_text) for resume_text in valid_texts]
+        matrix = self.feature_matrix(documents)
+        scores = self.quality_scores(matrix)
+
+        for i, (row, feature_row, quality_score) in enumerate(zip(valid_rows, matrix.tolist(), scores)):
+            features = ResumeFeatures(**dict(zip(self.builder.feature_names, feature_row)))
+            ats_compatible, ats_confidence = self.builder.check_ats_compatibility(documents[i])
+            grade, _, color = self.builder.get_grade_and_feedback(quality_score)
+            results[row] = {
+                'success': True,
+                'quality_score': quality_score,
+                'grade': grade,
+                'grade_color': color,
+                'ats_compatible': ats_compatible,
+                'ats_confidence': round(ats_confidence, 2),
+                'features': features.to_dict()
+            }
+
+        return results
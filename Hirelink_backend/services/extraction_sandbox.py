@@ -0,0 +1,344 @@
+"""
+Sandboxed text extraction for uploaded resume files
+A crafted PDF or DOCX can make PyPDF2, pdfminer or python-docx spin or grow
+without bound. Files are parsed in pre-forked worker processes, each with an
+address-space limit (RLIMIT_AS) and a CPU-time limit per file (RLIMIT_CPU),
+and every file has a wall-clock deadline. A worker that hits a limit, runs
+out of time or crashes is killed and replaced, and workers are replaced
+after max_jobs files anyway; the caller always gets (text, metadata) back,
+with metadata['sandbox'] describing what went wrong.
+
+A long PDF is split by page ranges across the workers that are idle when it is
+read: its worker asks the parent for them, parses the first range itself and
+gets the others' back through the parent (see ResumeFileProcessor's
+PARALLEL_PDF_MIN_PAGES).
+"""
+
+import logging
+import math
+import multiprocessing
+import queue
+import signal
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from io import BytesIO
+from typing import List, Optional, Tuple
+
+from services.file_processor import (
+    ResumeFileProcessor, extract_pdf_page_range, pdf_page_ranges, set_pdf_range_runner
+)
+
+try:
+    import resource
+except ImportError:  # Windows: no rlimits, only the wall-clock deadline applies
+    resource = None
+
+logger = logging.getLogger(__name__)
+
+FAILURE_MESSAGES = {
+    'cpu_limit': 'File parsing exceeded the CPU time limit',
+    'memory_limit': 'File parsing exceeded the memory limit',
+    'timeout': 'File parsing took too long',
+    'killed': 'File parsing was killed (out of memory?)',
+    'crashed': 'File parser crashed',
+    'busy': 'No file parser available, try again later',
+}
+
+
+def _extract(filename: str, content: bytes) -> Tuple[str, dict]:
+    return ResumeFileProcessor.extract_text_from_file(BytesIO(content), filename)
+
+
+def _cpu_seconds() -> float:
+    usage = resource.getrusage(resource.RUSAGE_SELF)
+    return usage.ru_utime + usage.ru_stime
+
+
+def _set_soft_limit(limit: int, soft: int):
+    _, hard = resource.getrlimit(limit)
+    if hard != resource.RLIM_INFINITY:
+        soft = min(soft, hard)
+    resource.setrlimit(limit, (soft, hard))
+
+
+def _ranges_through_parent(conn, content: bytes, pages: int, workers: int, cpu_budget: float) -> Optional[list]:
+    """
+    Page range runner of a worker: the parent hands the other ranges to idle sibling
+    workers while this one parses the first range; None when no sibling was idle
+    """
+    conn.send(('split', pages, cpu_budget))
+    ranges = conn.recv()
+    if not ranges:
+        return None
+    first, last, range_budget = ranges[0]
+    try:
+        own_result = extract_pdf_page_range(content, first, last, range_budget)
+    finally:
+        # Always collected, so the parent gets its workers back
+        conn.send(('join',))
+        other_results = conn.recv()
+    if other_results is None:
+        return None
+    return [(first, own_result)] + [(other[0], result) for other, result in zip(ranges[1:], other_results)]
+
+
+def _page_range(content: bytes, first: int, last: int, cpu_budget: float) -> Optional[dict]:
+    try:
+        return extract_pdf_page_range(content, first, last, cpu_budget)
+    except Exception as e:
+        logger.warning("Page range %d-%d failed: %s", first, last, e)
+        return None
+
+
+def _worker_main(conn, cpu_limit: Optional[int], memory_limit_mb: Optional[int], workers: int):
+    """
+    Worker process, until the pipe closes: ('extract', filename, content) in,
+    ('result', (text, metadata)) out; ('range', content, first, last, cpu_budget)
+    in, ('result', range result or None) out
+    """
+    if resource is not None and memory_limit_mb:
+        memory_limit = memory_limit_mb * 1024 * 1024
+        resource.setrlimit(resource.RLIMIT_AS, (memory_limit, memory_limit))
+    set_pdf_range_runner(partial(_ranges_through_parent, conn), workers)
+
+    while True:
+        try:
+            request = conn.recv()
+        except EOFError:
+            return
+        if resource is not None and cpu_limit:
+            # RLIMIT_CPU counts the whole life of the process: allow cpu_limit more seconds for this file.
+            # Going over it sends SIGXCPU, which kills the worker.
+            _set_soft_limit(resource.RLIMIT_CPU, math.ceil(_cpu_seconds() + cpu_limit))
+        if request[0] == 'range':
+            conn.send(('result', _page_range(*request[1:])))
+        else:
+            conn.send(('result', _extract(*request[1:])))
+
+
+class _Worker:
+    """One extraction process and the parent's end of its pipe"""
+
+    def __init__(self, context, cpu_limit, memory_limit_mb, workers):
+        self.conn, child_conn = context.Pipe()
+        self.process = context.Process(
+            target=_worker_main, args=(child_conn, cpu_limit, memory_limit_mb, workers),
+            name='resume-extractor', daemon=True
+        )
+        self.process.start()
+        child_conn.close()
+        self.jobs = 0
+
+    def stop(self, wait: float = 0.0):
+        """Kill the process, after giving it `wait` seconds to exit by itself"""
+        self.conn.close()
+        self.process.join(timeout=wait)
+        if self.process.is_alive():
+            self.process.kill()
+        self.process.join(timeout=5)
+
+
+class ExtractionSandbox:
+    """
+    Pool of pre-forked extraction processes, shared by the threads of one process.
+    workers=0 extracts in the calling thread, without limits.
+    """
+
+    def __init__(self, workers: int = 2, cpu_limit: Optional[int] = 10, memory_limit_mb: Optional[int] = 1024,
+                 timeout: float = 20.0, max_jobs: int = 200, start_method: Optional[str] = None):
+        self.workers = workers
+        self.cpu_limit = cpu_limit
+        self.memory_limit_mb = memory_limit_mb
+        self.timeout = timeout
+        self.max_jobs = max_jobs
+        # forkserver: workers never inherit the threads and state of the (threaded) web process
+        if start_method is None:
+            start_method = 'forkserver' if 'forkserver' in multiprocessing.get_all_start_methods() else 'spawn'
+        self._context = multiprocessing.get_context(start_method)
+        self._idle = queue.Queue()
+        self._lock = threading.Lock()
+        self._started = False
+        self.stats = {'files': 0, 'failures': 0, 'recycled': 0, 'split_pdfs': 0}
+
+    def start(self) -> 'ExtractionSandbox':
+        """Start the worker processes (otherwise done by the first extraction)"""
+        with self._lock:
+            if not self._started:
+                for _ in range(self.workers):
+                    self._idle.put(self._spawn())
+                self._started = True
+        return self
+
+    def set_workers(self, workers: int):
+        """Change the number of worker processes; only before they are started"""
+        with self._lock:
+            if self._started:
+                raise RuntimeError("Extraction sandbox already started")
+            self.workers = workers
+
+    def _spawn(self) -> _Worker:
+        return _Worker(self._context, self.cpu_limit, self.memory_limit_mb, self.workers)
+
+    def extract(self, item: Tuple[str, bytes]) -> Tuple[str, dict]:
+        """(text, metadata) of one (filename, content) pair, like ResumeFileProcessor.extract_text_from_file"""
+        filename, content = item
+        if not self.workers:
+            return _extract(filename, content)
+
+        self.start()
+        start = time.perf_counter()
+        try:
+            worker = self._idle.get(timeout=self.timeout)
+        except queue.Empty:
+            return self._failure(filename, 'busy', start)
+
+        failure = None
+        helpers = []
+        deadline = time.monotonic() + self.timeout
+        try:
+            worker.conn.send(('extract', filename, content))
+            while True:
+                if not worker.conn.poll(max(deadline - time.monotonic(), 0)):
+                    failure = 'timeout'
+                    break
+                message = worker.conn.recv()
+                if message[0] == 'split':
+                    helpers, ranges = self._split(content, *message[1:])
+                    worker.conn.send(ranges)
+                elif message[0] == 'join':
+                    worker.conn.send(self._join(helpers, deadline))
+                    helpers = []
+                else:
+                    text, metadata = message[1]
+                    worker.jobs += 1
+                    if metadata.get('out_of_memory'):
+                        failure = 'memory_limit'
+                    break
+        except (EOFError, OSError):
+            failure = 'crashed'
+        if helpers:
+            # The worker failed while its page ranges were out
+            self._join(helpers, deadline)
+
+        with self._lock:
+            self.stats['files'] += 1
+        if failure is None and worker.jobs < self.max_jobs:
+            self._idle.put(worker)
+            return text, metadata
+
+        # A worker whose pipe broke is already exiting: wait for its exit code
+        exit_code = self._replace(worker, wait=1.0 if failure == 'crashed' else 0.0)
+        if failure is None:
+            return text, metadata
+        if failure == 'crashed' and exit_code is not None and exit_code < 0:
+            failure = {-signal.SIGXCPU: 'cpu_limit', -signal.SIGKILL: 'killed'}.get(exit_code, 'crashed')
+        return self._failure(filename, failure, start, exit_code)
+
+    def _split(self, content: bytes, pages: int, cpu_budget: float) -> Tuple[list, Optional[list]]:
+        """
+        Hand page ranges 2..n of a long PDF to idle workers, without waiting for any.
+        (helper workers, [(first, last, cpu_budget) per range]); (_, None) if none is idle.
+        """
+        helpers = []
+        while len(helpers) < min(self.workers - 1, pages - 1):
+            try:
+                helpers.append(self._idle.get_nowait())
+            except queue.Empty:
+                break
+        if not helpers:
+            return [], None
+
+        ranges = pdf_page_ranges(pages, len(helpers) + 1)
+        range_budget = cpu_budget / len(ranges)
+        # Fewer ranges than helpers when the pages do not divide evenly
+        for helper in helpers[len(ranges) - 1:]:
+            self._idle.put(helper)
+        helpers = helpers[:len(ranges) - 1]
+        sent = []
+        for helper, (first, last) in zip(helpers, ranges[1:]):
+            try:
+                helper.conn.send(('range', content, first, last, range_budget))
+                sent.append((helper, True))
+            except OSError:
+                sent.append((helper, False))
+        with self._lock:
+            self.stats['split_pdfs'] += 1
+        return sent, [(first, last, range_budget) for first, last in ranges]
+
+    def _join(self, helpers: list, deadline: float) -> Optional[list]:
+        """Range results of the helpers (None if any failed); helpers go back to the pool or are replaced"""
+        results = []
+        for helper, sent in helpers:
+            result, answered, crashed = None, False, not sent
+            try:
+                if sent and helper.conn.poll(max(deadline - time.monotonic(), 0)):
+                    result = helper.conn.recv()[1]
+                    helper.jobs += 1
+                    answered = True
+            except (EOFError, OSError):
+                crashed = True
+            if answered and helper.jobs < self.max_jobs:
+                self._idle.put(helper)
+            else:
+                self._replace(helper, wait=1.0 if crashed else 0.0)
+            results.append(result)
+        if any(result is None for result in results):
+            return None
+        return results
+
+    def extract_many(self, files: List[Tuple[str, bytes]]) -> List[Tuple[str, dict]]:
+        """extract for (filename, content) pairs, in input order, on all the workers at once"""
+        if self.workers <= 1 or len(files) <= 1:
+            return [self.extract(item) for item in files]
+        with ThreadPoolExecutor(max_workers=min(self.workers, len(files))) as threads:
+            return list(threads.map(self.extract, files))
+
+    def _replace(self, worker: _Worker, wait: float = 0.0) -> Optional[int]:
+        """Stop a worker and start a fresh one in its place; the old worker's exit code"""
+        worker.stop(wait)
+        with self._lock:
+            self.stats['recycled'] += 1
+        self._idle.put(self._spawn())
+        return worker.process.exitcode
+
+    def _failure(self, filename: str, failure: str, start: float, exit_code: Optional[int] = None) -> Tuple[str, dict]:
+        with self._lock:
+            self.stats['failures'] += 1
+        logger.warning("Sandboxed extraction of %s failed: %s (exit code %s)", filename, failure, exit_code)
+        return "", {
+            'filename': filename,
+            'file_type': filename.split('.')[-1].lower() if '.' in filename else 'unknown',
+            'success': False,
+            'error': FAILURE_MESSAGES[failure],
+            'sandbox': {
+                'failure': failure,
+                'exit_code': exit_code,
+                'elapsed_ms': round((time.perf_counter() - start) * 1000, 2),
+                'cpu_limit': self.cpu_limit,
+                'memory_limit_mb': self.memory_limit_mb,
+                'timeout': self.timeout
+            }
+        }
+
+    def close(self):
+        """Stop the idle workers (at shutdown)"""
+        with self._lock:
+            while True:
+                try:
+                    self._idle.get_nowait().stop()
+                except queue.Empty:
+                    break
+
+    def summary(self) -> dict:
+        with self._lock:
+            return {
+                **self.stats,
+                'workers': self.workers,
+                'idle': self._idle.qsize(),
+                'cpu_limit': self.cpu_limit,
+                'memory_limit_mb': self.memory_limit_mb,
+                'timeout': self.timeout,
+                'max_jobs': self.max_jobs
+            }
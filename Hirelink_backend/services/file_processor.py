@@ -2,28 +2,230 @@
 File Processor for extracting text from various resume formats
 """
 
+import logging
+import math
+import multiprocessing
 import os
 import re
-from typing import Optional, Tuple
+import threading
+import time
+import zipfile
+from concurrent.futures import ProcessPoolExecutor, TimeoutError as FutureTimeoutError
+from concurrent.futures.process import BrokenProcessPool
+from contextlib import nullcontext
+from io import BytesIO
+from typing import Iterator, Optional, Tuple
+from xml.etree import ElementTree
 import PyPDF2
 from docx import Document
-from io import BytesIO
 import warnings
 warnings.filterwarnings('ignore')
 
+logger = logging.getLogger(__name__)
+
+# First bytes of the formats with a dedicated parser (a PDF header may follow up to 1KB of junk)
+PDF_MAGIC = b'%PDF-'
+ZIP_MAGIC = b'PK\x03\x04'  # DOCX is a zip package
+OLE_MAGIC = b'\xd0\xcf\x11\xe0\xa1\xb1\x1a\xe1'  # legacy .doc
+
+# WordprocessingML tags read by _docx_lines
+_W = '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}'
+_BODY, _P, _R, _HYPERLINK = _W + 'body', _W + 'p', _W + 'r', _W + 'hyperlink'
+_TBL, _TR, _TC = _W + 'tbl', _W + 'tr', _W + 'tc'
+_T, _BR = _W + 't', _W + 'br'
+# Other run children with a text equivalent (as in python-docx)
+_RUN_TEXT = {_W + 'tab': '\t', _W + 'ptab': '\t', _W + 'cr': '\n', _W + 'noBreakHyphen': '-'}
+
+
+def _docx_lines(source) -> Iterator[str]:
+    """
+    Text of a DOCX in document order, streamed out of word/document.xml: a line
+    per body paragraph ("text\n") and per row of a body table ("cell cell \n"),
+    with paragraph and cell text read the way python-docx reads it. Every element
+    is dropped from the tree as soon as it ends, so memory stays flat.
+    """
+    with zipfile.ZipFile(source) as package, package.open('word/document.xml') as document:
+        open_elements = []
+        paragraphs = []  # text parts of each open paragraph (text boxes nest paragraphs)
+        counted_runs = []  # per open run: does its text belong to its paragraph
+        cells = []  # paragraph texts of each open table cell
+        rows = []  # cell texts of each open table row
+        for event, element in ElementTree.iterparse(document, events=('start', 'end')):
+            tag = element.tag
+            if event == 'start':
+                parent = open_elements[-1].tag if open_elements else None
+                if tag == _P:
+                    paragraphs.append([])
+                elif tag == _R:
+                    # Runs directly in the paragraph or in one of its hyperlinks
+                    counted_runs.append(parent == _P or (
+                        parent == _HYPERLINK and len(open_elements) > 1 and open_elements[-2].tag == _P
+                    ))
+                elif tag == _TC:
+                    cells.append([])
+                elif tag == _TR:
+                    rows.append([])
+                open_elements.append(element)
+                continue
+            
+            open_elements.pop()
+            parent = open_elements[-1].tag if open_elements else None
+            if parent == _R:
+                if counted_runs[-1] and paragraphs:
+                    if tag == _T:
+                        paragraphs[-1].append(element.text or '')
+                    elif tag == _BR:
+                        # Page and column breaks have no text
+                        if element.get(_W + 'type', 'textWrapping') == 'textWrapping':
+                            paragraphs[-1].append('\n')
+                    elif tag in _RUN_TEXT:
+                        paragraphs[-1].append(_RUN_TEXT[tag])
+            elif tag == _R:
+                counted_runs.pop()
+            elif tag == _P:
+                text = ''.join(paragraphs.pop())
+                if parent == _BODY:
+                    yield text + '\n'
+                elif parent == _TC:
+                    cells[-1].append(text)
+            elif tag == _TC:
+                text = '\n'.join(cells.pop())
+                if parent == _TR:
+                    rows[-1].append(text)
+            elif tag == _TR:
+                row = rows.pop()
+                if parent == _TBL and len(open_elements) > 1 and open_elements[-2].tag == _BODY:
+                    yield ''.join(cell + ' ' for cell in row) + '\n'
+            if open_elements:
+                open_elements[-1].remove(element)
+
+
+def _pypdf2_pages(pdf_reader, first: int = 0, last: Optional[int] = None) -> Iterator[Tuple[str, Optional[str]]]:
+    """(text, error) per page of first..last-1; a page that fails to extract does not stop the others"""
+    for index in range(first, len(pdf_reader.pages) if last is None else last):
+        try:
+            yield pdf_reader.pages[index].extract_text() or "", None
+        except MemoryError:
+            raise
+        except Exception as e:
+            yield "", str(e)
+
+
+def _pdfminer_pages(source) -> Iterator[Tuple[str, Optional[str]]]:
+    """(text, None) per page, laid out by pdfminer; each page is parsed when it is pulled"""
+    from pdfminer.high_level import extract_pages
+    from pdfminer.layout import LTTextContainer
+    
+    for page_layout in extract_pages(source):
+        yield "".join(element.get_text() for element in page_layout if isinstance(element, LTTextContainer)), None
+
+
+def pdf_page_ranges(pages: int, parts: int) -> list:
+    """(first, last) page ranges splitting the first `pages` pages into at most `parts` parts"""
+    range_size = math.ceil(pages / parts)
+    return [(first, min(first + range_size, pages)) for first in range(0, pages, range_size)]
+
+
+def extract_pdf_page_range(content: bytes, first: int, last: int, cpu_budget: float) -> dict:
+    """Worker process side of parallel extraction: _read_pdf_pages over pages first..last-1"""
+    cpu_start = time.thread_time()
+    pdf_reader = PyPDF2.PdfReader(BytesIO(content))
+    return ResumeFileProcessor._read_pdf_pages(
+        'pypdf2', last - first, _pypdf2_pages(pdf_reader, first, last), last - first, cpu_budget, cpu_start
+    )
+
+
+# Process pool for long PDFs, started on first use
+_pdf_pool = None
+_pdf_pool_lock = threading.Lock()
+
+
+def _get_pdf_pool(workers: int) -> ProcessPoolExecutor:
+    global _pdf_pool
+    with _pdf_pool_lock:
+        if _pdf_pool is None:
+            _pdf_pool = ProcessPoolExecutor(max_workers=workers)
+        return _pdf_pool
+
+
+def _reset_pdf_pool(pool: ProcessPoolExecutor):
+    """Drop a broken or stuck pool; the next long PDF starts a new one"""
+    global _pdf_pool
+    with _pdf_pool_lock:
+        if _pdf_pool is pool:
+            _pdf_pool = None
+    # A worker still busy on a page exits once that page is done
+    pool.shutdown(wait=False, cancel_futures=True)
+
+
+def _run_pdf_ranges_in_pool(content: bytes, pages: int, workers: int, cpu_budget: float) -> Optional[list]:
+    """
+    Default page range runner: [(first, range result), ...] from the local process pool.
+    None if the pool fails or the ranges are not back within the CPU budget plus
+    PARALLEL_PDF_GRACE seconds.
+    """
+    ranges = pdf_page_ranges(pages, workers)
+    pool = None
+    try:
+        pool = _get_pdf_pool(workers)
+        futures = [
+            pool.submit(extract_pdf_page_range, content, first, last, cpu_budget / len(ranges))
+            for first, last in ranges
+        ]
+        deadline = time.monotonic() + cpu_budget + ResumeFileProcessor.PARALLEL_PDF_GRACE
+        return [
+            (first, future.result(timeout=max(deadline - time.monotonic(), 0)))
+            for (first, _), future in zip(ranges, futures)
+        ]
+    except (BrokenProcessPool, FutureTimeoutError) as e:
+        logger.warning("Parallel PDF extraction failed (%s), restarting the pool and extracting in-process",
+                       type(e).__name__)
+        if pool is not None:
+            _reset_pdf_pool(pool)
+        return None
+
+
+# How long PDFs are split: runner(content, pages, workers, cpu_budget) and the number of
+# parallel workers it offers. None: the local pool, one worker per CPU (PDF_WORKERS)
+_pdf_range_runner = None
+_pdf_range_workers = None
+
+
+def set_pdf_range_runner(runner, workers: int):
+    """Split long PDFs with another runner, e.g. the extraction sandbox's sibling workers"""
+    global _pdf_range_runner, _pdf_range_workers
+    _pdf_range_runner, _pdf_range_workers = runner, workers
+
+
 class ResumeFileProcessor:
     """
     Process uploaded resume files and extract text
     """
     
+    # Bump when extraction or cleaning changes: stored extracted texts of other versions are ignored
+    EXTRACTOR_VERSION = '4'
+    
+    # PDF extraction limits (extract_text_from_file arguments override them)
+    MAX_PDF_PAGES = 50
+    PDF_CPU_BUDGET = 5.0  # seconds of the extracting thread's CPU time, checked between pages
+    # PDFs with at least this many pages are split across worker processes by page
+    # ranges (0 = never); below it, starting the workers costs more than it saves
+    PARALLEL_PDF_MIN_PAGES = 12
+    PDF_WORKERS = None  # default: one per CPU
+    # Seconds on top of the CPU budget to wait for the page ranges (starting workers, a busy machine)
+    PARALLEL_PDF_GRACE = 5.0
+    
     @staticmethod
-    def extract_text_from_file(file, filename: str) -> Tuple[str, dict]:
+    def extract_text_from_file(file, filename: str, max_pages: Optional[int] = None,
+                               cpu_budget: Optional[float] = None) -> Tuple[str, dict]:
         """
         Extract text from uploaded file
         
         Args:
-            file: Django uploaded file object
+            file: Django uploaded file object, any binary file object (such as BytesIO), or a path
             filename: Original filename
+            max_pages: PDF pages read at most (default MAX_PDF_PAGES)
+            cpu_budget: PDF extraction stops after this many CPU seconds (default PDF_CPU_BUDGET)
         
         Returns:
             Tuple of (extracted_text, metadata)
@@ -35,23 +237,26 @@ class ResumeFileProcessor:
             'error': None
         }
         
+        start_time = time.perf_counter()
         try:
-            # Read file content
-            content = file.read()
-            
-            # Determine file type and extract text
-            if filename.lower().endswith('.pdf'):
-                text = ResumeFileProcessor._extract_from_pdf(content)
-            elif filename.lower().endswith(('.docx', '.doc')):
-                text = ResumeFileProcessor._extract_from_docx(content)
-            elif filename.lower().endswith('.txt'):
-                text = ResumeFileProcessor._extract_from_txt(content)
-            else:
-                # Try to extract as text for unknown formats
-                try:
-                    text = content.decode('utf-8', errors='ignore')
-                except:
-                    text = str(content, errors='ignore')
+            # Parsers read the given file object, nothing is copied here. The callers hash and
+            # cache whole uploads, and the extraction sandbox ships them to its workers over a
+            # pipe, so they pass the bytes they already hold as BytesIO(content) (no second copy)
+            with ResumeFileProcessor._open_source(file) as source:
+                file_size = ResumeFileProcessor._stream_size(source)
+                
+                # Determine file type from the content (the extension when it is not recognized) and extract text
+                metadata['detected_type'] = ResumeFileProcessor._detect_type(source)
+                file_type = metadata['detected_type'] or metadata['file_type']
+                if file_type == 'pdf':
+                    text = ResumeFileProcessor._extract_from_pdf(source, metadata, max_pages, cpu_budget)
+                elif file_type in ['docx', 'doc']:
+                    text = ResumeFileProcessor._extract_from_docx(source)
+                elif file_type == 'txt':
+                    text = ResumeFileProcessor._extract_from_txt(source.read())
+                else:
+                    # Try to extract as text for unknown formats
+                    text = source.read().decode('utf-8', errors='ignore')
             
             # Clean the extracted text
             text = ResumeFileProcessor._clean_text(text)
@@ -61,59 +266,241 @@ class ResumeFileProcessor:
                 'success': True,
                 'word_count': len(text.split()),
                 'char_count': len(text),
-                'file_size_kb': len(content) / 1024
+                'file_size_kb': file_size / 1024,
+                'extract_time_ms': round((time.perf_counter() - start_time) * 1000, 2)
             })
             
             return text, metadata
             
+        except MemoryError:
+            # Flagged for the extraction sandbox, which replaces a worker that ran out of memory
+            metadata.update({'error': 'Not enough memory to extract text from the file', 'out_of_memory': True})
+            return "", metadata
         except Exception as e:
             metadata['error'] = str(e)
             return "", metadata
     
     @staticmethod
-    def _extract_from_pdf(content: bytes) -> str:
-        """Extract text from PDF file"""
-        text = ""
+    def _open_source(file):
+        """Binary file object for a path (opened here) or an already open file"""
+        if isinstance(file, (str, os.PathLike)):
+            return open(file, 'rb')
+        return nullcontext(file)
+    
+    @staticmethod
+    def _detect_type(source) -> Optional[str]:
+        """
+        'pdf', 'docx' or 'doc' from the leading bytes, None for anything else.
+        A zip is only a DOCX if it has a word/document.xml part.
+        """
+        position = source.tell()
+        head = source.read(1024)
+        source.seek(position)
+        if PDF_MAGIC in head:
+            return 'pdf'
+        if head.startswith(ZIP_MAGIC):
+            try:
+                with zipfile.ZipFile(source) as package:
+                    package.getinfo('word/document.xml')
+                return 'docx'
+            except (zipfile.BadZipFile, KeyError):
+                return None
+            finally:
+                source.seek(position)
+        if head.startswith(OLE_MAGIC):
+            return 'doc'
+        return None
+    
+    @staticmethod
+    def _stream_size(source) -> int:
+        position = source.tell()
+        source.seek(0, os.SEEK_END)
+        size = source.tell() - position
+        source.seek(position)
+        return size
+    
+    @staticmethod
+    def _extract_from_pdf(source, metadata: dict, max_pages: Optional[int] = None,
+                          cpu_budget: Optional[float] = None) -> str:
+        """
+        Extract text from PDF file, page by page, within a page and CPU time budget.
+        PyPDF2 first; pdfminer when PyPDF2 cannot read the file or any of its pages.
+        Per-page timings and the reason extraction stopped early go to metadata['pdf'].
+        """
+        max_pages = ResumeFileProcessor.MAX_PDF_PAGES if max_pages is None else max_pages
+        cpu_budget = ResumeFileProcessor.PDF_CPU_BUDGET if cpu_budget is None else cpu_budget
+        start_position = source.tell()
+        cpu_start = time.thread_time()
         
         try:
-            # Try PyPDF2 first
-            pdf_reader = PyPDF2.PdfReader(BytesIO(content))
-            for page in pdf_reader.pages:
-                page_text = page.extract_text()
-                if page_text:
-                    text += page_text + "\n"
+            pdf_reader = PyPDF2.PdfReader(source)
+            page_count = len(pdf_reader.pages)
+            workers = ResumeFileProcessor._pdf_workers(min(page_count, max_pages))
+            result = None
+            if workers > 1:
+                source.seek(start_position)
+                result = ResumeFileProcessor._read_pdf_pages_parallel(
+                    source.read(), page_count, max_pages, cpu_budget - (time.thread_time() - cpu_start), workers
+                )
+            if result is None:
+                result = ResumeFileProcessor._read_pdf_pages(
+                    'pypdf2', page_count, _pypdf2_pages(pdf_reader), max_pages, cpu_budget, cpu_start
+                )
+            if not result['texts'] and result['page_errors']:
+                raise ValueError(result['page_errors'][0]['error'])
+        except MemoryError:
+            raise
         except Exception as e:
-            print(f"PyPDF2 extraction failed: {e}")
-            # Fallback: Try pdfminer
+            logger.warning("PyPDF2 extraction failed: %s", e)
+            # Fallback: Try pdfminer, with what is left of the budget
             try:
-                from pdfminer.high_level import extract_text
-                pdf_file = BytesIO(content)
-                text = extract_text(pdf_file)
-            except:
-                text = "[PDF content - extraction failed]"
+                source.seek(start_position)
+                result = ResumeFileProcessor._read_pdf_pages(
+                    'pdfminer', None, _pdfminer_pages(source), max_pages, cpu_budget, cpu_start
+                )
+            except MemoryError:
+                raise
+            except Exception as e:
+                logger.warning("pdfminer extraction failed: %s", e)
+                metadata['pdf'] = {'extractor': None, 'error': str(e)}
+                raise ValueError(f"Could not extract text from the PDF: {e}") from e
         
-        return text
+        texts = result.pop('texts')
+        metadata['pdf'] = result
+        return "".join(page_text + "\n" for page_text in texts)
+    
+    @staticmethod
+    def _pdf_workers(pages: int) -> int:
+        """Worker processes for a PDF of this many pages (1 = extract in this thread)"""
+        min_pages = ResumeFileProcessor.PARALLEL_PDF_MIN_PAGES
+        if not min_pages or pages < min_pages:
+            return 1
+        if _pdf_range_runner is not None:
+            return min(_pdf_range_workers, pages)
+        # Already inside a worker process: no nested pools
+        if multiprocessing.parent_process() is not None:
+            return 1
+        return min(ResumeFileProcessor.PDF_WORKERS or os.cpu_count() or 1, pages)
     
     @staticmethod
-    def _extract_from_docx(content: bytes) -> str:
-        """Extract text from DOCX file"""
+    def _read_pdf_pages_parallel(content: bytes, page_count: int, max_pages: int,
+                                 cpu_budget: float, workers: int) -> Optional[dict]:
+        """
+        _read_pdf_pages over page ranges in worker processes, text reassembled in page order.
+        The CPU budget is shared out between the ranges; text stops at the first range
+        that did not finish, so it is always the leading pages. None if the ranges fail.
+        """
+        pages = min(page_count, max_pages)
+        runner = _pdf_range_runner or _run_pdf_ranges_in_pool
         try:
-            doc = Document(BytesIO(content))
-            text = ""
-            for paragraph in doc.paragraphs:
-                text += paragraph.text + "\n"
-            
-            # Also extract text from tables
-            for table in doc.tables:
-                for row in table.rows:
-                    for cell in row.cells:
-                        text += cell.text + " "
-                    text += "\n"
+            range_results = runner(content, pages, workers, cpu_budget)
+        except MemoryError:
+            raise
+        except Exception as e:
+            logger.warning("Parallel PDF extraction failed, extracting in-process: %s", e)
+            return None
+        if range_results is None:
+            return None
+        
+        result = {
+            'texts': [],
+            'extractor': 'pypdf2',
+            'page_count': page_count,
+            'pages_read': 0,
+            'truncated': 'page_limit' if page_count > max_pages else None,
+            'cpu_time_ms': 0.0,
+            'page_times_ms': [],
+            'page_errors': [],
+            'workers': len(range_results)
+        }
+        for first, range_result in range_results:
+            result['texts'].extend(range_result['texts'])
+            result['pages_read'] += range_result['pages_read']
+            result['cpu_time_ms'] = round(result['cpu_time_ms'] + range_result['cpu_time_ms'], 2)
+            result['page_times_ms'].extend(range_result['page_times_ms'])
+            result['page_errors'].extend(
+                {'page': first + error['page'], 'error': error['error']} for error in range_result['page_errors']
+            )
+            if range_result['truncated']:
+                result['truncated'] = range_result['truncated']
+                break
+        return result
+    
+    @staticmethod
+    def _read_pdf_pages(extractor: str, page_count: Optional[int], pages: Iterator[Tuple[str, Optional[str]]],
+                        max_pages: int, cpu_budget: float, cpu_start: float) -> dict:
+        """Pull (text, error) pages until the document, the page limit or the CPU budget ends"""
+        texts, page_times_ms, page_errors = [], [], []
+        truncated = None
+        while True:
+            if len(page_times_ms) >= max_pages:
+                if page_count is None or page_count > max_pages:
+                    truncated = 'page_limit'
+                break
+            if time.thread_time() - cpu_start >= cpu_budget:
+                truncated = 'cpu_budget'
+                break
             
-            return text
+            page_start = time.perf_counter()
+            try:
+                page_text, error = next(pages)
+            except StopIteration:
+                break
+            page_times_ms.append(round((time.perf_counter() - page_start) * 1000, 2))
+            if error:
+                page_errors.append({'page': len(page_times_ms), 'error': error})
+            elif page_text:
+                texts.append(page_text)
+        
+        if truncated:
+            logger.warning("PDF extraction stopped early (%s) after %d of %s pages",
+                           truncated, len(page_times_ms), page_count or 'unknown')
+        return {
+            'texts': texts,
+            'extractor': extractor,
+            'page_count': page_count,
+            'pages_read': len(page_times_ms),
+            'truncated': truncated,
+            'cpu_time_ms': round((time.thread_time() - cpu_start) * 1000, 2),
+            'page_times_ms': page_times_ms,
+            'page_errors': page_errors
+        }
+    
+    @staticmethod
+    def _extract_from_docx(source) -> str:
+        """
+        Extract text from DOCX file, streamed in document order (_docx_lines);
+        python-docx reads the files the streaming reader cannot
+        """
+        start_position = source.tell()
+        try:
+            return "".join(_docx_lines(source))
+        except MemoryError:
+            raise
+        except Exception as e:
+            logger.warning("Streaming DOCX extraction failed, trying python-docx: %s", e)
+        
+        try:
+            source.seek(start_position)
+            return ResumeFileProcessor._extract_from_docx_model(source)
+        except MemoryError:
+            raise
         except Exception as e:
-            print(f"DOCX extraction failed: {e}")
-            return "[DOCX content - extraction failed]"
+            logger.warning("DOCX extraction failed: %s", e)
+            raise ValueError(f"Could not extract text from the DOCX: {e}") from e
+    
+    @staticmethod
+    def _extract_from_docx_model(source) -> str:
+        """Extract text from DOCX file with python-docx: paragraphs first, then table rows"""
+        doc = Document(source)
+        lines = [paragraph.text + "\n" for paragraph in doc.paragraphs]
+        
+        # Also extract text from tables
+        for table in doc.tables:
+            for row in table.rows:
+                lines.append("".join(cell.text + " " for cell in row.cells) + "\n")
+        
+        return "".join(lines)
     
     @staticmethod
     def _extract_from_txt(content: bytes) -> str:
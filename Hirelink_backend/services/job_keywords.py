@@ -0,0 +1,103 @@
+"""
+Job-targeted keyword coverage for the Resume ATS Builder
+Scores a resume against one job's required skills, preferred skills and the
+skills named in its description. Each job's automaton is compiled once and
+reused until the job is edited (updated_at changes).
+"""
+
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, List
+
+from services.keyword_scanner import KeywordScanner
+
+# Share of the match score per term group; empty groups are left out
+MATCH_WEIGHTS = {'required': 0.6, 'preferred': 0.25, 'description': 0.15}
+
+
+def _skills(value) -> List[str]:
+    """Comma-separated skills (Job.required_skills / preferred_skills), lower-cased, in order, no duplicates"""
+    return list(dict.fromkeys(skill.strip().lower() for skill in (value or '').split(',') if skill.strip()))
+
+
+class JobKeywordMatcher:
+    """Compiled keyword automaton for one version of one job"""
+
+    def __init__(self, job, known_skills: KeywordScanner):
+        self.job_id = job.id
+        self.job_title = job.title
+        self.updated_at = job.updated_at
+
+        required = _skills(job.required_skills)
+        preferred = [skill for skill in _skills(job.preferred_skills) if skill not in required]
+        # Description terms: known skills the description mentions that the lists do not
+        listed = set(required) | set(preferred)
+        description = sorted(
+            skill for skill in known_skills.scan(job.description or '').found('skill') if skill not in listed
+        )
+        self.terms = {'required': required, 'preferred': preferred, 'description': description}
+
+        self.scanner = KeywordScanner()
+        for group, keywords in self.terms.items():
+            self.scanner.add_many(keywords, group)
+        self.scanner.compile()
+
+    def match(self, resume_text: str, lowered: bool = False) -> Dict[str, Any]:
+        """Coverage of each term group and a weighted 0-100 match score"""
+        hits = self.scanner.scan(resume_text, lowered)
+        groups = {}
+        score, weight = 0.0, 0.0
+        for group, keywords in self.terms.items():
+            matched = [keyword for keyword in keywords if keyword in hits]
+            coverage = len(matched) / len(keywords) if keywords else None
+            groups[group] = {
+                'matched': matched,
+                'missing': [keyword for keyword in keywords if keyword not in hits],
+                'coverage': round(coverage, 2) if coverage is not None else None
+            }
+            if coverage is not None:
+                score += MATCH_WEIGHTS[group] * coverage
+                weight += MATCH_WEIGHTS[group]
+
+        return {
+            'job_id': self.job_id,
+            'job_title': self.job_title,
+            'match_score': round(100 * score / weight, 1) if weight else None,
+            **groups
+        }
+
+
+class JobMatcherCache:
+    """
+    Per-process LRU of JobKeywordMatcher by job id. An entry is rebuilt when the
+    job's updated_at differs from the one it was compiled from.
+    """
+
+    def __init__(self, known_skills: KeywordScanner, max_entries: int = 512):
+        self.known_skills = known_skills
+        self.max_entries = max_entries
+        self._entries: 'OrderedDict[int, JobKeywordMatcher]' = OrderedDict()
+        self._lock = threading.Lock()
+        self.stats = {'hits': 0, 'builds': 0}
+
+    def get(self, job) -> JobKeywordMatcher:
+        with self._lock:
+            matcher = self._entries.get(job.id)
+            if matcher is not None and matcher.updated_at == job.updated_at:
+                self._entries.move_to_end(job.id)
+                self.stats['hits'] += 1
+                return matcher
+
+        # Compiled outside the lock; two requests may both build a new job once
+        matcher = JobKeywordMatcher(job, self.known_skills)
+        with self._lock:
+            self._entries[job.id] = matcher
+            self._entries.move_to_end(job.id)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+            self.stats['builds'] += 1
+        return matcher
+
+    def summary(self) -> Dict[str, int]:
+        with self._lock:
+            return {**self.stats, 'entries': len(self._entries)}
@@ -0,0 +1,140 @@
+"""
+Multi-pattern keyword scanner for the Resume ATS Builder
+Aho-Corasick automaton: every keyword is found in one pass over the text,
+whatever the size of the keyword dictionary
+"""
+
+from collections import deque
+from typing import Dict, Iterable, List, Set
+
+
+def _is_word_char(char: str) -> bool:
+    return char.isalnum() or char == '_'
+
+
+class KeywordHits:
+    """
+    Result of one scan: which keywords occur (as whole words) and in which
+    categories. Shared by every analysis stage so the text is scanned once.
+    """
+
+    def __init__(self, counts: Dict[str, int], categories: Dict[str, Set[str]]):
+        self.counts = counts
+        self._categories = categories
+
+    def __contains__(self, keyword: str) -> bool:
+        return keyword in self.counts
+
+    def found(self, category: str) -> Set[str]:
+        """Keywords of a category that occur in the text"""
+        return {keyword for keyword in self.counts if category in self._categories[keyword]}
+
+    def any_of(self, keywords: Iterable[str]) -> bool:
+        return any(keyword in self.counts for keyword in keywords)
+
+    @classmethod
+    def merge(cls, hits_list: List['KeywordHits']) -> 'KeywordHits':
+        """Hits of a text cut into the scanned parts at line starts (no keyword spans a newline)"""
+        counts: Dict[str, int] = {}
+        for hits in hits_list:
+            for keyword, count in hits.counts.items():
+                counts[keyword] = counts.get(keyword, 0) + count
+        return cls(counts, hits_list[0]._categories if hits_list else {})
+
+
+class KeywordScanner:
+    """
+    Compiled Aho-Corasick automaton over lower-cased keywords.
+
+    A keyword only counts as a hit on word boundaries: 'go' does not match in
+    'google' and 'java' does not match in 'javascript'. Keywords starting or
+    ending with a symbol ('c++', '.net') only need a boundary on their word side.
+    """
+
+    def __init__(self):
+        self._categories: Dict[str, Set[str]] = {}
+        self._compiled = False
+
+    def add(self, keyword: str, category: str):
+        keyword = keyword.strip().lower()
+        if keyword:
+            self._categories.setdefault(keyword, set()).add(category)
+            self._compiled = False
+
+    def add_many(self, keywords: Iterable[str], category: str):
+        for keyword in keywords:
+            self.add(keyword, category)
+
+    def __len__(self):
+        return len(self._categories)
+
+    def compile(self):
+        """Build the trie, failure links and merged output lists"""
+        goto: List[Dict[str, int]] = [{}]
+        outputs: List[List[str]] = [[]]
+
+        for keyword in self._categories:
+            state = 0
+            for char in keyword:
+                next_state = goto[state].get(char)
+                if next_state is None:
+                    next_state = len(goto)
+                    goto[state][char] = next_state
+                    goto.append({})
+                    outputs.append([])
+                state = next_state
+            outputs[state].append(keyword)
+
+        # Breadth-first: a state's failure link is the longest proper suffix that is also a trie path
+        fail = [0] * len(goto)
+        queue = deque(goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, next_state in goto[state].items():
+                queue.append(next_state)
+                fallback = fail[state]
+                while fallback and char not in goto[fallback]:
+                    fallback = fail[fallback]
+                fail[next_state] = goto[fallback].get(char, 0)
+                outputs[next_state] = outputs[next_state] + outputs[fail[next_state]]
+
+        self._goto = goto
+        self._fail = fail
+        self._outputs = outputs
+        self._alphabet = frozenset(char for keyword in self._categories for char in keyword)
+        self._compiled = True
+        return self
+
+    def scan(self, text: str, lowered: bool = False) -> KeywordHits:
+        """
+        Find every keyword occurring in the text as a whole word, in one pass
+        lowered=True skips lower-casing a text that already is
+        """
+        if not self._compiled:
+            self.compile()
+
+        if not lowered:
+            text = text.lower()
+        goto, fail, outputs, alphabet = self._goto, self._fail, self._outputs, self._alphabet
+        length = len(text)
+        counts: Dict[str, int] = {}
+        state = 0
+
+        for end, char in enumerate(text):
+            if char not in alphabet:
+                state = 0
+                continue
+
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+
+            for keyword in outputs[state]:
+                start = end - len(keyword) + 1
+                if _is_word_char(keyword[0]) and start > 0 and _is_word_char(text[start - 1]):
+                    continue
+                if _is_word_char(keyword[-1]) and end + 1 < length and _is_word_char(text[end + 1]):
+                    continue
+                counts[keyword] = counts.get(keyword, 0) + 1
+
+        return KeywordHits(counts, self._categories)
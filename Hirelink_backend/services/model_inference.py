@@ -0,0 +1,211 @@
+"""
+Trained resume models for HireLink
+Serves ml_models/trained_models (TF-IDF vectorizer + XGBoost quality model +
+RandomForest ATS model) with batched inference, falling back to the
+rule-based scorer when the model files are missing
+"""
+
+import logging
+import os
+import re
+import warnings
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+from services.batch_analyser import BatchATSAnalyzer
+
+logger = logging.getLogger(__name__)
+
+# Numeric columns appended after the TF-IDF block, in training order
+# (prepare_features in scripts/running_dataset.ipynb)
+NUMERIC_FEATURES = [
+    'word_count', 'char_count', 'sentence_count',
+    'has_email', 'has_phone', 'has_linkedin', 'has_github',
+    'line_count', 'has_summary_section', 'has_experience_section',
+    'has_education_section', 'has_skills_section', 'section_count',
+    'bullet_point_count', 'date_count', 'category_encoded'
+]
+
+SECTION_KEYWORDS = {
+    'has_summary_section': ['summary', 'objective', 'profile'],
+    'has_experience_section': ['experience', 'work', 'employment'],
+    'has_education_section': ['education', 'degree', 'university'],
+    'has_skills_section': ['skills', 'technical', 'competencies'],
+}
+
+# Same replacements as clean_text in the training notebook
+TEXT_REPLACEMENTS = [
+    ('â€¢', '•'),
+    ('â€™', "'"),
+    ('â€"', '"'),
+    ('NaÃ¯ve', 'Naive'),
+]
+
+PHONE_PATTERN = re.compile(r'\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}')
+SENTENCE_PATTERN = re.compile(r'[.!?]+')
+DATE_PATTERNS = [re.compile(r'\d{1,2}/\d{4}'), re.compile(r'\d{4}\s*-\s*\d{4}')]
+BULLET_CHARS = ['•', '*', '-', '·', '▪']
+
+
+def clean_text(text: str) -> str:
+    for old, new in TEXT_REPLACEMENTS:
+        text = text.replace(old, new)
+    return re.sub(r'\s+', ' ', text).strip()
+
+
+def numeric_features(text: str, category_encoded: int = 0) -> List[float]:
+    """NUMERIC_FEATURES of one cleaned resume text"""
+    text_lower = text.lower()
+    sections = {name: int(any(kw in text_lower for kw in keywords)) for name, keywords in SECTION_KEYWORDS.items()}
+    return [
+        len(text.split()),
+        len(text),
+        len(SENTENCE_PATTERN.split(text)),
+        int('@' in text),
+        int(PHONE_PATTERN.search(text) is not None),
+        int('linkedin.com' in text_lower),
+        int('github.com' in text_lower),
+        len(text.split('. ')),
+        sections['has_summary_section'],
+        sections['has_experience_section'],
+        sections['has_education_section'],
+        sections['has_skills_section'],
+        sum(sections.values()),
+        sum(text.count(char) for char in BULLET_CHARS),
+        sum(len(pattern.findall(text)) for pattern in DATE_PATTERNS),
+        category_encoded,
+    ]
+
+
+class ResumeModelEngine:
+    """
+    Loads the trained models once and scores resumes in batches:
+    one vectorizer.transform and one predict per model for the whole batch.
+    """
+
+    MODEL_FILES = {
+        'vectorizer': 'vectorizer.pkl',
+        'quality_model': 'quality_model.pkl',
+        'ats_model': 'ats_model.pkl',
+    }
+
+    def __init__(self, models_dir: str = 'ml_models/trained_models',
+                 label_encoder_path: str = 'ml_models/label_encoder.pkl',
+                 fallback: Optional[BatchATSAnalyzer] = None,
+                 batch_size: int = 256):
+        self.models_dir = models_dir
+        self.label_encoder_path = label_encoder_path
+        self.fallback = fallback or BatchATSAnalyzer()
+        self.batch_size = batch_size
+        self.models_loaded = False
+        self.load_error = None
+        self.categories = {}
+        self.load_models()
+
+    def load_models(self):
+        """Load the pickles; on any failure the engine serves the rule scorer"""
+        paths = {name: os.path.join(self.models_dir, filename) for name, filename in self.MODEL_FILES.items()}
+        missing = [path for path in paths.values() if not os.path.exists(path)]
+        if missing:
+            self.load_error = f"Missing model files: {', '.join(missing)}"
+            logger.warning("%s - using rule-based scoring", self.load_error)
+            return False
+
+        try:
+            import joblib
+            with warnings.catch_warnings():
+                # Pickled with an older scikit-learn; the estimators are unchanged
+                warnings.simplefilter('ignore')
+                self.vectorizer = joblib.load(paths['vectorizer'])
+                self.quality_model = joblib.load(paths['quality_model'])
+                self.ats_model = joblib.load(paths['ats_model'])
+                if os.path.exists(self.label_encoder_path):
+                    label_encoder = joblib.load(self.label_encoder_path)
+                    self.categories = {label: i for i, label in enumerate(label_encoder.classes_)}
+        except Exception as e:
+            self.load_error = f"Failed to load models: {e}"
+            logger.error("%s - using rule-based scoring", self.load_error)
+            return False
+
+        expected = len(self.vectorizer.get_feature_names_out()) + len(NUMERIC_FEATURES)
+        for name in ('quality_model', 'ats_model'):
+            if getattr(self, name).n_features_in_ != expected:
+                self.load_error = f"{name} expects {getattr(self, name).n_features_in_} features, got {expected}"
+                logger.error("%s - using rule-based scoring", self.load_error)
+                return False
+
+        # Single-threaded predict: per-call thread pools cost more than they save on small batches
+        self.ats_model.n_jobs = 1
+        self.quality_model.set_params(n_jobs=1)
+        self.ats_positive = list(self.ats_model.classes_).index(1)
+        self.models_loaded = True
+        self.load_error = None
+        logger.info("Resume models loaded from %s (%s features)", self.models_dir, expected)
+        return True
+
+    @property
+    def scorer(self) -> str:
+        return 'model' if self.models_loaded else 'rules'
+
+    def feature_matrix(self, resume_texts: List[str], categories: Optional[List[str]] = None) -> np.ndarray:
+        """TF-IDF block followed by NUMERIC_FEATURES, one row per resume"""
+        cleaned = [clean_text(text) for text in resume_texts]
+        encoded = [self.categories.get(category, 0) for category in (categories or [None] * len(cleaned))]
+        text_block = self.vectorizer.transform(cleaned).toarray()
+        numeric_block = np.array(
+            [numeric_features(text, code) for text, code in zip(cleaned, encoded)], dtype=np.float64
+        ).reshape(len(cleaned), len(NUMERIC_FEATURES))
+        return np.hstack([text_block, numeric_block])
+
+    def predict(self, resume_texts: List[str], categories: Optional[List[str]] = None) -> List[Dict[str, Any]]:
+        """
+        Quality score (1-5) and ATS compatibility per resume, in input order.
+        categories are optional resume categories (label_encoder classes); unknown ones encode as 0.
+        """
+        if not self.models_loaded:
+            results = self.fallback.analyze(resume_texts)
+            for result in results:
+                result['scorer'] = 'rules'
+            return results
+
+        results: List[Dict[str, Any]] = []
+        valid_rows = []
+        for row, resume_text in enumerate(resume_texts):
+            if not resume_text or len(resume_text.strip()) < 50:
+                results.append({'success': False, 'error': 'Resume text is too short (minimum 50 characters)'})
+            else:
+                results.append(None)
+                valid_rows.append(row)
+
+        for start in range(0, len(valid_rows), self.batch_size):
+            rows = valid_rows[start:start + self.batch_size]
+            matrix = self.feature_matrix(
+                [resume_texts[row] for row in rows],
+                [categories[row] for row in rows] if categories else None
+            )
+            quality = np.clip(self.quality_model.predict(matrix), 1.0, 5.0).tolist()
+            ats_probability = self.ats_model.predict_proba(matrix)[:, self.ats_positive].tolist()
+
+            for row, quality_score, probability in zip(rows, quality, ats_probability):
+                quality_score = round(quality_score, 2)
+                grade, _, color = self.fallback.builder.get_grade_and_feedback(quality_score)
+                results[row] = {
+                    'success': True,
+                    'quality_score': quality_score,
+                    'grade': grade,
+                    'grade_color': color,
+                    'ats_compatible': probability >= 0.5,
+                    'ats_confidence': round(max(probability, 1 - probability), 2),
+                    'scorer': 'model'
+                }
+
+        return results
+
+    def status(self) -> Dict[str, Any]:
+        return {
+            'scorer': self.scorer,
+            'models_dir': self.models_dir,
+            'error': self.load_error,
+            'batch_size': self.batch_size
+        }
@@ -4,29 +4,64 @@ COMPLETE WORKING VERSION - No external model files needed
 """
 
 import os
-import numpy as np
-import pandas as pd
-import re
+import json
+import hashlib
+import logging
+import time
 from datetime import datetime
-from typing import Dict, Any, List, Tuple, Optional
+from typing import Dict, Any, List, Tuple, Optional, Union
 import warnings
 warnings.filterwarnings('ignore')
 
+from services.job_keywords import JobMatcherCache
+from services.keyword_scanner import KeywordScanner, KeywordHits
+from services.resume_document import ResumeDocument, SectionCache
+
+logger = logging.getLogger(__name__)
+
+class ResumeFeatures:
+    """
+    Fixed set of resume features used for scoring (same order as feature_names)
+    """
+    __slots__ = (
+        'word_count', 'has_email', 'has_phone', 'section_count',
+        'bullet_point_count', 'tech_keyword_count', 'action_verb_count',
+        'has_skills_section', 'has_experience_section', 'has_education_section'
+    )
+    
+    def __init__(self, **values):
+        for name in self.__slots__:
+            setattr(self, name, values.get(name, 0))
+    
+    def __getitem__(self, name: str) -> int:
+        return getattr(self, name)
+    
+    def to_dict(self) -> Dict[str, int]:
+        return {name: getattr(self, name) for name in self.__slots__}
+
+
 class ResumeATSBuilder:
     """
     Complete Resume ATS Builder with AI Scoring and Suggestions
     Works WITHOUT external model files
     """
     
-    def __init__(self):
-        print("🚀 Initializing Resume ATS Builder...")
+    # Bump when scoring or feedback rules change: cached analyses of other versions are ignored.
+    # 2.2: keywords only match as whole words ('java' no longer counts inside 'javascript')
+    ANALYZER_VERSION = '2.2'
+    
+    # analyze_resume modes, cheapest first: grade only, the summary block, everything
+    ANALYSIS_MODES = ('score', 'summary', 'full')
+    
+    def __init__(self, section_cache_size: int = 0):
+        """
+        section_cache_size > 0 keeps the facts of that many resume sections, so
+        re-analyzing an edited resume only parses the sections that changed
+        """
+        logger.debug("Initializing Resume ATS Builder")
         
         # Feature names (for consistency)
-        self.feature_names = [
-            'word_count', 'has_email', 'has_phone', 'section_count', 
-            'bullet_point_count', 'tech_keyword_count', 'action_verb_count',
-            'has_skills_section', 'has_experience_section', 'has_education_section'
-        ]
+        self.feature_names = list(ResumeFeatures.__slots__)
         
         # Skills database for analysis
         self.common_skills = {
@@ -59,89 +94,165 @@ class ResumeATSBuilder:
             'debugged', 'deployed', 'maintained', 'upgraded', 'migrated'
         ]
         
-        print("✅ Resume ATS Builder Ready!")
+        # Section headings, by feature
+        self.section_keywords = {
+            'has_summary_section': ['summary', 'objective', 'profile', 'professional summary'],
+            'has_experience_section': ['experience', 'work', 'employment', 'professional experience'],
+            'has_education_section': ['education', 'academic', 'degree', 'qualifications'],
+            'has_skills_section': ['skills', 'technical skills', 'competencies', 'expertise'],
+            'has_projects_section': ['projects', 'portfolio', 'personal projects'],
+            'has_certifications_section': ['certifications', 'certificates', 'licenses']
+        }
+        
+        # Profile links looked for in the contact details
+        self.contact_keywords = ['linkedin', 'github']
+        
+        # Bullet point characters, and every character the analysis counts
+        self.bullet_chars = ['•', '*', '-', '·', '▪', '→', '○']
+        self.counted_chars = self.bullet_chars + ['|', '@']
+        
+        # One automaton for every keyword list, shared by all analysis stages
+        self.tech_keywords = [skill for category_skills in self.common_skills.values() for skill in category_skills]
+        self.keyword_scanner = KeywordScanner()
+        self.keyword_scanner.add_many(self.tech_keywords, 'skill')
+        self.keyword_scanner.add_many(self.action_verbs, 'verb')
+        for feature_name, keywords in self.section_keywords.items():
+            self.keyword_scanner.add_many(keywords, feature_name)
+        self.keyword_scanner.add_many(self.contact_keywords, 'contact')
+        self.keyword_scanner.compile()
+        self.section_headings = frozenset(
+            keyword for keywords in self.section_keywords.values() for keyword in keywords
+        )
+        
+        # Compiled keyword matchers of the jobs resumes are scored against
+        self.job_matchers = JobMatcherCache(self.keyword_scanner)
+        
+        # Facts of recently analyzed resume sections, by content hash
+        self.section_cache = SectionCache(section_cache_size) if section_cache_size > 0 else None
+        
+        self.analyzer_version = self._get_analyzer_version()
+        
+        logger.info("Resume ATS Builder ready (analyzer %s)", self.analyzer_version)
+    
+    def _get_analyzer_version(self) -> str:
+        """ANALYZER_VERSION plus a fingerprint of the keyword lists, so editing them also invalidates caches"""
+        rules = json.dumps([
+            self.feature_names, self.common_skills, self.action_verbs,
+            self.section_keywords, self.contact_keywords, self.ats_unfriendly, self.bullet_chars
+        ], sort_keys=True)
+        return f"{self.ANALYZER_VERSION}-{hashlib.sha256(rules.encode('utf-8')).hexdigest()[:8]}"
     
-    def extract_features(self, resume_text: str) -> pd.DataFrame:
+    def cache_version(self, mode: str = 'full') -> str:
+        """Cache key version of analyze_resume results in this mode"""
+        return self.analyzer_version if mode == 'full' else f"{self.analyzer_version}/{mode}"
+    
+    def scan_keywords(self, resume_text: str) -> KeywordHits:
+        """
+        Find skills, action verbs, section headings and profile links in one pass
         """
-        Extract features from resume text for analysis
+        return self.keyword_scanner.scan(resume_text)
+    
+    def parse_resume(self, resume_text: str, hits: Optional[KeywordHits] = None) -> ResumeDocument:
         """
-        text_lower = resume_text.lower()
-        words = resume_text.split()
+        Parse the resume once for every analysis stage (keywords are scanned here)
+        """
+        document = ResumeDocument(resume_text, self.section_headings, hits)
+        if document.hits is None:
+            document.hits = self.keyword_scanner.scan(document.lower, lowered=True)
+        return document
+    
+    def parse_resume_sections(self, resume_text: str) -> ResumeDocument:
+        """
+        parse_resume through the section cache: only sections not seen before are
+        parsed, the others reuse their cached facts (same document either way)
+        """
+        if self.section_cache is None:
+            return self.parse_resume(resume_text)
+        
+        document = ResumeDocument(resume_text, self.section_headings)
+        section_facts = []
+        for section in document.sections:
+            section_text = document.section_text(section)
+            digest = hashlib.sha256(section_text.encode('utf-8')).hexdigest()
+            facts = self.section_cache.get(digest)
+            if facts is None:
+                facts = self.parse_resume(section_text).facts(self.counted_chars, self.ats_unfriendly)
+                self.section_cache.set(digest, facts)
+            section_facts.append(facts)
+        return document.use_section_facts(section_facts)
+    
+    def _document(self, resume: Union[str, ResumeDocument], hits: Optional[KeywordHits] = None) -> ResumeDocument:
+        return resume if isinstance(resume, ResumeDocument) else self.parse_resume(resume, hits)
+    
+    def match_job(self, resume_text: Union[str, ResumeDocument], job) -> Dict[str, Any]:
+        """
+        Coverage of a job's required/preferred skills and description skills
+        """
+        matcher = self.job_matchers.get(job)
+        if isinstance(resume_text, ResumeDocument):
+            return matcher.match(resume_text.lower, lowered=True)
+        return matcher.match(resume_text)
+    
+    def add_job_match(self, results: Dict[str, Any], resume_text: Union[str, ResumeDocument], job) -> Dict[str, Any]:
+        """
+        Add the job match (and a suggestion for missing required skills) to analyze_resume results
+        """
+        job_match = self.match_job(resume_text, job)
+        results['analysis']['job_match'] = job_match
+        
+        missing = job_match['required']['missing']
+        if missing and 'improvement_suggestions' in results['analysis']:
+            results['analysis']['improvement_suggestions'].insert(0, {
+                'priority': 'high',
+                'title': 'Cover the Required Skills',
+                'description': f"The job asks for {len(missing)} skill(s) your resume does not mention",
+                'action': f"Add, if you have them: {', '.join(missing[:8])}"
+            })
+        return results
+    
+    def extract_features(self, resume_text: Union[str, ResumeDocument],
+                         hits: Optional[KeywordHits] = None) -> ResumeFeatures:
+        """
+        Extract features from resume text (or a parsed ResumeDocument) for analysis
+        """
+        document = self._document(resume_text, hits)
+        hits = document.hits
         
         features = {}
         
         # 1. Basic statistics
-        features['word_count'] = len(words)
-        features['char_count'] = len(resume_text)
+        features['word_count'] = document.word_count
         
         # 2. Contact information
-        features['has_email'] = 1 if re.search(r'[\w\.-]+@[\w\.-]+\.\w+', resume_text) else 0
-        features['has_phone'] = 1 if re.search(r'\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}', resume_text) else 0
+        features['has_email'] = 1 if document.emails else 0
+        features['has_phone'] = 1 if document.phones else 0
         
         # 3. Section detection
-        sections = {
-            'has_summary_section': ['summary', 'objective', 'profile', 'professional summary'],
-            'has_experience_section': ['experience', 'work', 'employment', 'professional experience'],
-            'has_education_section': ['education', 'academic', 'degree', 'qualifications'],
-            'has_skills_section': ['skills', 'technical skills', 'competencies', 'expertise'],
-            'has_projects_section': ['projects', 'portfolio', 'personal projects'],
-            'has_certifications_section': ['certifications', 'certificates', 'licenses']
-        }
-        
-        for feature_name, keywords in sections.items():
-            features[feature_name] = 1 if any(keyword in text_lower for keyword in keywords) else 0
+        for feature_name, keywords in self.section_keywords.items():
+            features[feature_name] = 1 if hits.any_of(keywords) else 0
         
         # 4. Section count
         section_features = ['has_experience_section', 'has_education_section', 'has_skills_section']
         features['section_count'] = sum(features.get(f, 0) for f in section_features)
         
         # 5. Bullet points
-        bullet_chars = ['•', '*', '-', '·', '▪', '→', '○']
-        features['bullet_point_count'] = sum(resume_text.count(char) for char in bullet_chars)
+        features['bullet_point_count'] = sum(document.count(char) for char in self.bullet_chars)
         
         # 6. Tech keywords count
-        all_tech_keywords = []
-        for category_skills in self.common_skills.values():
-            all_tech_keywords.extend(category_skills)
-        features['tech_keyword_count'] = sum(1 for kw in all_tech_keywords if kw in text_lower)
+        features['tech_keyword_count'] = sum(1 for kw in self.tech_keywords if kw in hits)
         
         # 7. Action verbs count
-        features['action_verb_count'] = sum(1 for verb in self.action_verbs if verb in text_lower)
+        features['action_verb_count'] = sum(1 for verb in self.action_verbs if verb in hits)
         
-        # 8. Readability metrics
-        sentences = re.split(r'[.!?]+', resume_text)
-        sentences = [s.strip() for s in sentences if s.strip()]
-        features['sentence_count'] = len(sentences)
-        
-        if sentences:
-            sentence_lengths = [len(s.split()) for s in sentences]
-            features['avg_sentence_length'] = np.mean(sentence_lengths)
-            features['sentence_complexity'] = np.std(sentence_lengths)
-        else:
-            features['avg_sentence_length'] = len(words)
-            features['sentence_complexity'] = 0
-        
-        # 9. Formatting metrics
-        lines = resume_text.split('\n')
-        features['line_count'] = len(lines)
-        features['avg_line_length'] = np.mean([len(line) for line in lines]) if lines else 0
-        
-        # Create DataFrame with all features
-        df = pd.DataFrame([features])
-        
-        # Ensure all required features exist
-        for feature in self.feature_names:
-            if feature not in df.columns:
-                df[feature] = 0
-        
-        return df[self.feature_names]
+        # Only the scoring features are kept (missing ones default to 0)
+        return ResumeFeatures(**features)
     
-    def calculate_quality_score(self, features: pd.DataFrame) -> float:
+    def calculate_quality_score(self, features: ResumeFeatures) -> float:
         """
         Calculate quality score (1-5) based on features
         Based on real ATS best practices
         """
-        x = features.iloc[0]
+        x = features
         score = 3.0  # Start with average score
         
         # 1. Length score (300-500 words is ideal)
@@ -210,26 +321,27 @@ class ResumeATSBuilder:
         
         return round(score, 2)
     
-    def check_ats_compatibility(self, resume_text: str) -> Tuple[bool, float]:
+    def check_ats_compatibility(self, resume_text: Union[str, ResumeDocument],
+                                hits: Optional[KeywordHits] = None) -> Tuple[bool, float]:
         """
         Check if resume is ATS-compatible
         Returns: (is_compatible, confidence)
         """
+        document = self._document(resume_text, hits)
         issues = []
-        text_lower = resume_text.lower()
         
         # Check for ATS-unfriendly patterns
         for pattern in self.ats_unfriendly[:4]:  # Check first 4 patterns
-            if re.search(pattern, resume_text):
+            if document.search(pattern):
                 issues.append(f"Contains special formatting: {pattern}")
         
         # Check for tables
-        if resume_text.count('|') > 10:
+        if document.count('|') > 10:
             issues.append("Contains table structures")
         
         # Check for headers/titles
-        has_name = any(word.istitle() for word in resume_text.split()[:10])
-        has_sections = any(section in text_lower for section in ['experience', 'education', 'skills'])
+        has_name = any(word.istitle() for word in document.leading_words)
+        has_sections = document.hits.any_of(['experience', 'education', 'skills'])
         
         # Calculate compatibility
         if len(issues) == 0 and has_name and has_sections:
@@ -260,12 +372,14 @@ class ResumeATSBuilder:
         else:
             return "D", "Very poor. Start over with a professional template.", "red"
     
-    def generate_detailed_analysis(self, resume_text: str, features: pd.DataFrame) -> Dict[str, Any]:
+    def generate_detailed_analysis(self, resume_text: Union[str, ResumeDocument], features: ResumeFeatures,
+                                   hits: Optional[KeywordHits] = None) -> Dict[str, Any]:
         """
         Generate detailed analysis of the resume
         """
-        x = features.iloc[0]
-        text_lower = resume_text.lower()
+        x = features
+        document = self._document(resume_text, hits)
+        hits = document.hits
         
         analysis = {
             'strengths': [],
@@ -316,16 +430,16 @@ class ResumeATSBuilder:
         # Check for missing sections
         required_sections = ['experience', 'education', 'skills']
         for section in required_sections:
-            if section not in text_lower:
+            if section not in hits:
                 analysis['missing_sections'].append(section.title())
         
         # Check ATS issues
         for pattern in self.ats_unfriendly:
-            if re.search(pattern, resume_text):
+            if document.search(pattern):
                 analysis['ats_issues'].append("⚠️  Contains non-standard formatting")
                 break
         
-        if resume_text.count('|') > 10:
+        if document.count('|') > 10:
             analysis['ats_issues'].append("⚠️  Contains tables (not ATS-friendly)")
         
         # Add statistics
@@ -416,36 +530,42 @@ class ResumeATSBuilder:
         
         return suggestions
     
-    def get_quick_wins(self, resume_text: str) -> List[str]:
+    def get_quick_wins(self, resume_text: Union[str, ResumeDocument], hits: Optional[KeywordHits] = None) -> List[str]:
         """
         Get quick improvements that can be done in minutes
         """
+        document = self._document(resume_text, hits)
+        hits = document.hits
         quick_wins = []
-        text_lower = resume_text.lower()
         
-        if '@' not in resume_text:
+        if document.count('@') == 0:
             quick_wins.append("📧 Add your email address")
         
-        if not re.search(r'\d{3}[-.\s]?\d{3}[-.\s]?\d{4}', resume_text):
+        if not document.has_plain_phone:
             quick_wins.append("📱 Add your phone number")
         
-        if 'linkedin' not in text_lower:
+        if 'linkedin' not in hits:
             quick_wins.append("🔗 Add your LinkedIn profile URL")
         
-        if 'summary' not in text_lower and 'objective' not in text_lower:
+        if not hits.any_of(['summary', 'objective']):
             quick_wins.append("📝 Add a 2-3 line professional summary")
         
-        if resume_text.count('•') + resume_text.count('-') + resume_text.count('*') < 3:
+        if document.count('•') + document.count('-') + document.count('*') < 3:
             quick_wins.append("• Convert paragraphs to bullet points")
         
         return quick_wins
     
-    def analyze_resume(self, resume_text: str) -> Dict[str, Any]:
+    def analyze_resume(self, resume_text: str, job=None, mode: str = 'full') -> Dict[str, Any]:
         """
         Complete resume analysis pipeline
+        mode='score' stops at the grade, 'summary' adds the ATS check and feedback,
+        'full' (default) adds the detailed analysis, suggestions, quick wins and actions
+        With a job, keyword coverage is also scored against that job (analysis.job_match)
         """
-        print("🔍 Starting resume analysis...")
+        if mode not in self.ANALYSIS_MODES:
+            raise ValueError(f"Unknown analysis mode {mode!r} (expected one of {', '.join(self.ANALYSIS_MODES)})")
         
+        start_time = time.perf_counter()
         try:
             # Validate input
             if not resume_text or len(resume_text.strip()) < 50:
@@ -454,65 +574,76 @@ class ResumeATSBuilder:
                     'error': 'Resume text is too short (minimum 50 characters)'
                 }
             
-            # Step 1: Extract features
-            features = self.extract_features(resume_text)
-            print(f"✅ Extracted {len(features.columns)} features")
+            # Step 1: Parse the resume once (keywords, tokens, contact details), then extract features
+            document = self.parse_resume_sections(resume_text)
+            features = self.extract_features(document)
             
-            # Step 2: Calculate quality score
+            # Step 2: Calculate quality score, grade and feedback
             quality_score = self.calculate_quality_score(features)
-            print(f"✅ Calculated quality score: {quality_score}/5.0")
-            
-            # Step 3: Check ATS compatibility
-            ats_compatible, ats_confidence = self.check_ats_compatibility(resume_text)
-            print(f"✅ ATS compatibility: {ats_compatible} (confidence: {ats_confidence:.2f})")
-            
-            # Step 4: Get grade and feedback
             grade, feedback, color = self.get_grade_and_feedback(quality_score)
+            summary = {
+                'quality_score': quality_score,
+                'grade': grade,
+                'grade_color': color
+            }
+            analysis = {'summary': summary}
             
-            # Step 5: Generate detailed analysis
-            detailed_analysis = self.generate_detailed_analysis(resume_text, features)
-            
-            # Step 6: Generate improvement suggestions
-            suggestions = self.generate_improvement_suggestions(detailed_analysis, quality_score)
-            
-            # Step 7: Get quick wins
-            quick_wins = self.get_quick_wins(resume_text)
+            if mode != 'score':
+                # Step 3: Check ATS compatibility
+                ats_compatible, ats_confidence = self.check_ats_compatibility(document)
+                logger.debug("Resume scored: quality %s/5.0, ATS compatible %s (confidence %.2f)",
+                             quality_score, ats_compatible, ats_confidence)
+                summary.update({
+                    'ats_compatible': ats_compatible,
+                    'ats_confidence': round(ats_confidence, 2),
+                    'overall_feedback': feedback,
+                    'score_explanation': self._get_score_explanation(quality_score)
+                })
             
-            # Step 8: Prepare final results
-            results = {
-                'success': True,
-                'analysis': {
-                    'summary': {
-                        'quality_score': quality_score,
-                        'grade': grade,
-                        'grade_color': color,
-                        'ats_compatible': ats_compatible,
-                        'ats_confidence': round(ats_confidence, 2),
-                        'overall_feedback': feedback,
-                        'score_explanation': self._get_score_explanation(quality_score)
-                    },
+            if mode == 'full':
+                # Step 4: Generate detailed analysis
+                detailed_analysis = self.generate_detailed_analysis(document, features)
+                
+                # Step 5: Generate improvement suggestions
+                suggestions = self.generate_improvement_suggestions(detailed_analysis, quality_score)
+                
+                # Step 6: Get quick wins
+                quick_wins = self.get_quick_wins(document)
+                
+                analysis.update({
                     'detailed_analysis': detailed_analysis,
                     'improvement_suggestions': suggestions,
                     'quick_wins': quick_wins,
                     'recommended_actions': self._get_recommended_actions(quality_score, ats_compatible)
-                },
+                })
+            
+            if job is not None:
+                self.add_job_match({'analysis': analysis}, document, job)
+            
+            # Step 7: Prepare final results
+            analysis_time_ms = (time.perf_counter() - start_time) * 1000
+            results = {
+                'success': True,
+                'analysis': analysis,
                 'metadata': {
                     'analysis_timestamp': datetime.now().isoformat(),
-                    'model_version': '2.0',
-                    'analysis_time_ms': 100  # Simulated
+                    'model_version': self.analyzer_version,
+                    'mode': mode,
+                    'analysis_time_ms': round(analysis_time_ms, 2)
                 }
             }
             
-            print(f"✅ Analysis complete! Score: {quality_score}/5.0 ({grade})")
-            print(f"   Strengths: {len(detailed_analysis['strengths'])}")
-            print(f"   Suggestions: {len(suggestions)}")
+            logger.info("Resume analysis complete", extra={
+                'mode': mode,
+                'quality_score': quality_score,
+                'grade': grade,
+                'analysis_time_ms': round(analysis_time_ms, 2)
+            })
             
             return results
             
         except Exception as e:
-            print(f"❌ Error in resume analysis: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.exception("Error in resume analysis: %s", e)
             
             return {
                 'success': False,
@@ -0,0 +1,228 @@
+"""
+Parsed resume document for the Resume ATS Builder
+The text is lower-cased, tokenized, split into lines, sentences and sections
+and searched for contact details at most once; every analysis stage reads
+the same document instead of re-scanning the raw text.
+
+Sections start at a line start, right after a newline, and nothing the
+analysis looks for (tokens, keywords, contact details, formatting patterns)
+can span a newline. So the facts of a whole resume are exactly the combined
+facts of its sections, and a document can be assembled from cached per-section
+facts (ResumeDocument.use_section_facts) without re-reading unchanged sections.
+"""
+
+import re
+import threading
+from collections import OrderedDict
+from functools import cached_property
+from typing import Dict, FrozenSet, Iterable, List, NamedTuple, Optional
+
+from services.keyword_scanner import KeywordHits
+
+EMAIL_PATTERN = re.compile(r'[\w\.-]+@[\w\.-]+\.\w+')
+PHONE_PATTERN = re.compile(r'\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}')
+# Stricter form the quick wins look for (no parentheses around the area code)
+PLAIN_PHONE_PATTERN = re.compile(r'\d{3}[-.\s]?\d{3}[-.\s]?\d{4}')
+
+_TOKEN = re.compile(r'\S+')
+_LINE = re.compile(r'[^\n]+')
+_SENTENCE = re.compile(r'[^.!?\n]*[^.!?\s][^.!?\n]*[.!?]*')
+# Characters around a heading word: "SKILLS:", "• Experience -", "== Education =="
+_HEADING_TRIM = ' \t\r:-–—•*·▪→○=#|'
+_HEADING_MAX_WORDS = 4
+# Words at the top of the resume where the name is looked for
+LEADING_WORDS = 10
+
+
+class Span(NamedTuple):
+    start: int
+    end: int
+
+
+class Section(NamedTuple):
+    """Text from one heading to the next; heading is None for the part before the first one"""
+    heading: Optional[str]
+    start: int
+    end: int
+
+
+class SectionFacts(NamedTuple):
+    """What the analysis stages read from one section, enough to rebuild a whole document's facts"""
+    word_count: int
+    leading_words: List[str]
+    emails: List[str]
+    phones: List[str]
+    has_plain_phone: bool
+    char_counts: Dict[str, int]
+    searches: Dict[str, bool]
+    hits: KeywordHits
+
+
+class ResumeDocument:
+    """
+    One resume, parsed lazily: each view of the text (tokens, lines, contact
+    matches, character counts, regex searches) is computed on first use and
+    then shared. hits holds the keyword scan of `lower`, set by the builder.
+    """
+
+    def __init__(self, text: str, section_headings: Iterable[str] = (), hits: Optional[KeywordHits] = None):
+        self.text = text
+        self.section_headings: FrozenSet[str] = frozenset(section_headings)
+        self.hits = hits
+        self._char_counts: Dict[str, int] = {}
+        self._searches: Dict[str, bool] = {}
+
+    @cached_property
+    def lower(self) -> str:
+        return self.text.lower()
+
+    @cached_property
+    def words(self) -> List[str]:
+        """Whitespace-separated tokens (str.split())"""
+        return self.text.split()
+
+    @cached_property
+    def word_count(self) -> int:
+        return len(self.words)
+
+    @cached_property
+    def leading_words(self) -> List[str]:
+        return self.words[:LEADING_WORDS]
+
+    @cached_property
+    def token_spans(self) -> List[Span]:
+        """(start, end) offsets of each token in words"""
+        return [Span(*match.span()) for match in _TOKEN.finditer(self.text)]
+
+    @cached_property
+    def line_spans(self) -> List[Span]:
+        """Non-empty lines"""
+        return [Span(*match.span()) for match in _LINE.finditer(self.text) if not match.group().isspace()]
+
+    @cached_property
+    def lines(self) -> List[str]:
+        return [self.text[start:end] for start, end in self.line_spans]
+
+    @cached_property
+    def sentence_spans(self) -> List[Span]:
+        """Runs of text ended by . ! ? or a line break"""
+        return [Span(*match.span()) for match in _SENTENCE.finditer(self.text)]
+
+    @cached_property
+    def sections(self) -> List[Section]:
+        """
+        The text cut at heading lines: short lines that are just a section
+        keyword (case and surrounding punctuation ignored)
+        """
+        sections = []
+        heading, start = None, 0
+        for line_start, line_end in self.line_spans:
+            line = self.lower[line_start:line_end].strip(_HEADING_TRIM)
+            if line in self.section_headings and len(line.split()) <= _HEADING_MAX_WORDS:
+                if line_start > start or heading is not None:
+                    sections.append(Section(heading, start, line_start))
+                heading, start = line, line_start
+        sections.append(Section(heading, start, len(self.text)))
+        return sections
+
+    def section_text(self, section: Section) -> str:
+        return self.text[section.start:section.end]
+
+    @cached_property
+    def emails(self) -> List[str]:
+        return EMAIL_PATTERN.findall(self.text)
+
+    @cached_property
+    def phones(self) -> List[str]:
+        return PHONE_PATTERN.findall(self.text)
+
+    @cached_property
+    def has_plain_phone(self) -> bool:
+        # Every plain phone number is also a PHONE_PATTERN match, so no phones means none
+        return bool(self.phones) and PLAIN_PHONE_PATTERN.search(self.text) is not None
+
+    def count(self, char: str) -> int:
+        """Occurrences of a character (bullets, table pipes), counted once per document"""
+        counted = self._char_counts.get(char)
+        if counted is None:
+            counted = self._char_counts[char] = self.text.count(char)
+        return counted
+
+    def search(self, pattern: str) -> bool:
+        """Whether the (raw-text) pattern occurs; each pattern is searched once per document"""
+        found = self._searches.get(pattern)
+        if found is None:
+            found = self._searches[pattern] = re.search(pattern, self.text) is not None
+        return found
+
+    def facts(self, chars: Iterable[str], patterns: Iterable[str]) -> SectionFacts:
+        """This document's facts, for the characters and patterns the analysis uses"""
+        return SectionFacts(
+            word_count=self.word_count,
+            leading_words=self.leading_words,
+            emails=self.emails,
+            phones=self.phones,
+            has_plain_phone=self.has_plain_phone,
+            char_counts={char: self.count(char) for char in chars},
+            searches={pattern: self.search(pattern) for pattern in patterns},
+            hits=self.hits
+        )
+
+    def use_section_facts(self, sections: List[SectionFacts]) -> 'ResumeDocument':
+        """
+        Fill this document's views from the facts of its sections (in order)
+        instead of reading the text; views the facts do not cover are still
+        computed from the text on first use
+        """
+        leading_words = []
+        for section in sections:
+            if len(leading_words) >= LEADING_WORDS:
+                break
+            leading_words.extend(section.leading_words[:LEADING_WORDS - len(leading_words)])
+
+        self.hits = KeywordHits.merge([section.hits for section in sections])
+        # Pre-filled cached_property values
+        self.__dict__.update(
+            word_count=sum(section.word_count for section in sections),
+            leading_words=leading_words,
+            emails=[email for section in sections for email in section.emails],
+            phones=[phone for section in sections for phone in section.phones],
+            has_plain_phone=any(section.has_plain_phone for section in sections)
+        )
+        for section in sections:
+            for char, counted in section.char_counts.items():
+                self._char_counts[char] = self._char_counts.get(char, 0) + counted
+            for pattern, found in section.searches.items():
+                self._searches[pattern] = self._searches.get(pattern, False) or found
+        return self
+
+
+class SectionCache:
+    """Per-process LRU of SectionFacts by section digest, with hit/miss counters"""
+
+    def __init__(self, max_entries: int = 2048):
+        self.max_entries = max_entries
+        self._entries: 'OrderedDict[str, SectionFacts]' = OrderedDict()
+        self._lock = threading.Lock()
+        self.stats = {'hits': 0, 'misses': 0}
+
+    def get(self, digest: str) -> Optional[SectionFacts]:
+        with self._lock:
+            facts = self._entries.get(digest)
+            if facts is None:
+                self.stats['misses'] += 1
+                return None
+            self._entries.move_to_end(digest)
+            self.stats['hits'] += 1
+            return facts
+
+    def set(self, digest: str, facts: SectionFacts):
+        with self._lock:
+            self._entries[digest] = facts
+            self._entries.move_to_end(digest)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def summary(self) -> Dict[str, int]:
+        with self._lock:
+            return {**self.stats, 'entries': len(self._entries), 'max_entries': self.max_entries}
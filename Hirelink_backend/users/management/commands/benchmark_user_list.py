@@ -0,0 +1,114 @@
+# users/management/commands/benchmark_user_list.py
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from rest_framework.test import APIRequestFactory, force_authenticate
+from users.models import CustomUser
+from users.views.admin_views import list_recruiters
+from Hirelink_backend.log_config import SamplingFilter, StructuredFormatter
+import logging
+import os
+import time
+
+
+class Command(BaseCommand):
+    help = 'Benchmark the recruiter list endpoint with request-path logging off, sampled and full'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--users', type=int, default=200, help='Recruiters in the list')
+        parser.add_argument('--requests', type=int, default=30, help='Requests per mode')
+        parser.add_argument('--log-file', default=os.devnull, help='Where the log records are written')
+
+    def handle(self, *args, **options):
+        # Everything created here is rolled back at the end
+        with transaction.atomic():
+            admin = self._create_users(options['users'])
+            listed = CustomUser.objects.filter(role='recruiter').count()
+            factory = APIRequestFactory()
+
+            def call():
+                request = factory.get('/api/users/recruiters/')
+                force_authenticate(request, user=admin)
+                response = list_recruiters(request)
+                assert response.status_code == 200 and len(response.data) == listed
+
+            self.stdout.write(
+                f"\n📊 GET recruiters/ listing {listed} users, "
+                f"{options['requests']} requests per mode, logs to {options['log_file']}"
+            )
+            self.stdout.write(f"   {'mode':<10} {'req/s':>8} {'latency':>10} {'records':>8}")
+            baseline = None
+            for mode in ['off', 'sampled', 'full']:
+                with _BenchmarkLogging(mode, options['log_file']) as counter:
+                    throughput, latency = self._measure(call, options['requests'])
+                baseline = baseline or throughput
+                self.stdout.write(
+                    f"   {mode:<10} {throughput:>8.1f} {latency * 1000:>8.2f}ms {counter.count:>8} "
+                    f"({throughput / baseline * 100:.0f}% of off)"
+                )
+
+            transaction.set_rollback(True)
+
+    def _create_users(self, count):
+        admin = CustomUser.objects.create_user(
+            username='benchmark_admin', email='benchmark_admin@example.com', password='benchmark',
+            role='admin', is_staff=True
+        )
+        CustomUser.objects.bulk_create([
+            CustomUser(
+                username=f'benchmark_recruiter_{i}', email=f'benchmark_recruiter_{i}@example.com',
+                role='recruiter', skills='python, django, sql',
+                resume=f'resumes/benchmark_{i}.pdf' if i % 2 else None
+            )
+            for i in range(count)
+        ])
+        return admin
+
+    def _measure(self, func, requests):
+        func()  # warm up
+        start = time.perf_counter()
+        for _ in range(requests):
+            func()
+        elapsed = time.perf_counter() - start
+        return requests / elapsed, elapsed / requests
+
+
+class _RecordCounter(logging.Filter):
+    def __init__(self):
+        super().__init__()
+        self.count = 0
+
+    def filter(self, record):
+        self.count += 1
+        return True
+
+
+class _BenchmarkLogging:
+    """Temporarily routes the 'users' logger to one handler: off (WARNING), sampled or full DEBUG"""
+
+    def __init__(self, mode, log_file):
+        self.mode = mode
+        self.log_file = log_file
+        self.logger = logging.getLogger('users')
+
+    def __enter__(self):
+        self.saved = (self.logger.level, self.logger.propagate, list(self.logger.handlers))
+        self.stream = open(self.log_file, 'w', encoding='utf-8')
+        handler = logging.StreamHandler(self.stream)
+        handler.setFormatter(StructuredFormatter())
+        if self.mode == 'sampled':
+            handler.addFilter(SamplingFilter(getattr(settings, 'LOG_SAMPLING_RATES', {})))
+        counter = _RecordCounter()
+        handler.addFilter(counter)
+
+        self.logger.handlers = [handler]
+        self.logger.propagate = False
+        self.logger.setLevel(logging.WARNING if self.mode == 'off' else logging.DEBUG)
+        return counter
+
+    def __exit__(self, *exc_info):
+        level, self.logger.propagate, self.logger.handlers = self.saved
+        self.logger.setLevel(level)
+        self.stream.close()
+        return False
@@ -1,8 +1,12 @@
 # Hirelink_backend/users/serializers/user_serializer.py
+import logging
+
 from rest_framework import serializers
 from users.models import CustomUser
 from users.serializers.entreprise_serializer import EntrepriseSerializer
 
+logger = logging.getLogger(__name__)
+
 # UPDATE THIS SERIALIZER:
 # users/serializers.py - Fix the Meta class fields
 class UserSerializer(serializers.ModelSerializer):
@@ -22,31 +26,17 @@ class UserSerializer(serializers.ModelSerializer):
         )
         read_only_fields = ('id', 'username', 'email', 'role')
     
-    # users/serializers.py - Update get_resume_url method
     def get_resume_url(self, obj):
-     print(f"DEBUG get_resume_url called for user: {obj.username}")
-     print(f"DEBUG obj.resume: {obj.resume}")
-     print(f"DEBUG obj.resume.name: {obj.resume.name if obj.resume else 'No resume'}")
-    
-     if obj.resume and hasattr(obj.resume, 'url'):
-        try:
-            print(f"DEBUG resume exists, getting URL...")
-            request = self.context.get('request')
-            if request:
-                url = request.build_absolute_uri(obj.resume.url)
-                print(f"DEBUG Absolute URL: {url}")
-                return url
-            else:
-                url = obj.resume.url
-                print(f"DEBUG Relative URL: {url}")
-                return url
-        except Exception as e:
-            print(f"DEBUG Error getting resume URL: {str(e)}")
-            import traceback
-            traceback.print_exc()
-            return None
-     else:
-        print(f"DEBUG No resume or no url attribute")
+        if obj.resume and hasattr(obj.resume, 'url'):
+            try:
+                request = self.context.get('request')
+                if request:
+                    return request.build_absolute_uri(obj.resume.url)
+                return obj.resume.url
+            except Exception as e:
+                logger.warning("Error getting resume URL for user %s: %s", obj.username, e, exc_info=True)
+                return None
+        logger.debug("No resume for user %s", obj.username)
         return None
     
     def get_profile_picture_url(self, obj):
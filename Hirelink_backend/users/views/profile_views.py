@@ -1,4 +1,6 @@
 # users/views/profile_views.py - ADD THIS TO YOUR EXISTING FILE
+import logging
+
 from rest_framework import generics, permissions, status
 from rest_framework.views import APIView
 from rest_framework.response import Response
@@ -6,6 +8,8 @@ from rest_framework.parsers import MultiPartParser, FormParser
 from users.models import CustomUser
 from users.serializers import UserSerializer
 
+logger = logging.getLogger(__name__)
+
 # users/views/profile_views.py - Update UserDetailView
 class UserDetailView(generics.RetrieveUpdateAPIView):
     serializer_class = UserSerializer
@@ -18,11 +22,9 @@ class UserDetailView(generics.RetrieveUpdateAPIView):
         instance = self.get_object()
         serializer = self.get_serializer(instance)
         
-        # Debug: Print what's being returned
-        print(f"DEBUG - User: {instance.username}")
-        print(f"DEBUG - Resume field: {instance.resume}")
-        print(f"DEBUG - Resume URL: {instance.resume.url if instance.resume else 'No resume'}")
-        print(f"DEBUG - Serialized data: {serializer.data}")
+        # The full payload is only dumped at DEBUG level
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Profile for %s (resume: %s): %s", instance.username, instance.resume or 'none', serializer.data)
         
         return Response(serializer.data)
 